@@ -0,0 +1,95 @@
+"""add_composite_posts_indexes
+
+Composite and partial indexes matched to the posts list/calendar/count
+queries in PostsService, the idea bank list and the unified post scheduler.
+
+Revision ID: k1f2g3h4i5j6
+Revises: b35433ad74cb, j0e1f2g3h4i5
+Create Date: 2025-08-04 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "k1f2g3h4i5j6"
+down_revision: Union[str, None] = ("b35433ad74cb", "j0e1f2g3h4i5")
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_post_indexes = [idx["name"] for idx in inspector.get_indexes("posts")]
+    existing_idea_bank_indexes = [
+        idx["name"] for idx in inspector.get_indexes("idea_banks")
+    ]
+
+    # Posts list without a status filter: ORDER BY created_at DESC, id DESC
+    if "idx_posts_user_created_at" not in existing_post_indexes:
+        op.create_index(
+            "idx_posts_user_created_at",
+            "posts",
+            ["user_id", "created_at", "id"],
+            postgresql_ops={"created_at": "DESC", "id": "DESC"},
+        )
+
+    # Posts list / counts by (user_id, status), newest first
+    if "idx_posts_user_status_created_at" not in existing_post_indexes:
+        op.create_index(
+            "idx_posts_user_status_created_at",
+            "posts",
+            ["user_id", "status", "created_at", "id"],
+            postgresql_ops={"created_at": "DESC", "id": "DESC"},
+        )
+
+    # Calendar ranges and cursor pages on scheduled_at (NULLs last)
+    if "idx_posts_user_status_scheduled_at" not in existing_post_indexes:
+        op.create_index(
+            "idx_posts_user_status_scheduled_at",
+            "posts",
+            ["user_id", "status", "scheduled_at", "id"],
+            postgresql_ops={"scheduled_at": "DESC NULLS LAST", "id": "DESC"},
+        )
+
+    # Calendar ranges on posted_at for posted posts (NULLs last)
+    if "idx_posts_user_status_posted_at" not in existing_post_indexes:
+        op.create_index(
+            "idx_posts_user_status_posted_at",
+            "posts",
+            ["user_id", "status", "posted_at", "id"],
+            postgresql_ops={"posted_at": "DESC NULLS LAST", "id": "DESC"},
+            postgresql_where=sa.text("posted_at IS NOT NULL"),
+        )
+
+    # Unified scheduler: status = 'scheduled' AND posted_at IS NULL
+    # AND scheduled_at <= now ORDER BY scheduled_at
+    if "idx_posts_due_for_publish" not in existing_post_indexes:
+        op.create_index(
+            "idx_posts_due_for_publish",
+            "posts",
+            ["scheduled_at"],
+            postgresql_where=sa.text("status = 'scheduled' AND posted_at IS NULL"),
+        )
+
+    # Idea bank list: user_id filter ordered by updated_at
+    if "idx_idea_banks_user_updated_at" not in existing_idea_bank_indexes:
+        op.create_index(
+            "idx_idea_banks_user_updated_at",
+            "idea_banks",
+            ["user_id", "updated_at"],
+            postgresql_ops={"updated_at": "DESC"},
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_idea_banks_user_updated_at", table_name="idea_banks")
+    op.drop_index("idx_posts_due_for_publish", table_name="posts")
+    op.drop_index("idx_posts_user_status_posted_at", table_name="posts")
+    op.drop_index("idx_posts_user_status_scheduled_at", table_name="posts")
+    op.drop_index("idx_posts_user_status_created_at", table_name="posts")
+    op.drop_index("idx_posts_user_created_at", table_name="posts")
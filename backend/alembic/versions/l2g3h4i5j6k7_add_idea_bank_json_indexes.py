@@ -0,0 +1,59 @@
+"""add_idea_bank_json_indexes
+
+Expression indexes for the idea bank JSON filters (ai_suggested,
+time_sensitive) and the source URL dedupe lookup on data ->> 'value'.
+
+Revision ID: l2g3h4i5j6k7
+Revises: k1f2g3h4i5j6
+Create Date: 2025-08-05 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "l2g3h4i5j6k7"
+down_revision: Union[str, None] = "k1f2g3h4i5j6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_indexes = [idx["name"] for idx in inspector.get_indexes("idea_banks")]
+
+    # IdeaBankService ai_suggested filter: lower(data ->> 'ai_suggested')
+    if "idx_idea_banks_user_ai_suggested" not in existing_indexes:
+        op.create_index(
+            "idx_idea_banks_user_ai_suggested",
+            "idea_banks",
+            ["user_id", sa.text("lower(data ->> 'ai_suggested')")],
+        )
+
+    # IdeaBankService evergreen filter: lower(data ->> 'time_sensitive')
+    if "idx_idea_banks_user_time_sensitive" not in existing_indexes:
+        op.create_index(
+            "idx_idea_banks_user_time_sensitive",
+            "idea_banks",
+            ["user_id", sa.text("lower(data ->> 'time_sensitive')")],
+        )
+
+    # generate_suggestions dedupe: data ->> 'value' = :post_url. Values can be
+    # long scraped text, so hash rather than btree (no size limit, equality only)
+    if "idx_idea_banks_value_hash" not in existing_indexes:
+        op.create_index(
+            "idx_idea_banks_value_hash",
+            "idea_banks",
+            [sa.text("(data ->> 'value')")],
+            postgresql_using="hash",
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_idea_banks_value_hash", table_name="idea_banks")
+    op.drop_index("idx_idea_banks_user_time_sensitive", table_name="idea_banks")
+    op.drop_index("idx_idea_banks_user_ai_suggested", table_name="idea_banks")
@@ -0,0 +1,40 @@
+"""add_posts_idea_bank_updated_at_index
+
+Backs the per idea bank "latest post" LATERAL lookup in
+IdeaBankService.get_idea_banks_with_latest_posts.
+
+Revision ID: m3h4i5j6k7l8
+Revises: l2g3h4i5j6k7
+Create Date: 2025-08-06 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "m3h4i5j6k7l8"
+down_revision: Union[str, None] = "l2g3h4i5j6k7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_indexes = [idx["name"] for idx in inspector.get_indexes("posts")]
+
+    # WHERE idea_bank_id = ? ORDER BY updated_at DESC, id DESC LIMIT 1
+    if "idx_posts_idea_bank_updated_at" not in existing_indexes:
+        op.create_index(
+            "idx_posts_idea_bank_updated_at",
+            "posts",
+            ["idea_bank_id", "updated_at", "id"],
+            postgresql_ops={"updated_at": "DESC", "id": "DESC"},
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_posts_idea_bank_updated_at", table_name="posts")
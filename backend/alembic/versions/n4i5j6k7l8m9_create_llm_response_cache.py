@@ -0,0 +1,54 @@
+"""create_llm_response_cache
+
+Shared storage for the content-addressed LLM response cache used by
+PostGeneratorService.
+
+Revision ID: n4i5j6k7l8m9
+Revises: m3h4i5j6k7l8
+Create Date: 2025-08-07 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "n4i5j6k7l8m9"
+down_revision: Union[str, None] = "m3h4i5j6k7l8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    existing_tables = inspector.get_table_names()
+
+    if "llm_response_cache" not in existing_tables:
+        op.create_table(
+            "llm_response_cache",
+            sa.Column("key", sa.String(64), nullable=False),
+            sa.Column("model", sa.Text(), nullable=False),
+            sa.Column("response", sa.Text(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.TIMESTAMP(timezone=True),
+                nullable=False,
+                server_default=sa.text("now()"),
+            ),
+            sa.Column("expires_at", sa.TIMESTAMP(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("key", name="pk_llm_response_cache"),
+        )
+        # Expired-row purges
+        op.create_index(
+            "ix_llm_response_cache_expires_at",
+            "llm_response_cache",
+            ["expires_at"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_response_cache_expires_at", table_name="llm_response_cache")
+    op.drop_table("llm_response_cache")
@@ -13,6 +13,7 @@ from sqlalchemy.pool import NullPool
 
 
 from app.core.config import settings
+from app.core.pool import get_pool_kwargs
 
 logger = logging.getLogger(__name__)
 
@@ -97,13 +98,13 @@ class CloudSQLConnectionFactory:
                     ip_type=IPTypes.PUBLIC,  # Use public IP by default
                 )
 
-            # Create async engine with connection factory
+            # Create async engine with connection factory; pooled so requests
+            # reuse connections instead of paying a connector handshake each time
             engine = create_async_engine(
                 "postgresql+asyncpg://",
                 async_creator=getconn,
-                poolclass=NullPool,  # Use NullPool to avoid connection pooling issues
                 echo=settings.debug,
-                pool_pre_ping=True,
+                **get_pool_kwargs(),
             )
 
             logger.info("Created Cloud SQL async engine successfully")
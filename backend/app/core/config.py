@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False)
     environment: str = Field(default="production")
     backend_url: str = Field(default="http://localhost:8000")
+    # Defer heavy SDK imports and preload them in the background after
+    # startup; when false they are imported before serving requests
+    fast_startup: bool = Field(default=True)
     frontend_url: str = Field(default="http://localhost:8080")
 
     # GCP
@@ -50,6 +53,9 @@ class Settings(BaseSettings):
     db_max_overflow: int = Field(default=20)
     db_pool_timeout: int = Field(default=30)
     db_pool_recycle: int = Field(default=3600)
+    db_pool_use_lifo: bool = Field(default=True)
+    # Connections opened during startup so first requests skip the handshake
+    db_pool_warmup_connections: int = Field(default=0)
 
     # Migration settings
     auto_apply_migrations: bool = Field(default=True)
@@ -67,12 +73,34 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = Field(default=1440)
     refresh_token_expire_days: int = Field(default=7)
 
+    # Verified-principal cache (0 disables caching)
+    auth_cache_ttl_seconds: int = Field(default=60)
+    auth_cache_max_size: int = Field(default=1024)
+
+    # Process-wide signed media URL cache (0 disables caching); cached URLs
+    # are re-signed in the background once within the refresh-ahead window
+    signed_url_cache_max_size: int = Field(default=10000)
+    signed_url_refresh_ahead_seconds: int = Field(default=900)
+
+    # Per-user cache of post totals/counts (0 disables caching)
+    posts_count_cache_ttl_seconds: int = Field(default=30)
+
+    # Per-user cache of the writing context used in LLM prompts (0 disables)
+    user_context_cache_ttl_seconds: int = Field(default=60)
+    user_context_cache_max_size: int = Field(default=4096)
+
     # CORS - Use string instead of List to avoid JSON parsing
     cors_origins: str = Field(default="http://localhost:3000,http://localhost:8080")
 
     # Logging
     log_level: str = Field(default="INFO")
     log_format: str = Field(default="json")
+    # Serialize and write logs on a background thread
+    log_async: bool = Field(default=True)
+    log_queue_size: int = Field(default=10000)
+    # Fraction of requests whose request/response lines are logged
+    # (responses with status >= 400 are always logged)
+    log_request_sample_rate: float = Field(default=1.0)
 
     # OAuth
     google_client_id: Optional[str] = Field(default=None)
@@ -93,6 +121,63 @@ class Settings(BaseSettings):
     openrouter_large_models_fallback: str = Field(default="anthropic/claude-sonnet-4")
     openrouter_large_model_temperature: float = Field(default=0.0)
 
+    # Shared HTTP client for all OpenRouter models (one keep-alive pool)
+    openrouter_http2: bool = Field(default=True)
+    openrouter_max_connections: int = Field(default=100)
+    openrouter_max_keepalive_connections: int = Field(default=20)
+    openrouter_keepalive_expiry_seconds: float = Field(default=120.0)
+    openrouter_connect_timeout_seconds: float = Field(default=5.0)
+    # Also the longest silence allowed between streamed chunks
+    openrouter_read_timeout_seconds: float = Field(default=300.0)
+    openrouter_pool_timeout_seconds: float = Field(default=10.0)
+
+    # Client-side routing across the primary and fallback models: a circuit
+    # breaker skips models that keep failing (or whose first chunk takes longer
+    # than the slow threshold), and chat streams are hedged to the next model
+    # when the first chunk is later than the primary's rolling p95, capped at
+    # LLM_HEDGE_TTFT_SECONDS. Hedging doubles upstream requests for slow turns,
+    # so it is opt-in (0 disables it)
+    llm_routing_enabled: bool = Field(default=True)
+    llm_hedge_ttft_seconds: float = Field(default=0.0)
+    llm_latency_window: int = Field(default=200)
+    llm_latency_min_samples: int = Field(default=20)
+    llm_breaker_failure_threshold: int = Field(default=5)
+    llm_breaker_recovery_seconds: float = Field(default=30.0)
+    llm_breaker_slow_ttft_seconds: float = Field(default=15.0)
+
+    # LLM admission control: at most LLM_MAX_CONCURRENCY calls in flight, the
+    # last LLM_INTERACTIVE_RESERVED_SLOTS kept for chat; waiting calls are
+    # served by priority weight. Each user may have LLM_PER_USER_CONCURRENCY
+    # calls running or queued and RATE_LIMIT_PER_MINUTE admissions per minute
+    llm_max_concurrency: int = Field(default=16)
+    llm_interactive_reserved_slots: int = Field(default=4)
+    llm_priority_weights: str = Field(default="interactive:8,standard:3,background:1")
+    llm_per_user_concurrency: int = Field(default=3)
+    llm_queue_max_size: int = Field(default=100)
+    llm_queue_timeout_seconds: float = Field(default=15.0)
+
+    # Chat streaming: coalesce token deltas into frames (whichever of the
+    # size/time windows fills first) and send heartbeats while idle
+    chat_stream_frame_max_chars: int = Field(default=256)
+    chat_stream_frame_max_delay_ms: int = Field(default=50)
+    chat_stream_heartbeat_seconds: float = Field(default=15.0)
+
+    # Chat history: replay at most this many recent messages within a token
+    # budget; older turns are folded into a rolling summary in batches of at
+    # most chat_history_summary_max_tokens per summariser call
+    chat_history_max_messages: int = Field(default=40)
+    chat_history_token_budget: int = Field(default=3000)
+    chat_history_summary_batch: int = Field(default=6)
+    chat_history_summary_max_tokens: int = Field(default=6000)
+
+    # Opt-in cache of post generation/revision responses keyed by a hash of
+    # the model, its settings and the prompt. Backends are tried in order
+    # ("memory" = per-process LRU, "database" = shared llm_response_cache table)
+    llm_response_cache_enabled: bool = Field(default=False)
+    llm_response_cache_backends: str = Field(default="memory,database")
+    llm_response_cache_ttl_seconds: int = Field(default=3600)
+    llm_response_cache_max_size: int = Field(default=512)
+
     # Rate Limiting
     rate_limit_per_minute: int = Field(default=60)
 
@@ -4,14 +4,19 @@ Uses SQLAlchemy with async support and connection pooling.
 Supports both local databases and Google Cloud SQL.
 """
 
+import asyncio
 import logging
 from typing import AsyncGenerator
 
-from sqlalchemy import MetaData
+from sqlalchemy import Engine, MetaData, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import Pool
 
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.pool import get_pool_kwargs, get_pool_stats
+from app.core.rls import RLS_SESSION_OPTION, RLS_USER_ID_KEY, AuthContextHandler
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,51 @@ class Base(DeclarativeBase):
     metadata = metadata
 
 
+class RLSSession(Session):
+    """
+    Session class that carries the RLS user context for its transactions.
+
+    The user ID is stored in ``session.info`` (see
+    ``AuthContextHandler.set_current_user``) and applied to the connection
+    when a transaction begins, instead of with an eager round-trip per request.
+    """
+
+
+@event.listens_for(RLSSession, "after_begin")
+def _apply_rls_user_context(session, transaction, connection):
+    """Sync the connection's RLS user context with the session's on checkout."""
+    AuthContextHandler.apply_to_connection(
+        connection, session.info.get(RLS_USER_ID_KEY, "")
+    )
+
+
+@event.listens_for(Engine, "rollback")
+def _forget_rls_user_context(connection):
+    """A rollback may undo set_config, so re-apply on the next transaction."""
+    connection.info.pop(RLS_USER_ID_KEY, None)
+
+
+@event.listens_for(Pool, "connect")
+def _init_rls_user_context(dbapi_connection, connection_record):
+    """New connections start without an RLS user context."""
+    connection_record.info[RLS_USER_ID_KEY] = ""
+
+
+@event.listens_for(Engine, "engine_connect")
+def _clear_rls_user_context(connection):
+    """
+    Clear a previous user's RLS context for checkouts outside RLSSession.
+
+    The context outlives a checkout (see ``apply_to_connection``), so raw
+    ``engine.connect()`` users such as ``warm_up_pool`` would otherwise run
+    as whoever last used the pooled connection.
+    """
+    if connection.get_execution_options().get(RLS_SESSION_OPTION):
+        return
+    if AuthContextHandler.apply_to_connection(connection, ""):
+        connection.commit()
+
+
 def _is_cloud_sql_configured() -> bool:
     """Check if Cloud SQL is properly configured."""
     cloud_sql_configured = all(
@@ -61,25 +111,12 @@ def get_engine_config():
     """Get engine configuration based on database URL."""
     db_url = settings.get_async_database_url()
     is_sqlite = db_url.startswith("sqlite")
-    is_cloud_sql = _is_cloud_sql_configured()
 
     if is_sqlite:
         return {"echo": settings.debug, "connect_args": {"check_same_thread": False}}
-    elif is_cloud_sql:
-        # Cloud SQL uses its own connection management
-        return {
-            "echo": settings.debug,
-            "pool_pre_ping": True,
-        }
     else:
-        return {
-            "echo": settings.debug,
-            "pool_pre_ping": True,
-            "pool_size": settings.db_pool_size,
-            "max_overflow": settings.db_max_overflow,
-            "pool_recycle": settings.db_pool_recycle,
-            "pool_timeout": settings.db_pool_timeout,
-        }
+        # Cloud SQL and direct PostgreSQL share the same pool configuration
+        return {"echo": settings.debug, **get_pool_kwargs()}
 
 
 def get_sync_engine_config():
@@ -134,6 +171,9 @@ def _create_engines():
         async_engine = cloud_sql_factory.create_async_engine()
         sync_engine = cloud_sql_factory.create_engine()
 
+    # Per-statement timing for /metrics
+    instrument_engine(async_engine.sync_engine)
+
     return async_engine, sync_engine
 
 
@@ -165,7 +205,11 @@ def get_async_session_local():
     global _async_session_local
     if _async_session_local is None:
         _async_session_local = async_sessionmaker(
-            get_async_engine(), class_=AsyncSession, expire_on_commit=False
+            # RLSSession applies its own user context on begin
+            get_async_engine().execution_options(**{RLS_SESSION_OPTION: True}),
+            class_=AsyncSession,
+            sync_session_class=RLSSession,
+            expire_on_commit=False,
         )
     return _async_session_local
 
@@ -214,18 +258,19 @@ async def get_async_db_with_user_context(
     Dependency to get async database session with user context set for RLS.
     This should be used when you have a known user context to set.
 
+    The context is applied when the session checks out its connection, so no
+    separate set/clear statements are issued per request.
+
     Args:
         user_id: UUID string of the current user
 
     Yields:
         AsyncSession: Database session with user context set
     """
-    from app.core.rls import AuthContextHandler
-
     session_factory = get_async_session_local()
     async with session_factory() as session:
         try:
-            # Set user context for RLS
+            # Bind user context for RLS
             await AuthContextHandler.set_current_user(session, user_id)
             yield session
             await session.commit()
@@ -233,12 +278,6 @@ async def get_async_db_with_user_context(
             await session.rollback()
             raise
         finally:
-            # Clear user context before closing
-            try:
-                await AuthContextHandler.clear_user_context(session)
-            except Exception:
-                # Don't fail if context clearing fails
-                pass
             await session.close()
 
 
@@ -294,6 +333,62 @@ async def init_db() -> None:
     logger.info("Database initialization completed successfully")
 
 
+async def warm_up_pool(connections: int) -> int:
+    """
+    Open pooled connections ahead of the first requests.
+
+    Connections are opened concurrently and returned to the pool, so a cold
+    instance does not pay connection setup latency on its first requests.
+    The count is capped at the configured pool size.
+
+    Args:
+        connections: Number of connections to open
+
+    Returns:
+        int: Number of connections successfully opened
+    """
+    engine = get_async_engine()
+    count = connections
+    if hasattr(engine.pool, "size"):
+        count = min(count, engine.pool.size())
+    if count <= 0:
+        return 0
+
+    async def _open():
+        conn = await engine.connect()
+        try:
+            await conn.exec_driver_sql("SELECT 1")
+        except Exception:
+            await conn.close()
+            raise
+        return conn
+
+    results = await asyncio.gather(
+        *(_open() for _ in range(count)), return_exceptions=True
+    )
+    opened = [r for r in results if not isinstance(r, BaseException)]
+    for conn in opened:
+        await conn.close()
+
+    failures = len(results) - len(opened)
+    if failures:
+        logger.warning(f"Pool warm-up failed for {failures} of {count} connections")
+    logger.info(f"Warmed up {len(opened)} database connections")
+    return len(opened)
+
+
+def get_db_pool_stats() -> dict:
+    """
+    Get live statistics for the async engine's connection pool.
+
+    Returns:
+        dict: Pool statistics, or an empty dict if no engine was created yet
+    """
+    if _async_engine is None:
+        return {}
+    return get_pool_stats(_async_engine.pool)
+
+
 async def close_db() -> None:
     """
     Close database connections.
@@ -0,0 +1,262 @@
+"""
+Content-addressed cache of LLM responses.
+Identical generation requests (same model, settings, instructions and prompt)
+are answered from storage instead of re-running the model.
+"""
+
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import llm_response_cache_requests_total
+from app.utils.cache import TTLCache
+
+
+def response_cache_key(
+    model: str, model_settings: Any, instructions: str, prompt: str, output: str
+) -> str:
+    """
+    Hash everything that determines a model response.
+
+    Args:
+        model: Requested model name
+        model_settings: Model settings (temperature, fallback models, ...)
+        instructions: Static agent instructions
+        prompt: Rendered user prompt
+        output: Identifier of the output schema (e.g. its JSON schema)
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        [model, model_settings, instructions, prompt, output],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCacheBackend(ABC):
+    """Storage for serialized responses; failures must not break generation."""
+
+    name = "base"
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the unexpired value stored under ``key``, if any."""
+
+    @abstractmethod
+    async def set(self, key: str, model: str, value: str, ttl_seconds: int) -> None:
+        """Store ``value`` under ``key`` for ``ttl_seconds``."""
+
+
+class MemoryLLMCacheBackend(LLMCacheBackend):
+    """Per-process LRU with TTL."""
+
+    name = "memory"
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, model: str, value: str, ttl_seconds: int) -> None:
+        self._cache.set(key, value, ttl_seconds)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class DatabaseLLMCacheBackend(LLMCacheBackend):
+    """
+    ``llm_response_cache`` table shared by all instances.
+
+    Writes are upserts keyed by the content hash. Expired rows are ignored on
+    read and purged at most once per ``purge_interval_seconds`` per process.
+    """
+
+    name = "database"
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        purge_interval_seconds: float = 3600,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self._session_factory = session_factory
+        self.purge_interval_seconds = purge_interval_seconds
+        self._timer = timer
+        self._next_purge = 0.0
+
+    def _session(self) -> AsyncSession:
+        if self._session_factory is None:
+            from app.core.database import get_async_session_local
+
+            self._session_factory = get_async_session_local()
+        return self._session_factory()
+
+    async def get(self, key: str) -> Optional[str]:
+        from app.models.llm_response_cache import LLMResponseCacheEntry
+
+        async with self._session() as session:
+            result = await session.execute(
+                select(LLMResponseCacheEntry.response).where(
+                    LLMResponseCacheEntry.key == key,
+                    LLMResponseCacheEntry.expires_at > datetime.now(timezone.utc),
+                )
+            )
+            return result.scalar()
+
+    async def set(self, key: str, model: str, value: str, ttl_seconds: int) -> None:
+        from app.models.llm_response_cache import LLMResponseCacheEntry
+
+        now = datetime.now(timezone.utc)
+        values = {
+            "key": key,
+            "model": model,
+            "response": value,
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=ttl_seconds),
+        }
+        async with self._session() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            stmt = insert(LLMResponseCacheEntry).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[LLMResponseCacheEntry.key],
+                set_={k: stmt.excluded[k] for k in values if k != "key"},
+            )
+            await session.execute(stmt)
+
+            if self._timer() >= self._next_purge:
+                self._next_purge = self._timer() + self.purge_interval_seconds
+                await session.execute(
+                    delete(LLMResponseCacheEntry).where(
+                        LLMResponseCacheEntry.expires_at <= now
+                    )
+                )
+            await session.commit()
+
+
+class LLMResponseCache:
+    """
+    Read-through cache over an ordered list of backends.
+
+    Lookups try each backend in turn and back-fill the faster ones on a hit;
+    writes go to every backend. Backend errors are logged and treated as
+    misses so the model is called instead.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[LLMCacheBackend],
+        ttl_seconds: int,
+        enabled: bool = True,
+    ):
+        self.backends: List[LLMCacheBackend] = list(backends)
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled and bool(self.backends) and ttl_seconds > 0
+
+    @classmethod
+    def from_settings(cls) -> "LLMResponseCache":
+        """Build the cache from the ``llm_response_cache_*`` settings."""
+        backends: List[LLMCacheBackend] = []
+        for name in settings.llm_response_cache_backends.split(","):
+            name = name.strip()
+            if name == "memory":
+                backends.append(
+                    MemoryLLMCacheBackend(
+                        settings.llm_response_cache_max_size,
+                        settings.llm_response_cache_ttl_seconds,
+                    )
+                )
+            elif name == "database":
+                backends.append(DatabaseLLMCacheBackend())
+            elif name:
+                logger.warning(f"Unknown LLM response cache backend: {name}")
+        return cls(
+            backends,
+            ttl_seconds=settings.llm_response_cache_ttl_seconds,
+            enabled=settings.llm_response_cache_enabled,
+        )
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached serialized response for ``key``, if any."""
+        for index, backend in enumerate(self.backends):
+            try:
+                value = await backend.get(key)
+            except Exception as e:
+                logger.warning(f"LLM response cache {backend.name} read failed: {e}")
+                continue
+            if value is not None:
+                for faster in self.backends[:index]:
+                    await self._write(faster, key, "", value)
+                return value
+        return None
+
+    async def set(self, key: str, model: str, value: str) -> None:
+        """Store a serialized response in every backend."""
+        for backend in self.backends:
+            await self._write(backend, key, model, value)
+
+    async def _write(
+        self, backend: LLMCacheBackend, key: str, model: str, value: str
+    ) -> None:
+        try:
+            await backend.set(key, model, value, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"LLM response cache {backend.name} write failed: {e}")
+
+    async def get_or_run(
+        self,
+        operation: str,
+        key: str,
+        model: str,
+        run: Callable[[], Awaitable[str]],
+        bypass: bool = False,
+    ) -> str:
+        """
+        Return the cached response for ``key`` or run the model and cache it.
+
+        Args:
+            operation: Metric label for the call site (e.g. "generate_post")
+            key: Key from ``response_cache_key``
+            model: Requested model name, stored for inspection
+            run: Coroutine factory calling the model; returns the serialized
+                response
+            bypass: Skip the lookup (the fresh response is still cached)
+
+        Returns:
+            str: Serialized response
+        """
+        if not self.enabled:
+            return await run()
+
+        if bypass:
+            llm_response_cache_requests_total.inc(operation=operation, result="bypass")
+        else:
+            cached = await self.get(key)
+            if cached is not None:
+                llm_response_cache_requests_total.inc(operation=operation, result="hit")
+                return cached
+            llm_response_cache_requests_total.inc(operation=operation, result="miss")
+
+        value = await run()
+        await self.set(key, model, value)
+        return value
+
+
+# Global LLM response cache instance
+llm_response_cache = LLMResponseCache.from_settings()
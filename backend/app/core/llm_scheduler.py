@@ -0,0 +1,344 @@
+"""
+In-process admission control for LLM calls.
+Interactive chat, image prompts and background work share one OpenRouter key;
+the scheduler bounds concurrent calls and decides who goes next.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Deque, Dict, Hashable, Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.metrics import (
+    llm_scheduler_rejections_total,
+    llm_scheduler_wait_seconds,
+)
+from app.utils.cache import TTLCache
+
+INTERACTIVE = "interactive"
+STANDARD = "standard"
+BACKGROUND = "background"
+
+
+class LLMAdmissionError(HTTPException):
+    """Raised when an LLM call is not admitted; rendered as 429/503 with Retry-After."""
+
+    def __init__(self, status_code: int, reason: str, retry_after: float):
+        self.reason = reason
+        self.retry_after = max(math.ceil(retry_after), 1)
+        super().__init__(
+            status_code=status_code,
+            detail=f"AI service is busy ({reason.replace('_', ' ')}), please retry",
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+
+def parse_weights(spec: str) -> Dict[str, int]:
+    """Parse ``"interactive:8,standard:3"`` into ``{"interactive": 8, ...}``."""
+    weights = {}
+    for item in spec.split(","):
+        name, _, weight = item.partition(":")
+        if name.strip():
+            weights[name.strip()] = max(int(weight or 1), 1)
+    return weights
+
+
+@dataclass
+class LLMTicket:
+    """An admitted LLM call; release it exactly once (further calls are no-ops)."""
+
+    user_key: Hashable
+    priority: str
+    admitted_at: float = 0.0
+    released: bool = False
+
+
+@dataclass
+class _Waiter:
+    ticket: LLMTicket
+    future: "asyncio.Future[None]"
+    queued_at: float = field(default_factory=time.perf_counter)
+
+
+class LLMScheduler:
+    """
+    Weighted-priority admission queue with per-user limits.
+
+    At most ``max_concurrency`` calls run at once, and ``reserved_slots`` of
+    them can only be used by interactive calls. When a slot frees up, waiting
+    classes are served by smooth weighted round-robin on their weights, FIFO
+    within a class. Each user may have ``per_user_concurrency`` calls running
+    or queued and is rate limited to ``rate_per_minute`` admissions (token
+    bucket). Requests are rejected up front when a user limit is hit (429) or
+    the queue is full (503), and with 503 if not admitted within
+    ``queue_timeout``; every rejection carries a Retry-After estimate.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        weights: Dict[str, int],
+        reserved_slots: int = 0,
+        per_user_concurrency: int = 0,
+        rate_per_minute: int = 0,
+        max_queue: int = 100,
+        queue_timeout: float = 15.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrency = max(max_concurrency, 1)
+        self.weights = weights
+        self.reserved_slots = min(max(reserved_slots, 0), self.max_concurrency - 1)
+        self.per_user_concurrency = per_user_concurrency
+        self.rate_per_minute = rate_per_minute
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._timer = timer
+
+        self.active = 0
+        self._queues: Dict[str, Deque[_Waiter]] = {name: deque() for name in weights}
+        self._current_weight: Dict[str, int] = {name: 0 for name in weights}
+        self._user_load: Dict[Hashable, int] = {}
+        # Idle buckets refill completely within a minute, so they can expire
+        self._buckets = TTLCache(maxsize=100_000, ttl_seconds=60)
+        # Moving average of how long a call holds its slot, for Retry-After
+        self._avg_hold = 5.0
+
+    @classmethod
+    def from_settings(cls) -> "LLMScheduler":
+        """Build the scheduler from the ``llm_*`` and rate limit settings."""
+        return cls(
+            max_concurrency=settings.llm_max_concurrency,
+            weights=parse_weights(settings.llm_priority_weights),
+            reserved_slots=settings.llm_interactive_reserved_slots,
+            per_user_concurrency=settings.llm_per_user_concurrency,
+            rate_per_minute=settings.rate_limit_per_minute,
+            max_queue=settings.llm_queue_max_size,
+            queue_timeout=settings.llm_queue_timeout_seconds,
+        )
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Number of waiting calls per priority class."""
+        return {name: len(queue) for name, queue in self._queues.items()}
+
+    def _queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _capacity(self, priority: str) -> int:
+        if priority == INTERACTIVE:
+            return self.max_concurrency
+        return self.max_concurrency - self.reserved_slots
+
+    def _reject(
+        self, ticket: LLMTicket, status_code: int, reason: str, retry_after: float
+    ) -> LLMAdmissionError:
+        llm_scheduler_rejections_total.inc(priority=ticket.priority, reason=reason)
+        return LLMAdmissionError(status_code, reason, retry_after)
+
+    def _queue_retry_after(self) -> float:
+        return self._avg_hold * (self._queued() + 1) / self.max_concurrency
+
+    def _take_rate_token(self, user_key: Hashable) -> Optional[float]:
+        """Consume a rate token; returns seconds until one is free if none is."""
+        if self.rate_per_minute <= 0:
+            return None
+        now = self._timer()
+        tokens, updated = self._buckets.get(user_key, (self.rate_per_minute, now))
+        per_second = self.rate_per_minute / 60
+        tokens = min(self.rate_per_minute, tokens + (now - updated) * per_second)
+        if tokens < 1:
+            self._buckets.set(user_key, (tokens, now))
+            return (1 - tokens) / per_second
+        self._buckets.set(user_key, (tokens - 1, now))
+        return None
+
+    async def acquire(
+        self,
+        user_id: Hashable,
+        priority: str = STANDARD,
+        timeout: Optional[float] = None,
+    ) -> LLMTicket:
+        """
+        Wait for a slot for ``user_id`` in ``priority``'s class.
+
+        Args:
+            user_id: Caller, for per-user limits
+            priority: Priority class name (one of the configured weights)
+            timeout: Longest wait in the queue; defaults to ``queue_timeout``
+
+        Returns:
+            LLMTicket: Pass to ``release`` when the call finishes
+
+        Raises:
+            LLMAdmissionError: 429 for per-user limits, 503 when saturated
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Unknown LLM priority class: {priority}")
+        ticket = LLMTicket(user_key=str(user_id), priority=priority)
+
+        if (
+            self.per_user_concurrency > 0
+            and self._user_load.get(ticket.user_key, 0) >= self.per_user_concurrency
+        ):
+            raise self._reject(
+                ticket,
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                "user_concurrency",
+                self._avg_hold,
+            )
+        wait = self._take_rate_token(ticket.user_key)
+        if wait is not None:
+            raise self._reject(
+                ticket, status.HTTP_429_TOO_MANY_REQUESTS, "rate_limited", wait
+            )
+
+        if self.active < self._capacity(priority) and not self._queued():
+            self._user_load[ticket.user_key] = (
+                self._user_load.get(ticket.user_key, 0) + 1
+            )
+            self._admit(ticket, time.perf_counter())
+            return ticket
+        if self._queued() >= self.max_queue:
+            raise self._reject(
+                ticket,
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "queue_full",
+                self._queue_retry_after(),
+            )
+
+        waiter = _Waiter(ticket, asyncio.get_running_loop().create_future())
+        self._queues[priority].append(waiter)
+        self._user_load[ticket.user_key] = self._user_load.get(ticket.user_key, 0) + 1
+        # Calls queued ahead may be waiting on slots this class can still use
+        self._dispatch()
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(waiter.future),
+                self.queue_timeout if timeout is None else timeout,
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as we gave up: hand the slot back
+                self.release(ticket)
+            else:
+                waiter.future.cancel()
+                self._queues[priority].remove(waiter)
+                self._drop_user_load(ticket.user_key)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject(
+                ticket,
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "queue_timeout",
+                self._queue_retry_after(),
+            ) from None
+        return ticket
+
+    def try_acquire(
+        self, user_id: Hashable, priority: str = STANDARD
+    ) -> Optional[LLMTicket]:
+        """
+        Take a slot only if one is free right now, without queueing.
+
+        For deferrable work (e.g. background summaries): returns None when
+        the call would have to wait or hit a per-user limit, and is not
+        counted as a rejection.
+
+        Args:
+            user_id: Caller, for per-user limits
+            priority: Priority class name (one of the configured weights)
+
+        Returns:
+            Optional[LLMTicket]: Pass to ``release`` when done, or None
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Unknown LLM priority class: {priority}")
+        user_key = str(user_id)
+        if (
+            self.per_user_concurrency > 0
+            and self._user_load.get(user_key, 0) >= self.per_user_concurrency
+        ):
+            return None
+        if self.active >= self._capacity(priority) or self._queued():
+            return None
+        if self._take_rate_token(user_key) is not None:
+            return None
+
+        ticket = LLMTicket(user_key=user_key, priority=priority)
+        self._user_load[user_key] = self._user_load.get(user_key, 0) + 1
+        self._admit(ticket, time.perf_counter())
+        return ticket
+
+    def _admit(self, ticket: LLMTicket, queued_at: float) -> None:
+        self.active += 1
+        ticket.admitted_at = time.perf_counter()
+        llm_scheduler_wait_seconds.observe(
+            ticket.admitted_at - queued_at, priority=ticket.priority
+        )
+
+    def _drop_user_load(self, user_key: Hashable) -> None:
+        load = self._user_load.get(user_key, 0) - 1
+        if load > 0:
+            self._user_load[user_key] = load
+        else:
+            self._user_load.pop(user_key, None)
+
+    def release(self, ticket: LLMTicket) -> None:
+        """Free ``ticket``'s slot and admit the next waiting call(s)."""
+        if ticket.released or not ticket.admitted_at:
+            return
+        ticket.released = True
+        self.active -= 1
+        self._drop_user_load(ticket.user_key)
+        held = time.perf_counter() - ticket.admitted_at
+        self._avg_hold += 0.1 * (held - self._avg_hold)
+        self._dispatch()
+
+    def _next_class(self) -> Optional[str]:
+        """Pick the next class to serve by smooth weighted round-robin."""
+        eligible = [
+            name
+            for name, queue in self._queues.items()
+            if queue and self.active < self._capacity(name)
+        ]
+        if not eligible:
+            return None
+        total = 0
+        for name in eligible:
+            self._current_weight[name] += self.weights[name]
+            total += self.weights[name]
+        chosen = max(eligible, key=lambda name: self._current_weight[name])
+        self._current_weight[chosen] -= total
+        return chosen
+
+    def _dispatch(self) -> None:
+        while self.active < self.max_concurrency:
+            name = self._next_class()
+            if name is None:
+                return
+            waiter = self._queues[name].popleft()
+            self._admit(waiter.ticket, waiter.queued_at)
+            waiter.future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        user_id: Hashable,
+        priority: str = STANDARD,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[LLMTicket]:
+        """Hold an LLM slot for the duration of the block (see ``acquire``)."""
+        ticket = await self.acquire(user_id, priority, timeout)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+
+# Global LLM scheduler instance
+llm_scheduler = LLMScheduler.from_settings()
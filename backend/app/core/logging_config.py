@@ -0,0 +1,246 @@
+"""
+Logging pipeline helpers.
+Provides a background sink that moves JSON serialization and I/O off the
+event loop, request-line sampling and per-request log volume counting.
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import threading
+from contextvars import ContextVar
+from logging.handlers import TimedRotatingFileHandler
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+from app.core.config import settings
+from app.core.metrics import log_records_dropped_total
+
+# Log records emitted during the current request (None outside requests)
+_request_log_count: ContextVar[Optional[List[int]]] = ContextVar(
+    "request_log_count", default=None
+)
+
+
+def serialize_record(text: str, record: Dict[str, Any]) -> str:
+    """
+    Serialize a loguru record to a JSON line (same shape as ``serialize=True``).
+
+    Args:
+        text: Formatted log text
+        record: Loguru record dict
+
+    Returns:
+        str: JSON document terminated by a newline
+    """
+    exception = record["exception"]
+    if exception is not None:
+        exception = {
+            "type": None if exception.type is None else exception.type.__name__,
+            "value": None if exception.value is None else str(exception.value),
+            "traceback": bool(exception.traceback),
+        }
+
+    serializable = {
+        "text": text,
+        "record": {
+            "elapsed": {
+                "repr": str(record["elapsed"]),
+                "seconds": record["elapsed"].total_seconds(),
+            },
+            "exception": exception,
+            "extra": record["extra"],
+            "file": {"name": record["file"].name, "path": record["file"].path},
+            "function": record["function"],
+            "level": {
+                "icon": record["level"].icon,
+                "name": record["level"].name,
+                "no": record["level"].no,
+            },
+            "line": record["line"],
+            "message": record["message"],
+            "module": record["module"],
+            "name": record["name"],
+            "process": {"id": record["process"].id, "name": record["process"].name},
+            "thread": {"id": record["thread"].id, "name": record["thread"].name},
+            "time": {
+                "repr": str(record["time"]),
+                "timestamp": record["time"].timestamp(),
+            },
+        },
+    }
+    return json.dumps(serializable, default=str, ensure_ascii=False) + "\n"
+
+
+class BackgroundSink:
+    """
+    Loguru sink that hands messages to a worker thread.
+
+    The caller only enqueues the message; JSON serialization and writes to
+    the underlying streams happen on the worker. When the queue is full,
+    messages below ``sync_level`` are dropped and counted rather than
+    blocking the event loop; errors are written on the caller's thread
+    instead, so they are never lost.
+    """
+
+    def __init__(
+        self,
+        writers: List[Callable[[str], None]],
+        serialize: bool = False,
+        max_queue_size: int = 10000,
+        sync_level: int = logging.ERROR,
+    ):
+        self._writers = writers
+        self._serialize = serialize
+        self._sync_level = sync_level
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        # Serializes writes from the worker and from synchronous fallbacks
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, message) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            if message.record["level"].no >= self._sync_level:
+                self._write(message)
+            else:
+                log_records_dropped_total.inc()
+
+    def _write(self, message) -> None:
+        try:
+            line = (
+                serialize_record(str(message), message.record)
+                if self._serialize
+                else str(message)
+            )
+            with self._write_lock:
+                for write in self._writers:
+                    write(line)
+        except Exception:
+            # Never let a bad record kill the writer thread (or the caller)
+            pass
+
+    def _run(self) -> None:
+        while True:
+            message = self._queue.get()
+            if message is None:
+                break
+            self._write(message)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush queued messages and stop the worker thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+
+# (logger, handler ID, sink) registered by add_background_sink
+_background_sinks: List[tuple] = []
+
+
+def stream_writer(stream: TextIO) -> Callable[[str], None]:
+    """Create a writer that writes and flushes lines to a text stream."""
+
+    def write(line: str) -> None:
+        stream.write(line)
+        stream.flush()
+
+    return write
+
+
+def rotating_file_writer(path: str, backup_days: int = 30) -> Callable[[str], None]:
+    """
+    Create a writer appending lines to a file rotated daily.
+
+    Args:
+        path: Log file path
+        backup_days: Number of rotated files to keep
+
+    Returns:
+        Callable writing one line per call
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    handler = TimedRotatingFileHandler(
+        path, when="midnight", backupCount=backup_days, encoding="utf-8"
+    )
+    handler.terminator = ""
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def write(line: str) -> None:
+        handler.emit(logging.makeLogRecord({"msg": line}))
+
+    return write
+
+
+def add_background_sink(
+    loguru_logger,
+    writers: List[Callable[[str], None]],
+    level: str,
+    format: str,
+    serialize: bool = False,
+) -> int:
+    """
+    Register a ``BackgroundSink`` with loguru.
+
+    Args:
+        loguru_logger: Loguru logger to add the sink to
+        writers: Writers receiving each formatted line
+        level: Minimum level for the sink
+        format: Loguru format string for the text part
+        serialize: Whether to write JSON documents instead of plain text
+
+    Returns:
+        int: Loguru handler ID
+    """
+    sink = BackgroundSink(
+        writers, serialize=serialize, max_queue_size=settings.log_queue_size
+    )
+    handler_id = loguru_logger.add(sink, level=level, format=format)
+    _background_sinks.append((loguru_logger, handler_id, sink))
+    return handler_id
+
+
+def stop_background_sinks() -> None:
+    """Detach all background sinks from loguru, then flush and stop them."""
+    while _background_sinks:
+        loguru_logger, handler_id, sink = _background_sinks.pop()
+        try:
+            loguru_logger.remove(handler_id)
+        except ValueError:
+            # Already removed (e.g. by logger.remove() on reconfiguration)
+            pass
+        sink.stop()
+
+
+def should_sample_request() -> bool:
+    """Decide whether this request's request/response lines are logged."""
+    rate = settings.log_request_sample_rate
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+def count_request_log(record: Dict[str, Any]) -> None:
+    """Loguru patcher counting records emitted during the current request."""
+    counter = _request_log_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def start_request_log_count():
+    """
+    Start counting log records for the current request context.
+
+    Returns:
+        Tuple of (counter list, context token for ``stop_request_log_count``)
+    """
+    counter = [0]
+    return counter, _request_log_count.set(counter)
+
+
+def stop_request_log_count(token) -> None:
+    """Stop counting log records for the current request context."""
+    _request_log_count.reset(token)
@@ -0,0 +1,542 @@
+"""
+Application metrics in Prometheus text exposition format.
+Provides a small in-process registry plus the HTTP, database, LLM and
+streaming metrics exported on ``/metrics``.
+"""
+
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Engine, event
+from starlette.routing import Match
+
+from app.utils.cache import TTLCache
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _samples(self) -> Iterable[Tuple[str, Sequence[str], Sequence[str], float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for suffix, names, values, value in self._samples():
+            lines.append(
+                f"{self.name}{suffix}{_format_labels(names, values)} "
+                f"{_format_value(value)}"
+            )
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter; the name always ends in ``_total``."""
+
+    metric_type = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not self.name.endswith("_total"):
+            self.name += "_total"
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", self.labelnames, key, value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", self.labelnames, key, value
+
+
+class CallbackGauge(_Metric):
+    """Gauge whose values are read from a callback at scrape time."""
+
+    metric_type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Dict[LabelValues, float]],
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._callback = callback
+
+    def _samples(self):
+        try:
+            values = self._callback()
+        except Exception:
+            values = {}
+        for key, value in values.items():
+            yield "", self.labelnames, key, value
+
+
+class Histogram(_Metric):
+    """Cumulative histogram of observed values."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label values -> (per-bucket counts, sum, count)
+        self._values: Dict[LabelValues, List] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def _samples(self):
+        with self._lock:
+            items = [(k, (list(v[0]), v[1], v[2])) for k, v in self._values.items()]
+        bucket_names = self.labelnames + ("le",)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield "_bucket", bucket_names, key + (_format_value(bound),), cumulative
+            yield "_sum", self.labelnames, key, total
+            yield "_count", self.labelnames, key, count
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together on ``/metrics``."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global registry
+registry = MetricsRegistry()
+
+# HTTP
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP requests by route template, method and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency until the response body completed.",
+    ("method", "route"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+    ("method", "route"),
+)
+
+# Logging
+http_request_log_records = registry.histogram(
+    "http_request_log_records",
+    "Log records emitted while serving a request.",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+log_records_dropped_total = registry.counter(
+    "log_records_dropped_total",
+    "Log records dropped because the background log queue was full.",
+)
+
+# Database
+db_statement_duration_seconds = registry.histogram(
+    "db_statement_duration_seconds",
+    "Database statement execution time by statement verb.",
+    ("operation",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+
+# LLM
+llm_request_duration_seconds = registry.histogram(
+    "llm_request_duration_seconds",
+    "LLM request latency by requested model and mode (request or stream).",
+    ("model", "mode", "outcome"),
+)
+llm_tokens_total = registry.counter(
+    "llm_tokens_total",
+    "LLM tokens consumed by requested model and direction (prompt_cached is the "
+    "part of prompt read from the provider's prompt cache).",
+    ("model", "direction"),
+)
+llm_prompt_cache_requests_total = registry.counter(
+    "llm_prompt_cache_requests_total",
+    "LLM requests by whether the provider served part of the prompt from cache.",
+    ("model", "result"),
+)
+llm_response_cache_requests_total = registry.counter(
+    "llm_response_cache_requests_total",
+    "LLM response cache lookups by operation and result (hit, miss or bypass).",
+    ("operation", "result"),
+)
+llm_hedged_requests_total = registry.counter(
+    "llm_hedged_requests_total",
+    "Hedged LLM streams by first-choice model and the model that answered first.",
+    ("model", "served_by"),
+)
+llm_circuit_breaker_transitions_total = registry.counter(
+    "llm_circuit_breaker_transitions_total",
+    "LLM circuit breaker state changes by model and new state (open or closed).",
+    ("model", "state"),
+)
+llm_fallback_total = registry.counter(
+    "llm_fallback_responses_total",
+    "LLM responses served by a fallback model instead of the requested one.",
+    ("requested_model", "served_model"),
+)
+llm_scheduler_wait_seconds = registry.histogram(
+    "llm_scheduler_wait_seconds",
+    "Time LLM calls waited for admission by priority class.",
+    ("priority",),
+    buckets=(0.005, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0),
+)
+llm_scheduler_rejections_total = registry.counter(
+    "llm_scheduler_rejections_total",
+    "LLM calls refused admission by priority class and reason.",
+    ("priority", "reason"),
+)
+
+# Media
+signed_url_cache_requests_total = registry.counter(
+    "signed_url_cache_requests_total",
+    "Signed media URL lookups by result (hit, refresh or miss).",
+    ("result",),
+)
+
+# Streaming
+sse_stream_duration_seconds = registry.histogram(
+    "sse_stream_duration_seconds",
+    "Server-sent event stream duration by stream and outcome.",
+    ("stream", "outcome"),
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0),
+)
+
+
+def _db_pool_stats() -> Dict:
+    from app.core.database import get_db_pool_stats
+
+    return get_db_pool_stats()
+
+
+def _db_pool_connections() -> Dict[LabelValues, float]:
+    stats = _db_pool_stats()
+    return {
+        (state,): stats[state]
+        for state in ("checked_in", "checked_out", "overflow")
+        if state in stats
+    }
+
+
+def _db_pool_waits() -> Dict[LabelValues, float]:
+    stats = _db_pool_stats()
+    return {
+        (stat,): stats[key]
+        for stat, key in (
+            ("total", "wait_seconds_total"),
+            ("max", "wait_seconds_max"),
+            ("checkouts", "checkouts"),
+        )
+        if key in stats
+    }
+
+
+def _llm_ttft_p95() -> Dict[LabelValues, float]:
+    from app.services.model_config import model_config
+
+    return {(model,): p95 for model, p95 in model_config.latency.snapshot().items()}
+
+
+def _llm_scheduler_slots() -> Dict[LabelValues, float]:
+    from app.core.llm_scheduler import llm_scheduler
+
+    samples = {
+        (priority, "queued"): depth
+        for priority, depth in llm_scheduler.queue_depths().items()
+    }
+    samples[("all", "active")] = llm_scheduler.active
+    return samples
+
+
+# Database pool (read from the live pool at scrape time)
+registry.register(
+    CallbackGauge(
+        "db_pool_connections",
+        "Database pool connections by state.",
+        ("state",),
+        _db_pool_connections,
+    )
+)
+registry.register(
+    CallbackGauge(
+        "db_pool_checkout_wait",
+        "Database pool checkout wait statistics since startup.",
+        ("stat",),
+        _db_pool_waits,
+    )
+)
+
+# LLM routing (read from ModelConfig's latency tracker at scrape time)
+registry.register(
+    CallbackGauge(
+        "llm_ttft_p95_seconds",
+        "Rolling p95 time to first streamed chunk by model.",
+        ("model",),
+        _llm_ttft_p95,
+    )
+)
+
+# LLM admission (read from the scheduler at scrape time)
+registry.register(
+    CallbackGauge(
+        "llm_scheduler_calls",
+        "LLM calls queued per priority class and active in total.",
+        ("priority", "state"),
+        _llm_scheduler_slots,
+    )
+)
+
+
+_STATEMENT_START_KEY = "metrics_statement_start"
+
+
+def _statement_operation(statement: str) -> str:
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    if verb in {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}:
+        return verb.lower()
+    return "other"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Record per-statement execution time for an engine via cursor events.
+
+    Args:
+        engine: Sync engine (use ``async_engine.sync_engine`` for async engines)
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_STATEMENT_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get(_STATEMENT_START_KEY)
+        if starts:
+            db_statement_duration_seconds.observe(
+                time.perf_counter() - starts.pop(),
+                operation=_statement_operation(statement),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        starts = conn.info.get(_STATEMENT_START_KEY) if conn is not None else None
+        if starts:
+            starts.pop()
+
+
+def _route_template(app, scope) -> str:
+    """Resolve the route template for a request to keep label cardinality low."""
+    partial: Optional[str] = None
+    for route in getattr(app, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path
+    return partial or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route request counts, latency and
+    in-flight requests.
+
+    Latency is measured until the last body chunk is sent, so streaming
+    responses are timed end to end.
+    """
+
+    def __init__(self, app, router_app=None, route_cache_size: int = 4096):
+        self.app = app
+        self.router_app = router_app
+        # Route table matching is O(routes); most traffic repeats a few paths.
+        # Routes don't change at runtime, so entries never need to expire.
+        self._routes = TTLCache(maxsize=route_cache_size, ttl_seconds=math.inf)
+
+    def _route(self, scope) -> str:
+        key = (scope["method"], scope["path"])
+        route = self._routes.get(key)
+        if route is None:
+            route = _route_template(self.router_app or self.app, scope)
+            self._routes.set(key, route)
+        return route
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = self._route(scope)
+        status_holder = {"status": 500}
+        start = time.perf_counter()
+        http_requests_in_flight.inc(method=method, route=route)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder["status"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec(method=method, route=route)
+            http_request_duration_seconds.observe(
+                time.perf_counter() - start, method=method, route=route
+            )
+            http_requests_total.inc(
+                method=method, route=route, status=str(status_holder["status"])
+            )
@@ -0,0 +1,106 @@
+"""
+Database connection pool configuration and instrumentation.
+Shared by the local and Cloud SQL engine paths.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+
+
+class PoolWaitStats:
+    """Accumulates how long checkouts waited for a pooled connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "wait_seconds_total": round(self.total_wait_seconds, 6),
+                "wait_seconds_max": round(self.max_wait_seconds, 6),
+                "wait_seconds_avg": (
+                    round(self.total_wait_seconds / self.checkouts, 6)
+                    if self.checkouts
+                    else 0.0
+                ),
+            }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records checkout wait time.
+
+    The measured time covers queueing for a free slot as well as opening a
+    new connection when the pool grows (e.g. the Cloud SQL connector
+    handshake).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_stats.record(time.perf_counter() - start)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+
+def get_pool_kwargs() -> Dict[str, Any]:
+    """Get connection pool keyword arguments for a server-backed async engine."""
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_pre_ping": True,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+    }
+
+
+def get_pool_stats(pool) -> Dict[str, Any]:
+    """
+    Get live statistics for a connection pool.
+
+    Args:
+        pool: SQLAlchemy pool instance (``engine.pool``)
+
+    Returns:
+        Dict with pool sizing, usage and checkout wait statistics
+    """
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if hasattr(pool, "checkedout"):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        )
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        stats.update(wait_stats.snapshot())
+    return stats
@@ -0,0 +1,78 @@
+"""
+In-process cache of verified principals.
+Lets authenticated requests skip JWT re-decoding and the user lookup query.
+"""
+
+import hashlib
+import time
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.utils.cache import TTLCache
+
+
+def _token_key(token: str) -> str:
+    """Hash a bearer token so raw credentials are never kept in memory as keys."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class PrincipalCache:
+    """
+    Size-bounded TTL cache of authenticated users keyed by a hash of their token.
+
+    Entries never outlive the token's own expiry and can be invalidated
+    per token (sign out) or per user (profile update, account deletion).
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    def get(self, token: str) -> Optional[Any]:
+        """Return the cached principal for a token, if any."""
+        if not self._cache.enabled:
+            return None
+        return self._cache.get(_token_key(token))
+
+    def set(
+        self, token: str, principal: Any, expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Cache a verified principal.
+
+        Args:
+            token: Bearer token the principal was resolved from
+            principal: User object exposing an ``id`` attribute
+            expires_at: Token expiry as a UNIX timestamp (``exp`` claim)
+        """
+        ttl = None
+        if expires_at is not None:
+            ttl = float(expires_at) - time.time()
+            if ttl <= 0:
+                return
+        self._cache.set(_token_key(token), principal, ttl_seconds=ttl)
+
+    def invalidate_token(self, token: str) -> None:
+        """Forget the principal cached for a single token."""
+        self._cache.pop(_token_key(token))
+
+    def invalidate_user(self, user_id: Any) -> int:
+        """Forget every cached principal belonging to a user."""
+        user_id = str(user_id)
+        return self._cache.invalidate_where(
+            lambda _key, principal: str(getattr(principal, "id", "")) == user_id
+        )
+
+    def clear(self) -> None:
+        """Drop all cached principals."""
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """Return cache statistics."""
+        return self._cache.stats()
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache(
+    maxsize=settings.auth_cache_max_size,
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+)
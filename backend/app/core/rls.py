@@ -7,12 +7,22 @@ import logging
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import Connection, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Key under which the RLS user ID is tracked in session.info / connection.info
+# (absent from connection.info when the connection's context is unknown)
+RLS_USER_ID_KEY = "rls_user_id"
+
+# Execution option marking connections checked out by an RLSSession
+RLS_SESSION_OPTION = "rls_session"
+
+# Dialects that support app.current_user_id via set_config()
+RLS_DIALECTS = {"postgresql"}
+
 
 class AuthContextHandler:
     """
@@ -26,21 +36,58 @@ class AuthContextHandler:
         Set the current user context for the database session.
         This is used by RLS policies to determine data access permissions.
 
+        The user ID is bound to the session and applied when the session's
+        transaction checks out a connection, so this normally issues no
+        statement of its own.
+
         Args:
             session: Database session
             user_id: UUID of the current user
         """
         try:
-            # Set the user context in PostgreSQL session
-            await session.execute(
-                text("SELECT set_config('app.current_user_id', :user_id, true)"),
-                {"user_id": str(user_id)},
-            )
+            session.info[RLS_USER_ID_KEY] = str(user_id)
+            if session.in_transaction():
+                # Transaction already began: apply to its connection directly
+                await session.run_sync(
+                    lambda sync_session: AuthContextHandler.apply_to_connection(
+                        sync_session.connection(), str(user_id)
+                    )
+                )
             logger.debug(f"Set user context to {user_id}")
         except Exception as e:
             logger.error(f"Failed to set user context: {e}")
             raise
 
+    @staticmethod
+    def apply_to_connection(connection: Connection, user_id: str) -> bool:
+        """
+        Make the connection's RLS user context match ``user_id``.
+
+        The context is set at session level and remembered in
+        ``connection.info``, so a pooled connection only issues
+        ``set_config`` when the user it serves changes (or its context is
+        unknown, e.g. after a rollback). Sessions without a user clear a
+        stale context left by a previous checkout.
+
+        Args:
+            connection: Connection the transaction runs on
+            user_id: UUID string of the current user, or "" for none
+
+        Returns:
+            bool: Whether ``set_config`` was issued
+        """
+        if connection.dialect.name not in RLS_DIALECTS:
+            return False
+        if connection.info.get(RLS_USER_ID_KEY) == user_id:
+            return False
+
+        connection.execute(
+            text("SELECT set_config('app.current_user_id', :user_id, false)"),
+            {"user_id": user_id},
+        )
+        connection.info[RLS_USER_ID_KEY] = user_id
+        return True
+
     @staticmethod
     def set_current_user_sync(session: Session, user_id: UUID) -> None:
         """
@@ -119,9 +166,13 @@ class AuthContextHandler:
             session: Database session
         """
         try:
-            await session.execute(
-                text("SELECT set_config('app.current_user_id', '', true)")
-            )
+            session.info.pop(RLS_USER_ID_KEY, None)
+            if session.in_transaction():
+                await session.run_sync(
+                    lambda sync_session: AuthContextHandler.apply_to_connection(
+                        sync_session.connection(), ""
+                    )
+                )
             logger.debug("Cleared user context")
         except Exception as e:
             logger.error(f"Failed to clear user context: {e}")
@@ -4,7 +4,7 @@ Implements JWT token handling and password hashing following best practices.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -64,16 +64,16 @@ def create_refresh_token(subject: Union[str, int]) -> str:
     )
 
 
-def verify_token(token: str, token_type: str = "access") -> Optional[str]:
+def decode_token(token: str, token_type: str = "access") -> Optional[Dict[str, Any]]:
     """
-    Verify and decode a JWT token.
+    Verify and decode a JWT token, returning its full payload.
 
     Args:
         token: JWT token string
         token_type: Expected token type ("access" or "refresh")
 
     Returns:
-        Subject (user ID) if token is valid, None otherwise
+        Token payload if the token is valid and has a subject, None otherwise
     """
     try:
         payload = jwt.decode(
@@ -84,17 +84,31 @@ def verify_token(token: str, token_type: str = "access") -> Optional[str]:
         if payload.get("type") != token_type:
             return None
 
-        # Get subject (user ID)
-        subject = payload.get("sub")
-        if subject is None:
+        # Require a subject (user ID)
+        if payload.get("sub") is None:
             return None
 
-        return subject
+        return payload
 
     except (JWTError, ValidationError):
         return None
 
 
+def verify_token(token: str, token_type: str = "access") -> Optional[str]:
+    """
+    Verify and decode a JWT token.
+
+    Args:
+        token: JWT token string
+        token_type: Expected token type ("access" or "refresh")
+
+    Returns:
+        Subject (user ID) if token is valid, None otherwise
+    """
+    payload = decode_token(token, token_type)
+    return payload["sub"] if payload else None
+
+
 def get_password_hash(password: str) -> str:
     """
     Hash a password using bcrypt.
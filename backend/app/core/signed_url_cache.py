@@ -0,0 +1,128 @@
+"""
+Process-wide cache of signed GCS media URLs.
+Lets repeated media views across requests skip signing entirely.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, Optional, Set
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.metrics import signed_url_cache_requests_total
+from app.utils.cache import TTLCache
+
+# Never hand out a URL with less than this much validity left
+SAFETY_MARGIN_SECONDS = 300
+
+Signer = Callable[[str, int], Optional[str]]
+
+
+class SignedUrlCache:
+    """
+    Size-bounded cache of signed URLs keyed by storage path and expiry bucket.
+
+    The expiry bucket is the requested URL lifetime in hours, so a 1h and a
+    24h URL for the same object are cached separately. Entries are dropped
+    ``SAFETY_MARGIN_SECONDS`` before the URL itself expires; once an entry
+    is within ``refresh_ahead_seconds`` of that point it is still served,
+    but re-signed on a background thread so callers never wait on signing.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        refresh_ahead_seconds: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        # Per-entry TTLs are derived from each URL's lifetime
+        self._cache = TTLCache(maxsize=maxsize, ttl_seconds=float("inf"), timer=timer)
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self._refreshing: Set[Hashable] = set()
+        self._refreshing_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _key(storage_path: str, expiration_hours: int) -> Hashable:
+        return (storage_path, expiration_hours)
+
+    def get_or_sign(
+        self, storage_path: str, expiration_hours: int, signer: Signer
+    ) -> Optional[str]:
+        """
+        Return a cached signed URL, signing (and caching) it on a miss.
+
+        Args:
+            storage_path: Object path within the media bucket
+            expiration_hours: Requested URL lifetime (the expiry bucket)
+            signer: Callable ``(storage_path, expiration_hours)`` returning a
+                signed URL or None
+
+        Returns:
+            Optional[str]: Signed URL, or None if signing failed
+        """
+        key = self._key(storage_path, expiration_hours)
+        if self._cache.enabled:
+            cached = self._cache.get_with_expiry(key)
+            if cached is not None:
+                url, remaining = cached
+                if remaining <= self.refresh_ahead_seconds:
+                    signed_url_cache_requests_total.inc(result="refresh")
+                    self._refresh_in_background(storage_path, expiration_hours, signer)
+                else:
+                    signed_url_cache_requests_total.inc(result="hit")
+                return url
+
+        signed_url_cache_requests_total.inc(result="miss")
+        url = signer(storage_path, expiration_hours)
+        if url:
+            self.set(storage_path, expiration_hours, url)
+        return url
+
+    def set(self, storage_path: str, expiration_hours: int, url: str) -> None:
+        """Cache a URL that was just signed for ``expiration_hours``."""
+        ttl = expiration_hours * 3600 - SAFETY_MARGIN_SECONDS
+        self._cache.set(self._key(storage_path, expiration_hours), url, ttl)
+
+    def _refresh_in_background(
+        self, storage_path: str, expiration_hours: int, signer: Signer
+    ) -> None:
+        key = self._key(storage_path, expiration_hours)
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="signed-url-refresh"
+                )
+
+        def refresh() -> None:
+            try:
+                url = signer(storage_path, expiration_hours)
+                if url:
+                    self.set(storage_path, expiration_hours, url)
+            except Exception as e:
+                logger.warning(f"Background re-signing of {storage_path} failed: {e}")
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(refresh)
+
+    def invalidate_path(self, storage_path: str) -> int:
+        """Forget every cached URL for an object (e.g. after deleting it)."""
+        return self._cache.invalidate_where(lambda key, _url: key[0] == storage_path)
+
+    def clear(self) -> None:
+        """Drop all cached URLs."""
+        self._cache.clear()
+
+
+# Global signed URL cache instance
+signed_url_cache = SignedUrlCache(
+    maxsize=settings.signed_url_cache_max_size,
+    refresh_ahead_seconds=settings.signed_url_refresh_ahead_seconds,
+)
@@ -0,0 +1,48 @@
+"""
+Startup helpers for fast cold starts.
+Heavy SDKs are imported on first use; these helpers preload them after the
+app is ready so early requests rarely pay the import cost themselves.
+"""
+
+import importlib
+import threading
+import time
+
+from loguru import logger
+
+# Modules deferred out of the import path of app.main
+DEFERRED_MODULES = (
+    "pydantic_ai",
+    "app.services.instrumented_model",
+    "app.services.post_generator",
+    "google.cloud.storage",
+    "google.cloud.iam_credentials_v1",
+    "google.cloud.scheduler_v1",
+    "google.oauth2.id_token",
+    "supabase",
+)
+
+
+def preload_deferred_modules() -> None:
+    """Import the deferred modules, logging (not raising) failures."""
+    start = time.perf_counter()
+    for name in DEFERRED_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logger.warning(f"Could not preload {name}: {e}")
+    logger.info(f"Preloaded deferred modules in {time.perf_counter() - start:.2f}s")
+
+
+def start_background_preload() -> threading.Thread:
+    """
+    Preload the deferred modules on a daemon thread.
+
+    Returns:
+        threading.Thread: The started thread
+    """
+    thread = threading.Thread(
+        target=preload_deferred_modules, name="module-preload", daemon=True
+    )
+    thread.start()
+    return thread
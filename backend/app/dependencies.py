@@ -8,8 +8,9 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_db, get_sync_db
+from app.core.principal_cache import principal_cache
 from app.core.rls import AuthContextHandler
-from app.core.security import verify_token
+from app.core.security import decode_token, verify_token
 from app.schemas.auth import UserResponse
 from app.services.auth import AuthService
 
@@ -79,9 +80,17 @@ async def get_current_user_with_rls(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    token = credentials.credentials
+
+    # Steady state: the verified principal is cached, skip decode and lookup
+    cached_user = principal_cache.get(token)
+    if cached_user is not None:
+        await AuthContextHandler.set_current_user(db, cached_user.id)
+        return cached_user
+
     # Verify token and get user ID
-    user_id = verify_token(credentials.credentials)
-    if not user_id:
+    payload = decode_token(token)
+    if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token",
@@ -89,11 +98,11 @@ async def get_current_user_with_rls(
         )
 
     # Set RLS context for this session
-    await AuthContextHandler.set_current_user(db, user_id)
+    await AuthContextHandler.set_current_user(db, payload["sub"])
 
-    # Get user information
+    # Get user information (cached for subsequent requests)
     auth_service = AuthService(db)
-    user = await auth_service.get_current_user(credentials.credentials)
+    user = await auth_service.get_principal(token, payload)
 
     if not user:
         raise HTTPException(
@@ -130,8 +139,9 @@ async def get_db_with_rls_context(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Verify token and get user ID
-    user_id = verify_token(credentials.credentials)
+    # Verify token and get user ID (reuse a cached principal when available)
+    cached_user = principal_cache.get(credentials.credentials)
+    user_id = cached_user.id if cached_user else verify_token(credentials.credentials)
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -10,19 +10,35 @@ import uvicorn
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from loguru import logger
 
 from app.core.config import settings
-from app.core.database import close_db, init_db
+from app.core.database import close_db, init_db, warm_up_pool
+from app.core.logging_config import (
+    add_background_sink,
+    count_request_log,
+    rotating_file_writer,
+    stop_background_sinks,
+    stream_writer,
+)
+from app.core.metrics import CONTENT_TYPE_LATEST, MetricsMiddleware, registry
+from app.core.middleware import RequestContextMiddleware
+from app.core.startup import preload_deferred_modules, start_background_preload
 from app.routers import auth, chat, idea_bank, onboarding, profile, posts, schedules
+from app.services.model_config import model_config
+from app.services.posts import PostsService
 
 
 # Configure logging
 def configure_logging():
     """Configure structured logging with Loguru."""
-    # Remove default handler
+    # Remove default handler (and any background sinks from a previous call)
     logger.remove()
+    stop_background_sinks()
+
+    # Count records per request for the log-volume metric
+    logger.configure(patcher=count_request_log)
 
     # Use plain text for development, JSON for other environments
     if settings.environment == "development":
@@ -31,22 +47,43 @@ def configure_logging():
             level=settings.log_level,
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         )
-    else:
+        return
+
+    line_format = (
+        "{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
+    )
+
+    if not settings.log_async:
         logger.add(
-            sys.stdout,
-            level=settings.log_level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}",
-            serialize=True,
+            sys.stdout, level=settings.log_level, format=line_format, serialize=True
         )
+        if settings.environment == "production":
+            logger.add(
+                "logs/app.log",
+                rotation="1 day",
+                retention="30 days",
+                level="INFO",
+                format=line_format,
+                serialize=True,
+            )
+        return
+
+    # Serialize and write on background threads, off the event loop
+    add_background_sink(
+        logger,
+        [stream_writer(sys.stdout)],
+        level=settings.log_level,
+        format=line_format,
+        serialize=True,
+    )
 
     # Add file logging for production
     if settings.environment == "production":
-        logger.add(
-            "logs/app.log",
-            rotation="1 day",
-            retention="30 days",
+        add_background_sink(
+            logger,
+            [rotating_file_writer("logs/app.log", backup_days=30)],
             level="INFO",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}",
+            format=line_format,
             serialize=True,
         )
 
@@ -66,6 +103,22 @@ async def lifespan(app: FastAPI):
         await init_db()
         logger.info("Database initialized successfully")
 
+        # Pre-open pooled connections so first requests skip connection setup
+        if settings.db_pool_warmup_connections > 0:
+            try:
+                await warm_up_pool(settings.db_pool_warmup_connections)
+            except Exception as e:
+                logger.warning(f"Database pool warm-up failed: {e}")
+
+        # Discover GCS credentials on a worker thread; readiness is on /health
+        PostsService.start_credentials_bootstrap()
+
+        # Heavy SDKs are imported on first use; load them ahead of that
+        if settings.fast_startup:
+            start_background_preload()
+        else:
+            preload_deferred_modules()
+
         yield
 
     except Exception as e:
@@ -76,6 +129,8 @@ async def lifespan(app: FastAPI):
         logger.info("Shutting down...")
         await close_db()
         logger.info("Database connections closed")
+        await model_config.aclose()
+        stop_background_sinks()
 
 
 # Create FastAPI app
@@ -100,6 +155,12 @@ app.add_middleware(
     max_age=600,  # Cache preflight requests for 10 minutes
 )
 
+# Per-route request metrics
+app.add_middleware(MetricsMiddleware, router_app=app)
+
+# Request logging and security headers
+app.add_middleware(RequestContextMiddleware)
+
 
 # Custom exception handlers
 @app.exception_handler(RequestValidationError)
@@ -163,77 +224,6 @@ async def general_exception_handler(request: Request, exc: Exception):
         )
 
 
-# Middleware for request logging
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests for audit purposes."""
-    # start_time = logger.bind(time=True)
-
-    # Get client IP (handle reverse proxy headers)
-    client_ip = (
-        request.headers.get("x-forwarded-for", "").split(",")[0].strip()
-        or request.headers.get("x-real-ip", "")
-        or request.client.host
-        if request.client
-        else "unknown"
-    )
-
-    # Special logging for OPTIONS requests that are failing
-    if request.method == "OPTIONS" and "signin/google" in str(request.url):
-        headers_dict = dict(request.headers)
-        logger.info(
-            "OPTIONS request headers for signin/google",
-            extra={
-                "method": request.method,
-                "url": str(request.url),
-                "headers": headers_dict,
-            },
-        )
-
-    # Log request
-    logger.info(
-        f"Request: {request.method} {request.url} from {client_ip}",
-        extra={
-            "method": request.method,
-            "url": str(request.url),
-            "client_ip": client_ip,
-            "user_agent": request.headers.get("user-agent", ""),
-        },
-    )
-
-    # Process request
-    response = await call_next(request)
-
-    # Log response
-    logger.info(
-        f"Response: {response.status_code} for {request.method} {request.url}",
-        extra={
-            "status_code": response.status_code,
-            "method": request.method,
-            "url": str(request.url),
-        },
-    )
-
-    return response
-
-
-# Security headers middleware
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    """Add security headers to all responses."""
-    response = await call_next(request)
-
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers[
-        "Strict-Transport-Security"
-    ] = "max-age=31536000; includeSubDomains"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-    return response
-
-
 # Include routers
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(profile.router, prefix="/api/v1")
@@ -294,25 +284,22 @@ async def options_handler(request: Request):
 @app.get("/health")
 async def health_check():
     """Health check endpoint for load balancers and monitoring."""
+    components = {"gcs_credentials": PostsService.credentials_status()}
     return {
-        "status": "healthy",
+        "status": "degraded" if "failed" in components.values() else "healthy",
+        "ready": all(state in ("ready", "disabled") for state in components.values()),
+        "components": components,
         "version": settings.app_version,
         "environment": settings.environment,
         "timestamp": "2024-01-01T00:00:00Z",
     }
 
 
-# Metrics endpoint (basic implementation)
-# In a production environment, integrate with Prometheus or similar
+# Metrics endpoint in Prometheus text exposition format
 @app.get("/metrics")
 async def metrics():
-    """Basic metrics endpoint for monitoring."""
-    return {
-        "app": settings.app_name,
-        "version": settings.app_version,
-        "status": "up",
-        "environment": settings.environment,
-    }
+    """Expose request, database, LLM and streaming metrics for scraping."""
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE_LATEST)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from .content_strategies import ContentStrategy
 from .idea_bank import IdeaBank
+from .llm_response_cache import LLMResponseCacheEntry
 from .onboarding import UserOnboarding
 from .profile import SocialConnection, UserPreferences, WritingStyleAnalysis
 from .posts import Post
@@ -25,4 +26,5 @@ __all__ = [
 ]
 __all__ += [
     "DailySuggestionSchedule",
+    "LLMResponseCacheEntry",
 ]
@@ -7,6 +7,9 @@ from uuid import UUID
 
 from sqlalchemy import JSON, String, Text, VARCHAR
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PostgreSQLUUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ColumnElement, FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
 from sqlalchemy.types import TypeDecorator
 
 
@@ -116,3 +119,46 @@ class UUIDType(TypeDecorator):
             return value
         else:
             return UUID(value) if value else None
+
+
+class json_field_text(FunctionElement):
+    """
+    Top-level JSON field as text: ``data ->> 'key'`` in PostgreSQL and
+    ``json_extract`` elsewhere (SQLite).
+
+    The key is rendered as a literal so PostgreSQL can match expression
+    indexes on the same expression. On SQLite, JSONType stores documents
+    as an encoded JSON string, so the outer ``json_extract(data, '$')``
+    unwraps it first, and JSON booleans are rendered as ``'true'``/
+    ``'false'`` as in PostgreSQL (``json_extract`` alone returns 1/0).
+    """
+
+    type = String()
+    inherit_cache = True
+    # Include the key in the statement cache key
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ("key", InternalTraversal.dp_string)
+    ]
+
+    def __init__(self, column: ColumnElement, key: str):
+        self.key = key
+        super().__init__(column)
+
+
+@compiles(json_field_text, "postgresql")
+def _compile_json_field_text_pg(element, compiler, **kw):
+    column = compiler.process(list(element.clauses)[0], **kw)
+    key = compiler.render_literal_value(element.key, String())
+    return f"({column} ->> {key})"
+
+
+@compiles(json_field_text)
+def _compile_json_field_text(element, compiler, **kw):
+    column = compiler.process(list(element.clauses)[0], **kw)
+    path = compiler.render_literal_value(f"$.{element.key}", String())
+    document = f"json_extract({column}, '$')"
+    return (
+        f"CASE json_type({document}, {path}) "
+        f"WHEN 'true' THEN 'true' WHEN 'false' THEN 'false' "
+        f"ELSE json_extract({document}, {path}) END"
+    )
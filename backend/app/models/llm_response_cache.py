@@ -0,0 +1,33 @@
+"""
+LLMResponseCacheEntry model for the shared, content-addressed LLM response cache.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class LLMResponseCacheEntry(Base):
+    """Model for llm_response_cache table."""
+
+    __tablename__ = "llm_response_cache"
+
+    # SHA-256 of the model, its settings and the rendered prompt
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model: Mapped[str] = mapped_column(Text, nullable=False)
+    # Serialized structured output (JSON)
+    response: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LLMResponseCacheEntry {self.key} ({self.model}) until {self.expires_at}>"
+        )
@@ -2,6 +2,7 @@
 API endpoints for chat functionality.
 """
 
+import time
 from uuid import UUID
 from typing import Optional
 
@@ -9,8 +10,11 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTasks
 
 from app.core.database import get_async_db
+from app.core.llm_scheduler import INTERACTIVE, llm_scheduler
+from app.core.metrics import sse_stream_duration_seconds
 from app.models.user import User
 from app.dependencies import get_current_user_with_rls as get_current_user
 from app.schemas.chat import (
@@ -104,11 +108,35 @@ async def stream_chat(
 ):
     """Handle a streaming chat request."""
     chat_service = ChatService(db)
+    # Admit before streaming so saturation surfaces as 429/503, not a broken stream
+    ticket = await llm_scheduler.acquire(user.id, INTERACTIVE)
 
     async def generate():
-        async for response in chat_service.stream_chat_response(
-            user, chat_request.conversation_id, chat_request.messages
-        ):
-            yield f"data: {response.model_dump_json()}\n\n"
-
-    return StreamingResponse(generate(), media_type="text/event-stream")
+        started = time.perf_counter()
+        outcome = "disconnected"
+        try:
+            async for response in chat_service.stream_chat_response(
+                user,
+                chat_request.conversation_id,
+                chat_request.messages,
+                regenerate=chat_request.regenerate,
+            ):
+                yield f"data: {response.model_dump_json()}\n\n"
+            outcome = "completed"
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            sse_stream_duration_seconds.observe(
+                time.perf_counter() - started, stream="chat", outcome=outcome
+            )
+            llm_scheduler.release(ticket)
+
+    # Run once the stream has closed: release the slot (also covering streams
+    # closed before the generator started), then update the history summary
+    after_stream = BackgroundTasks()
+    after_stream.add_task(llm_scheduler.release, ticket)
+    after_stream.add_task(chat_service.summarize_finished_turn)
+    return StreamingResponse(
+        generate(), media_type="text/event-stream", background=after_stream
+    )
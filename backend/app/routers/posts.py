@@ -20,6 +20,7 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_db
+from app.core.llm_scheduler import STANDARD, LLMAdmissionError, llm_scheduler
 from app.dependencies import get_current_user_with_rls as get_current_user
 from app.schemas.auth import UserResponse
 from app.schemas.posts import (
@@ -40,6 +41,7 @@ from app.services.posts import PostsService
 from app.services.post_schedule import PostScheduleService
 from app.core.config import settings
 from app.utils.gcp import trigger_gcp_cloud_run
+from app.utils.pagination import InvalidCursorError
 from app.services.image_gen_service import ImageGenService
 
 # Create router
@@ -56,10 +58,20 @@ async def get_posts(
     size: int = Query(20, ge=1, le=100),
     order_by: str = Query("created_at"),
     order_direction: str = Query("desc", pattern="^(asc|desc)$"),
+    include_media: bool = Query(False),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+    cursor: Optional[str] = Query(None),
+    include_total: Optional[bool] = Query(None),
     current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db),
 ):
-    """Get posts with filtering and pagination."""
+    """
+    Get posts with filtering and pagination.
+
+    Set ``include_media`` to embed signed media URLs for every post on the page.
+    With ``pagination=cursor``, pass the returned ``next_cursor`` to fetch the
+    next page; the total is only included when ``include_total`` is true.
+    """
     try:
         service = PostsService(db)
         result = await service.get_posts_list(
@@ -72,8 +84,14 @@ async def get_posts(
             size=size,
             order_by=order_by,
             order_direction=order_direction,
+            include_signed_media=include_media,
+            paginate_by_cursor=pagination == "cursor",
+            cursor=cursor,
+            include_total=include_total,
         )
         return PostListResponse(**result)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting posts: {e}")
         raise HTTPException(
@@ -542,10 +560,13 @@ async def generate_image_prompt(
     """Generate an image prompt for a post."""
     try:
         service = ImageGenService()
-        result = await service.generate_image_prompt(
-            postContent.postContent, current_user.id, db
-        )
+        async with llm_scheduler.slot(current_user.id, STANDARD):
+            result = await service.generate_image_prompt(
+                postContent.postContent, current_user.id, db
+            )
         return ImagePromptResponse(imagePrompt=result.output)
+    except LLMAdmissionError:
+        raise
     except Exception as e:
         logger.error(
             f"Error generating image prompt for post {postContent.postContent}: {e}"
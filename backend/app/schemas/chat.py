@@ -84,8 +84,9 @@ class ChatRequest(BaseModel):
 class ChatStreamResponse(BaseModel):
     """Schema for streaming chat responses."""
 
-    type: Literal["message", "tool_output", "error", "end"] = Field(
-        ..., description="Response type: message, tool_output, error, or end"
+    type: Literal["message", "tool_output", "error", "heartbeat", "end"] = Field(
+        ...,
+        description="Response type: message, tool_output, error, heartbeat, or end",
     )
     content: Optional[str] = Field(None, description="The response content")
     tool_name: Optional[str] = Field(None, description="The name of the tool used")
@@ -139,3 +140,7 @@ class StreamChatRequest(BaseModel):
     messages: List[ChatMessage] = Field(
         ..., description="The history of messages in the conversation"
     )
+    regenerate: bool = Field(
+        default=False,
+        description="Generate a fresh post instead of reusing a cached one",
+    )
@@ -112,13 +112,18 @@ class PostFeedback(BaseModel):
 
 
 class PostListResponse(BaseModel):
-    """Schema for a list of posts with pagination info."""
+    """Schema for a list of posts with pagination info.
+
+    In cursor mode ``page`` is None, ``total``/``total_pages`` are None unless
+    requested, and ``next_cursor`` fetches the following page (None when done).
+    """
 
     items: List[PostResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class PostBatchItem(PostUpdate):
@@ -27,9 +27,11 @@ from app.schemas.auth import (
 from app.core.security import (
     create_access_token,
     create_refresh_token,
+    decode_token,
     verify_token,
 )
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
 from app.utils.supabase import supabase_client
 
 
@@ -158,6 +160,7 @@ class AuthService:
                 local_user.updated_at = datetime.now(timezone.utc)
                 await self.db.commit()
                 await self.db.refresh(local_user)
+                principal_cache.invalidate_user(local_user.id)
 
             # 4. Create or update SocialConnection
             stmt = select(SocialConnection).where(
@@ -345,6 +348,7 @@ class AuthService:
             logger.info(f"Deleted user object for user_id: {user_id}")
 
             await self.db.commit()
+            principal_cache.invalidate_user(user_id)
             logger.info(f"Successfully deleted account for user_id: {user_id}")
             return {"success": True, "error": None}
 
@@ -371,6 +375,7 @@ class AuthService:
 
             # Revoke session in database
             await self._revoke_session_by_token(access_token)
+            principal_cache.invalidate_token(access_token)
 
             # Sign out from Supabase
             await supabase_client.sign_out(access_token)
@@ -431,6 +436,9 @@ class AuthService:
         """
         Get current user from access token.
 
+        Verified principals are served from the in-process principal cache;
+        the token is only decoded and the user only loaded on a cache miss.
+
         Args:
             access_token: User's access token
 
@@ -438,20 +446,45 @@ class AuthService:
             User information if token is valid
         """
         try:
-            user_id = verify_token(access_token)
-            if not user_id:
-                return None
+            cached_user = principal_cache.get(access_token)
+            if cached_user is not None:
+                return cached_user
 
-            user = await self._get_user_by_id(user_id)
-            if not user or not user.is_active:
+            payload = decode_token(access_token)
+            if not payload:
                 return None
 
-            return UserResponse.model_validate({**user.__dict__, "id": str(user.id)})
+            return await self.get_principal(access_token, payload)
 
         except Exception as e:
             logger.error(f"Get current user failed: {e}")
             return None
 
+    async def get_principal(
+        self, access_token: str, payload: Dict[str, Any]
+    ) -> Optional[UserResponse]:
+        """
+        Load the user for an already-verified token payload and cache it.
+
+        Args:
+            access_token: The access token the payload was decoded from
+            payload: Decoded token payload (see ``decode_token``)
+
+        Returns:
+            User information if the user exists and is active
+        """
+        user = await self._get_user_by_id(payload["sub"])
+        if not user or not user.is_active:
+            return None
+
+        user_response = UserResponse.model_validate(
+            {**user.__dict__, "id": str(user.id)}
+        )
+        principal_cache.set(
+            access_token, user_response, expires_at=payload.get("exp")
+        )
+        return user_response
+
     async def update_user(
         self, user_id: str, user_data: UserUpdate
     ) -> Optional[UserResponse]:
@@ -481,6 +514,7 @@ class AuthService:
             user.updated_at = datetime.utcnow()
             await self.db.commit()
             await self.db.refresh(user)
+            principal_cache.invalidate_user(user_id)
 
             logger.info(f"User profile updated successfully: {user_id}")
             return UserResponse.model_validate({**user.__dict__, "id": str(user.id)})
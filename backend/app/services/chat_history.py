@@ -0,0 +1,267 @@
+"""
+Token-budgeted conversation history for chat.
+
+Only the newest turns that fit a token budget are replayed to the model;
+older turns are folded into a rolling summary stored on the conversation.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.llm_scheduler import BACKGROUND, llm_scheduler
+from app.core.rls import AuthContextHandler
+from app.models.chat import Conversation, Message
+from app.schemas.chat import ChatMessage
+from app.services.model_config import model_config
+
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
+# Rough characters per token; avoids shipping a tokenizer for estimates
+CHARS_PER_TOKEN = 4
+
+# Key of the rolling summary in Conversation.context
+SUMMARY_CONTEXT_KEY = "history_summary"
+
+SUMMARY_INSTRUCTIONS = """
+You maintain a running summary of a conversation between a user and a LinkedIn
+content assistant. Merge the new messages into the existing summary. Keep the
+user's stated perspective, experiences, preferences and feedback, decisions
+made and the latest draft's key points. Drop greetings and filler. Write plain
+prose, at most {max_words} words. Output only the summary.
+"""
+
+
+@lru_cache(maxsize=4)
+def _get_summary_agent(max_words: int) -> Agent:
+    """Get the shared summariser agent; the model is supplied per run."""
+    from pydantic_ai import Agent
+
+    return Agent(
+        output_type=str,
+        instructions=SUMMARY_INSTRUCTIONS.format(max_words=max_words),
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` (about four characters per token)."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def compact_message_content(role: str, content: str) -> str:
+    """Reduce a persisted tool output to the generated post text."""
+    if role != "tool":
+        return content
+    try:
+        parsed = json.loads(content)
+    except json.JSONDecodeError:
+        return content
+    if isinstance(parsed, dict) and "linkedin_post" in parsed:
+        return parsed["linkedin_post"]
+    return content
+
+
+@dataclass
+class HistoryWindow:
+    """The part of a conversation replayed to the model on this turn."""
+
+    messages: List[ChatMessage]
+    summary: Optional[str]
+    # Position of the first kept message among all persisted messages
+    first_kept: int
+    # Number of oldest messages the summary already covers
+    summarized: int
+
+    @property
+    def unsummarized(self) -> int:
+        """Dropped messages the summary does not cover yet."""
+        return max(self.first_kept - self.summarized, 0)
+
+    def chat_messages(self) -> List[ChatMessage]:
+        """Window as chat messages, led by the summary as a system message."""
+        if not self.summary:
+            return list(self.messages)
+        return [ChatMessage(role="system", content=self.summary), *self.messages]
+
+
+class ChatHistoryService:
+    """Builds token-budgeted history windows and maintains rolling summaries."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def load_window(self, conversation: Conversation) -> HistoryWindow:
+        """
+        Load the newest persisted messages that fit the token budget.
+
+        At most ``chat_history_max_messages`` rows are read. Walking back
+        from the newest, messages are kept while they fit in
+        ``chat_history_token_budget`` (the newest is always kept).
+
+        Args:
+            conversation: Conversation to load history for
+
+        Returns:
+            HistoryWindow: Kept messages plus the stored rolling summary
+        """
+        total_result = await self.db.execute(
+            select(func.count())
+            .select_from(Message)
+            .where(Message.conversation_id == conversation.id)
+        )
+        total = total_result.scalar() or 0
+
+        tail_result = await self.db.execute(
+            select(Message.role, Message.content)
+            .where(Message.conversation_id == conversation.id)
+            .order_by(desc(Message.created_at), desc(Message.id))
+            .limit(settings.chat_history_max_messages)
+        )
+        kept: List[ChatMessage] = []
+        used_tokens = 0
+        for role, content in tail_result.all():
+            content = compact_message_content(role, content)
+            tokens = estimate_tokens(content)
+            if kept and used_tokens + tokens > settings.chat_history_token_budget:
+                break
+            kept.append(ChatMessage(role=role, content=content))
+            used_tokens += tokens
+        kept.reverse()
+
+        first_kept = total - len(kept)
+        state = (conversation.context or {}).get(SUMMARY_CONTEXT_KEY) or {}
+        summarized = min(int(state.get("message_count", 0)), first_kept)
+        return HistoryWindow(
+            messages=kept,
+            summary=state.get("text") if summarized else None,
+            first_kept=first_kept,
+            summarized=summarized,
+        )
+
+    @staticmethod
+    def needs_summary(window: HistoryWindow) -> bool:
+        """Whether enough messages left ``window`` to update the summary."""
+        return window.unsummarized >= max(settings.chat_history_summary_batch, 1)
+
+    async def refresh_summary(
+        self, conversation: Conversation, window: HistoryWindow
+    ) -> bool:
+        """
+        Fold messages that fell out of ``window`` into the rolling summary.
+
+        Runs only once at least ``chat_history_summary_batch`` dropped
+        messages are uncovered, so the summariser is called every few turns.
+        Each call folds the oldest uncovered messages that fit in
+        ``chat_history_summary_max_tokens`` (at least one, and at most
+        ``chat_history_max_messages``), so a long conversation's backlog is
+        caught up over several turns rather than sent in one call.
+
+        Args:
+            conversation: Conversation the window was loaded for
+            window: Window returned by ``load_window`` on this turn
+
+        Returns:
+            bool: Whether the summary was updated
+        """
+        if not self.needs_summary(window):
+            return False
+
+        result = await self.db.execute(
+            select(Message.role, Message.content)
+            .where(Message.conversation_id == conversation.id)
+            .order_by(Message.created_at, Message.id)
+            .offset(window.summarized)
+            .limit(min(window.unsummarized, settings.chat_history_max_messages))
+        )
+        lines: List[str] = []
+        used_tokens = 0
+        for role, content in result.all():
+            line = f"{role.upper()}: {compact_message_content(role, content)}"
+            tokens = estimate_tokens(line)
+            if (
+                lines
+                and used_tokens + tokens > settings.chat_history_summary_max_tokens
+            ):
+                break
+            lines.append(line)
+            used_tokens += tokens
+        summary = await self._summarize(window.summary, "\n\n".join(lines))
+        if not summary:
+            return False
+
+        conversation.context = {
+            **(conversation.context or {}),
+            SUMMARY_CONTEXT_KEY: {
+                "text": summary,
+                "message_count": window.summarized + len(lines),
+            },
+        }
+        await self.db.commit()
+        return True
+
+    async def _summarize(self, previous: Optional[str], transcript: str) -> str:
+        """Merge ``transcript`` into ``previous`` with the chat model."""
+        agent = _get_summary_agent(settings.chat_history_token_budget // 8)
+        prompt = (
+            f"EXISTING SUMMARY:\n{previous or 'None yet'}\n\n"
+            f"NEW MESSAGES:\n{transcript}"
+        )
+        try:
+            result = await agent.run(
+                prompt,
+                model=model_config.get_chat_model(),
+                model_settings=model_config.get_chat_model_settings(),
+            )
+        except Exception as e:
+            logger.warning(f"Could not update conversation summary: {e}")
+            return ""
+        return result.output.strip()
+
+
+async def refresh_summary_after_turn(
+    conversation_id: UUID, user_id: UUID, window: HistoryWindow
+) -> bool:
+    """
+    Update a conversation's rolling summary once its chat turn has finished.
+
+    Runs after the response (e.g. as a background task), so it uses its own
+    session, and only if a background LLM slot is free right away; otherwise
+    the summary is caught up on a later turn.
+
+    Args:
+        conversation_id: Conversation the window was loaded for
+        user_id: Owner of the conversation (RLS context and LLM admission)
+        window: Window loaded on the finished turn
+
+    Returns:
+        bool: Whether the summary was updated
+    """
+    from app.core.database import get_async_session_local
+
+    ticket = llm_scheduler.try_acquire(user_id, BACKGROUND)
+    if ticket is None:
+        logger.info(f"Deferring summary of conversation {conversation_id}: busy")
+        return False
+    try:
+        async with get_async_session_local()() as session:
+            await AuthContextHandler.set_current_user(session, user_id)
+            conversation = await session.get(Conversation, conversation_id)
+            if conversation is None:
+                return False
+            service = ChatHistoryService(session)
+            return await service.refresh_summary(conversation, window)
+    except Exception as e:
+        logger.warning(f"Conversation summary refresh failed: {e}")
+        return False
+    finally:
+        llm_scheduler.release(ticket)
@@ -2,41 +2,154 @@
 Chat service for handling conversations and messages.
 """
 
+from __future__ import annotations
+
 import json
-from typing import List, AsyncGenerator, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, AsyncGenerator, Optional
 from uuid import UUID
 from loguru import logger
 from pydantic import BaseModel
-from pydantic_ai import Agent
-
-from pydantic_ai.messages import (
-    TextPart,
-    ModelMessage,
-    ModelRequest,
-    ModelResponse,
-    UserPromptPart,
-    ToolReturnPart,
-)
-from sqlalchemy import select
+from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
 from app.models.chat import Conversation, Message
 from app.models.idea_bank import IdeaBank
-from app.models.profile import UserPreferences, WritingStyleAnalysis
-from app.models.content_strategies import ContentStrategy
 from app.models.user import User
 from app.schemas.chat import (
     ConversationCreate,
     ChatStreamResponse,
     ChatMessage,
 )
-from app.services.post_generator import (
-    generate_linkedin_post_tool,
-    revise_linkedin_post_tool,
-    PostGenerationContext,
+from app.services.chat_history import (
+    ChatHistoryService,
+    HistoryWindow,
+    compact_message_content,
+    refresh_summary_after_turn,
 )
 from app.services.model_config import model_config
+from app.services.user_context import UserContextService
+from app.utils.streaming import coalesce_deltas
+
+if TYPE_CHECKING:
+    # pydantic_ai (and post_generator, which needs it) are imported on first use
+    from pydantic_ai import Agent, RunContext
+    from pydantic_ai.messages import ModelMessage
+
+    from app.services.post_generator import PostGenerationContext
+
+
+# Static agent instructions. They are byte-identical across users and turns so
+# providers can cache them as a prompt prefix; per-user data is appended after
+# them by _context_instructions.
+GENERATION_INSTRUCTIONS = """
+You are a LinkedIn content strategist. Your job is to help users create LinkedIn posts.
+The post idea, the user's profile and the conversation history are given under CONTEXT below.
+
+INSTRUCTIONS:
+1. When a user wants to create a LinkedIn post, ask 1-3 questions to understand their perspective, personal experiences, or key message they want to convey.
+
+2. After getting their input, use the 'generate_linkedin_post_tool' to create their post.
+   The tool has access to all the user information automatically - you don't need to pass any parameters.
+
+3. Don't have long conversations - after 1-3 exchanges, generate the post.
+
+Example flow:
+- User: "Help me create a post about this article"
+- You: "What's your main takeaway from this? Any personal experience related to it?"
+- User: [provides their perspective]
+- You: [call generate_linkedin_post_tool - no parameters needed]
+"""
+
+REVISION_INSTRUCTIONS = """
+You are an expert LinkedIn content strategist helping users refine their posts through conversation.
+Your role is to understand what the user wants to change and either engage them in discussion or use the 'revise_linkedin_post_tool' when you have clear direction.
+The original post idea, the user's profile, the previous draft, the user's latest request and the conversation history are given under CONTEXT below.
+
+REVISION APPROACH:
+1. **Understand the request**: If the user's feedback is clear and specific (like "make it shorter", "add more emotion", "remove the question"), use the revise_linkedin_post_tool immediately.
+   The tool has access to all the user information and previous draft automatically - you don't need to pass any parameters.
+
+2. **Engage when unclear**: If the feedback is vague (like "make it better", "I don't like it"), ask clarifying questions to understand:
+   - What specifically they want to change
+   - What they liked or didn't like about the current version
+   - What tone or approach they prefer
+   - Any specific elements they want added or removed
+
+3. **Reference conversation history**: Use the conversation context to understand their preferences and previous feedback.
+
+4. **Be conversational**: Keep the tone collaborative and helpful. You're working together to refine their post.
+"""
+
+POST_EDITING_INSTRUCTIONS = """
+You are an expert LinkedIn content strategist helping users edit and improve their existing posts through conversation.
+Your role is to understand what the user wants to change about their post and use the 'revise_linkedin_post_tool' to create an improved version.
+The current post content, the user's profile and the conversation history are given under CONTEXT below.
+
+INSTRUCTIONS:
+1. **Understand the edit request**: Listen carefully to what the user wants to change about their existing post.
+
+2. **Use the revise_linkedin_post_tool**: When you have a clear understanding of the changes needed, use this tool to create an improved version of the post.
+
+3. **Maintain the user's voice**: Keep their writing style and tone while making the requested improvements.
+
+4. **Be conversational**: Engage with the user to clarify their needs if the request is unclear.
+
+5. **Focus on improvement**: Make the post more engaging, clear, or aligned with their goals while respecting their original intent.
+"""
+
+
+async def _context_instructions(ctx: RunContext[PostGenerationContext]) -> str:
+    """Per-user, per-turn context appended after the static instructions."""
+    deps = ctx.deps
+    if deps is None:
+        return ""
+
+    # Post editing revises the current post, passed as both idea and draft
+    if deps.previous_draft is not None and deps.previous_draft == deps.idea_content:
+        lines = [f"- Current Post Content: {deps.idea_content}"]
+    else:
+        lines = [f"- Post Idea: {deps.idea_content}"]
+        if deps.previous_draft:
+            lines.append(f"- Previous Draft: {deps.previous_draft}")
+    lines += [
+        f"- User Bio: {deps.bio}",
+        f"- User Writing Style: {deps.writing_style}",
+        f"- User LinkedIn Strategy: {deps.linkedin_post_strategy}",
+    ]
+    if deps.user_feedback:
+        lines.append(f"- User's Latest Request: {deps.user_feedback}")
+    lines.append(
+        "- Conversation History: "
+        f"{deps.conversation_context or 'No previous conversation'}"
+    )
+    return "CONTEXT:\n" + "\n".join(lines)
+
+
+@lru_cache(maxsize=16)
+def _get_chat_agent(instructions: str) -> Agent:
+    """
+    Get the chat agent for a static instructions template.
+
+    Agents are built once per template and reused across requests; the model
+    and its settings are supplied per run.
+    """
+    from pydantic_ai import Agent
+
+    from app.services.post_generator import (
+        PostGenerationContext,
+        generate_linkedin_post_tool,
+        revise_linkedin_post_tool,
+    )
+
+    return Agent[PostGenerationContext, str](
+        tools=[generate_linkedin_post_tool, revise_linkedin_post_tool],
+        output_type=str,
+        instructions=[instructions, _context_instructions],
+        retries=2,  # Built-in retry mechanism for agent failures
+    )
 
 
 class ChatService:
@@ -49,33 +162,18 @@ class ChatService:
         self.model = model_config.get_chat_model()
         self.model_settings = model_config.get_chat_model_settings()
 
-    def _create_agent(self, system_prompt: str) -> Agent:
-        """
-        Creates a Pydantic-AI agent with proper fallback configuration.
-        Uses OpenRouter's native model fallback instead of manual handling.
-        """
-
-        # Create agent with tools and proper retry configuration
-        agent = Agent[PostGenerationContext, str](
-            self.model,
-            tools=[generate_linkedin_post_tool, revise_linkedin_post_tool],
-            model_settings=self.model_settings,
-            output_type=str,
-            instructions=system_prompt,
-            retries=2,  # Built-in retry mechanism for agent failures
-        )
-
-        return agent
+        # Set by stream_chat_response when the rolling summary is due
+        self._pending_summary: Optional[tuple[UUID, UUID, HistoryWindow]] = None
 
     async def get_conversation(
-        self, user_id: UUID, conversation_id: UUID
+        self, user_id: UUID, conversation_id: UUID, load_messages: bool = True
     ) -> Optional[Conversation]:
         """Get a conversation by ID, ensuring it belongs to the user."""
-        stmt = (
-            select(Conversation)
-            .where(Conversation.id == conversation_id, Conversation.user_id == user_id)
-            .options(selectinload(Conversation.messages))
+        stmt = select(Conversation).where(
+            Conversation.id == conversation_id, Conversation.user_id == user_id
         )
+        if load_messages:
+            stmt = stmt.options(selectinload(Conversation.messages))
         result = await self.db.execute(stmt)
         return result.scalars().first()
 
@@ -205,34 +303,8 @@ class ChatService:
 
     async def _get_user_profile_data(self, user_id: UUID) -> dict:
         """Get user's bio, writing style, and strategy as a dictionary."""
-        user_pref_stmt = select(UserPreferences).where(
-            UserPreferences.user_id == user_id
-        )
-        writing_style_stmt = select(WritingStyleAnalysis).where(
-            WritingStyleAnalysis.user_id == user_id
-        )
-        content_strategy_stmt = select(ContentStrategy).where(
-            ContentStrategy.user_id == user_id, ContentStrategy.platform == "linkedin"
-        )
-
-        user_pref_res = await self.db.execute(user_pref_stmt)
-        user_pref = user_pref_res.scalars().first()
-
-        writing_style_res = await self.db.execute(writing_style_stmt)
-        writing_style = writing_style_res.scalars().first()
-
-        content_strategy_res = await self.db.execute(content_strategy_stmt)
-        content_strategy = content_strategy_res.scalars().first()
-
-        return {
-            "bio": user_pref.bio if user_pref else "Not provided",
-            "writing_style": writing_style.analysis_data
-            if writing_style
-            else "Not provided",
-            "linkedin_post_strategy": content_strategy.strategy
-            if content_strategy
-            else "Not provided",
-        }
+        context = await UserContextService(self.db).get_user_context(user_id)
+        return context.profile_data()
 
     async def _add_message_to_db(
         self, conversation_id: UUID, role: str, content: str
@@ -250,10 +322,26 @@ class ChatService:
 
     # ===================== Helper utilities =====================
 
+    async def _get_latest_draft(self, conversation_id: UUID) -> Optional[str]:
+        """Get the post text of the conversation's most recent tool output."""
+        result = await self.db.execute(
+            select(Message.content)
+            .where(
+                Message.conversation_id == conversation_id,
+                Message.role == "tool",
+            )
+            .order_by(desc(Message.created_at), desc(Message.id))
+            .limit(1)
+        )
+        content = result.scalar()
+        if not content:
+            return None
+        return compact_message_content("tool", content) or None
+
     async def _stream_with_agent(
         self,
         conversation_id: UUID,
-        system_prompt: str,
+        instructions: str,
         user_message_content: str,
         history: list[ModelMessage],
         deps: PostGenerationContext,
@@ -261,54 +349,69 @@ class ChatService:
         """
         Simplified streaming logic that relies on PydanticAI's native error handling.
         OpenRouter's model fallback and agent retries handle failures automatically.
+
+        Text is streamed as deltas (never re-slicing the cumulative response),
+        coalesced into frames, with heartbeats while the model is silent.
         """
-        agent = self._create_agent(system_prompt)
+        from pydantic_ai.messages import ToolReturnPart
 
-        try:
+        agent = _get_chat_agent(instructions)
+        new_messages: list[ModelMessage] = []
+
+        async def text_deltas() -> AsyncGenerator[str, None]:
             async with agent.run_stream(
                 user_message_content,
                 deps=deps,
                 message_history=history,
+                model=self.model,
+                model_settings=self.model_settings,
             ) as result:
-                full_response = ""
-                last_len = 0
-
-                # Stream text responses
-                async for text in result.stream_text():
-                    if text is None:
-                        continue
-                    delta = text[last_len:]
-                    last_len = len(text)
-                    if delta:
-                        yield ChatStreamResponse(type="message", content=delta)
-                    full_response = text
-
-                # Persist assistant reply
-                if full_response:
-                    await self._add_message_to_db(
-                        conversation_id, "assistant", full_response
-                    )
-
-                # Handle tool outputs
-                for msg in result.new_messages():
-                    for p in msg.parts:
-                        if isinstance(p, ToolReturnPart):
-                            content = p.content
-                            # Extract the actual result from wrapper if needed
-                            if hasattr(content, "output"):
-                                content = content.output
-                            tool_json = (
-                                content.model_dump_json()
-                                if isinstance(content, BaseModel)
-                                else str(content)
-                            )
-                            # Persist tool output
-                            await self._add_message_to_db(
-                                conversation_id, "tool", tool_json
-                            )
-                            yield ChatStreamResponse(
-                                type="tool_output", content=tool_json
-                            )
+                async for delta in result.stream_text(delta=True, debounce_by=None):
+                    yield delta
+                new_messages.extend(result.new_messages())
+
+        try:
+            response_parts: list[str] = []
+
+            # Stream text responses
+            async for frame in coalesce_deltas(
+                text_deltas(),
+                max_chars=settings.chat_stream_frame_max_chars,
+                max_delay=settings.chat_stream_frame_max_delay_ms / 1000,
+                heartbeat_interval=settings.chat_stream_heartbeat_seconds,
+            ):
+                if frame is None:
+                    yield ChatStreamResponse(type="heartbeat")
+                    continue
+                response_parts.append(frame)
+                yield ChatStreamResponse(type="message", content=frame)
+
+            full_response = "".join(response_parts)
+
+            # Persist assistant reply
+            if full_response:
+                await self._add_message_to_db(
+                    conversation_id, "assistant", full_response
+                )
+
+            # Handle tool outputs
+            for msg in new_messages:
+                for p in msg.parts:
+                    if isinstance(p, ToolReturnPart):
+                        content = p.content
+                        # Extract the actual result from wrapper if needed
+                        if hasattr(content, "output"):
+                            content = content.output
+                        tool_json = (
+                            content.model_dump_json()
+                            if isinstance(content, BaseModel)
+                            else str(content)
+                        )
+                        # Persist tool output
+                        await self._add_message_to_db(
+                            conversation_id, "tool", tool_json
+                        )
+                        yield ChatStreamResponse(type="tool_output", content=tool_json)
 
         except Exception as e:
             logger.error(f"Error streaming chat response: {e}")
@@ -360,6 +463,14 @@ class ChatService:
         chat_messages: List["ChatMessage"],
     ) -> List[ModelMessage]:
         """Convert API `ChatMessage` items to Pydantic-AI `ModelMessage` objects."""
+        from pydantic_ai.messages import (
+            ModelRequest,
+            ModelResponse,
+            SystemPromptPart,
+            TextPart,
+            UserPromptPart,
+        )
+
         history: List[ModelMessage] = []
         for msg in chat_messages:
             if msg.role == "user":
@@ -368,13 +479,13 @@ class ChatService:
                 )
             elif msg.role == "assistant":
                 history.append(ModelResponse(parts=[TextPart(content=msg.content)]))
-            # system messages and other roles are ignored here; adjust if needed
+            elif msg.role == "system":
+                # Rolling summary of turns outside the history window
+                summary = f"Summary of the earlier conversation:\n{msg.content}"
+                history.append(ModelRequest(parts=[SystemPromptPart(content=summary)]))
             elif msg.role == "tool":
-                message = ""
-                try:
-                    message = json.loads(msg.content)["linkedin_post"]
-                except json.JSONDecodeError:
-                    message = msg.content
+                # Windowed rows are already compacted; this is a no-op for them
+                message = compact_message_content("tool", msg.content)
                 history.append(ModelResponse(parts=[TextPart(content=message)]))
         return history
 
@@ -388,7 +499,9 @@ class ChatService:
 
         context_parts = []
         for msg in chat_messages:
-            if msg.role == "user":
+            if msg.role == "system":
+                context_parts.append(f"EARLIER CONVERSATION (SUMMARY):\n{msg.content}")
+            elif msg.role == "user":
                 context_parts.append(f"USER: {msg.content}")
             elif msg.role == "assistant":
                 context_parts.append(f"ASSISTANT: {msg.content}")
@@ -415,34 +528,12 @@ class ChatService:
         history: list[ModelMessage],
         profile_data: dict,
         messages: List[ChatMessage],
+        bypass_cache: bool = False,
     ) -> AsyncGenerator[ChatStreamResponse, None]:
         # Convert message history to conversation context
         conversation_context = self._convert_to_conversation_context(messages[:-1])
 
-        system_prompt = f"""
-        You are a LinkedIn content strategist. Your job is to help users create LinkedIn posts.
-
-        AVAILABLE INFORMATION:
-        - Post Idea: {idea_content}
-        - User Bio: {profile_data["bio"]}
-        - User Writing Style: {profile_data["writing_style"]}
-        - User LinkedIn Strategy: {profile_data["linkedin_post_strategy"]}
-        - Conversation History: {conversation_context or "No previous conversation"}
-
-        INSTRUCTIONS:
-        1. When a user wants to create a LinkedIn post, ask 1-3 questions to understand their perspective, personal experiences, or key message they want to convey.
-
-        2. After getting their input, use the 'generate_linkedin_post_tool' to create their post.
-           The tool has access to all the user information automatically - you don't need to pass any parameters.
-
-        3. Don't have long conversations - after 1-3 exchanges, generate the post.
-
-        Example flow:
-        - User: "Help me create a post about this article"
-        - You: "What's your main takeaway from this? Any personal experience related to it?"
-        - User: [provides their perspective]
-        - You: [call generate_linkedin_post_tool - no parameters needed]
-        """
+        from app.services.post_generator import PostGenerationContext
 
         # Create context with all the required data
         context = PostGenerationContext(
@@ -451,11 +542,12 @@ class ChatService:
             writing_style=profile_data["writing_style"],
             linkedin_post_strategy=profile_data["linkedin_post_strategy"],
             conversation_context=conversation_context,
+            bypass_cache=bypass_cache,
         )
 
         async for chunk in self._stream_with_agent(
             conversation_id,
-            system_prompt,
+            GENERATION_INSTRUCTIONS,
             user_message.content,
             history,
             context,
@@ -472,37 +564,12 @@ class ChatService:
         previous_draft: str,
         user_feedback: str,
         messages: List[ChatMessage],
+        bypass_cache: bool = False,
     ) -> AsyncGenerator[ChatStreamResponse, None]:
         # Convert message history to conversation context
         conversation_context = self._convert_to_conversation_context(messages[:-1])
 
-        system_prompt = f"""
-        You are an expert LinkedIn content strategist helping users refine their posts through conversation.
-        Your role is to understand what the user wants to change and either engage them in discussion or use the 'revise_linkedin_post_tool' when you have clear direction.
-
-        CONTEXT FOR REVISION:
-        - Original Post Idea: {idea_content}
-        - User Bio: {profile_data["bio"]}
-        - Writing Style: {profile_data["writing_style"]}
-        - LinkedIn Strategy: {profile_data["linkedin_post_strategy"]}
-        - Previous Draft: {previous_draft}
-        - User's Latest Request: {user_feedback}
-        - Conversation History: {conversation_context or "No previous conversation"}
-
-        REVISION APPROACH:
-        1. **Understand the request**: If the user's feedback is clear and specific (like "make it shorter", "add more emotion", "remove the question"), use the revise_linkedin_post_tool immediately.
-           The tool has access to all the user information and previous draft automatically - you don't need to pass any parameters.
-
-        2. **Engage when unclear**: If the feedback is vague (like "make it better", "I don't like it"), ask clarifying questions to understand:
-           - What specifically they want to change
-           - What they liked or didn't like about the current version
-           - What tone or approach they prefer
-           - Any specific elements they want added or removed
-
-        3. **Reference conversation history**: Use the conversation context to understand their preferences and previous feedback.
-
-        4. **Be conversational**: Keep the tone collaborative and helpful. You're working together to refine their post.
-        """
+        from app.services.post_generator import PostGenerationContext
 
         # Create context with all the required data including revision-specific info
         context = PostGenerationContext(
@@ -513,11 +580,12 @@ class ChatService:
             conversation_context=conversation_context,
             previous_draft=previous_draft,
             user_feedback=user_feedback,
+            bypass_cache=bypass_cache,
         )
 
         async for chunk in self._stream_with_agent(
             conversation_id,
-            system_prompt,
+            REVISION_INSTRUCTIONS,
             user_message.content,
             history,
             context,
@@ -533,34 +601,12 @@ class ChatService:
         profile_data: dict,
         user_feedback: str,
         messages: List[ChatMessage],
+        bypass_cache: bool = False,
     ) -> AsyncGenerator[ChatStreamResponse, None]:
         # Convert message history to conversation context
         conversation_context = self._convert_to_conversation_context(messages[:-1])
 
-        system_prompt = f"""
-        You are an expert LinkedIn content strategist helping users edit and improve their existing posts through conversation.
-        Your role is to understand what the user wants to change about their post and use the 'revise_linkedin_post_tool' to create an improved version.
-
-        CURRENT POST CONTENT:
-        {current_post_content}
-
-        USER PROFILE INFORMATION:
-        - User Bio: {profile_data["bio"]}
-        - User Writing Style: {profile_data["writing_style"]}
-        - User LinkedIn Strategy: {profile_data["linkedin_post_strategy"]}
-        - Conversation History: {conversation_context or "No previous conversation"}
-
-        INSTRUCTIONS:
-        1. **Understand the edit request**: Listen carefully to what the user wants to change about their existing post.
-
-        2. **Use the revise_linkedin_post_tool**: When you have a clear understanding of the changes needed, use this tool to create an improved version of the post.
-
-        3. **Maintain the user's voice**: Keep their writing style and tone while making the requested improvements.
-
-        4. **Be conversational**: Engage with the user to clarify their needs if the request is unclear.
-
-        5. **Focus on improvement**: Make the post more engaging, clear, or aligned with their goals while respecting their original intent.
-        """
+        from app.services.post_generator import PostGenerationContext
 
         # Create context with all the required data for post editing
         context = PostGenerationContext(
@@ -571,11 +617,12 @@ class ChatService:
             conversation_context=conversation_context,
             previous_draft=current_post_content,
             user_feedback=user_feedback,
+            bypass_cache=bypass_cache,
         )
 
         async for chunk in self._stream_with_agent(
             conversation_id,
-            system_prompt,
+            POST_EDITING_INSTRUCTIONS,
             user_message.content,
             history,
             context,
@@ -585,10 +632,21 @@ class ChatService:
     # ================================================================
 
     async def stream_chat_response(
-        self, user: User, conversation_id: UUID, messages: List[ChatMessage]
+        self,
+        user: User,
+        conversation_id: UUID,
+        messages: List[ChatMessage],
+        regenerate: bool = False,
     ) -> AsyncGenerator[ChatStreamResponse, None]:
-        """Stream a chat response from the AI model."""
-        conversation = await self.get_conversation(user.id, conversation_id)
+        """
+        Stream a chat response from the AI model.
+
+        ``regenerate`` makes the post tools skip the LLM response cache, so
+        asking again with unchanged inputs produces a new draft.
+        """
+        conversation = await self.get_conversation(
+            user.id, conversation_id, load_messages=False
+        )
         if not conversation:
             yield ChatStreamResponse(type="error", error="Conversation not found")
             return
@@ -609,26 +667,19 @@ class ChatService:
                 post_content = post.content
                 idea_content = f"Current post content: {post_content}"
 
+        # History is replayed from the DB tail within the token budget rather
+        # than from the client, whose copy grows with the conversation
+        history_service = ChatHistoryService(self.db)
+        window = await history_service.load_window(conversation)
+
         user_message = messages[-1]
         await self._add_message_to_db(
             conversation.id, user_message.role, user_message.content
         )
+        messages = window.chat_messages() + [user_message]
 
-        # Find the most recent tool-generated draft in the stored conversation history
-        previous_draft: Optional[str] = None
-        for m in reversed(conversation.messages):  # iterate over DB-persisted messages
-            if m.role != "tool":
-                continue
-            try:
-                parsed = json.loads(m.content)
-                if isinstance(parsed, dict) and "linkedin_post" in parsed:
-                    previous_draft = parsed["linkedin_post"]
-                else:
-                    previous_draft = m.content
-            except json.JSONDecodeError:
-                previous_draft = m.content
-            if previous_draft:
-                break
+        # Most recent tool-generated draft, which may be outside the window
+        previous_draft = await self._get_latest_draft(conversation.id)
 
         profile_data = await self._get_user_profile_data(user.id)
         bio = profile_data["bio"]
@@ -649,7 +700,7 @@ class ChatService:
         # Route to appropriate handler based on conversation type
         if conversation.conversation_type in ["post_editing", "revision"]:
             # For post editing/revision, always treat as revision since we have existing content
-            async for chunk in self._handle_post_editing(
+            handler = self._handle_post_editing(
                 conversation_id,
                 post_content or idea_content,
                 user_message,
@@ -657,11 +708,10 @@ class ChatService:
                 profile_data,
                 user_feedback,
                 messages,
-            ):
-                yield chunk
-            return
+                bypass_cache=regenerate,
+            )
         elif previous_draft:
-            async for chunk in self._handle_revision(
+            handler = self._handle_revision(
                 conversation_id,
                 idea_content,
                 user_message,
@@ -670,17 +720,33 @@ class ChatService:
                 previous_draft,
                 user_feedback,
                 messages,
-            ):
-                yield chunk
-            return
+                bypass_cache=regenerate,
+            )
         else:
-            async for chunk in self._handle_generation(
+            handler = self._handle_generation(
                 conversation_id,
                 idea_content,
                 user_message,
                 history,
                 profile_data,
                 messages,
-            ):
-                yield chunk
-            return
+                bypass_cache=regenerate,
+            )
+
+        async for chunk in handler:
+            yield chunk
+
+        # Summarising is left to summarize_finished_turn, after the stream
+        if history_service.needs_summary(window):
+            self._pending_summary = (conversation.id, user.id, window)
+
+    async def summarize_finished_turn(self) -> None:
+        """
+        Fold turns that left the last streamed window into the rolling summary.
+
+        Call once the response has been sent (the chat router runs it as a
+        background task) so the summariser never holds up the stream.
+        """
+        pending, self._pending_summary = self._pending_summary, None
+        if pending is not None:
+            await refresh_summary_after_turn(*pending)
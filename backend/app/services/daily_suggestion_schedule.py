@@ -5,11 +5,9 @@ Service for managing daily suggestion schedules and corresponding GCP Cloud Sche
 from __future__ import annotations
 
 import json
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from google.cloud import scheduler_v1
-from google.api_core.exceptions import NotFound, GoogleAPICallError
 from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +21,9 @@ from app.schemas.daily_suggestion_schedule import (
     DailySuggestionScheduleUpdate,
 )
 
+if TYPE_CHECKING:
+    from google.cloud import scheduler_v1
+
 # Constants for GCP project/location
 GCP_PROJECT = settings.gcp_project_id
 GCP_LOCATION = settings.gcp_location
@@ -46,6 +47,9 @@ class DailySuggestionScheduleService:
     # ----- Internal helpers -----
     def _client(self) -> Optional[scheduler_v1.CloudSchedulerClient]:
         if self._scheduler_client is None:
+            # Deferred: the Cloud Scheduler SDK is slow to import
+            from google.cloud import scheduler_v1
+
             try:
                 self._scheduler_client = scheduler_v1.CloudSchedulerClient()
             except Exception as e:
@@ -72,6 +76,8 @@ class DailySuggestionScheduleService:
         if client is None:
             return  # Skip sync when client unavailable
 
+        from google.api_core.exceptions import GoogleAPICallError, NotFound
+
         payload = json.dumps({"user_id": str(self.user_id)}).encode(
             "utf-8"
         )  # bytes for body
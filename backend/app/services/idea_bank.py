@@ -7,13 +7,59 @@ from uuid import UUID
 from datetime import datetime, timezone
 
 from loguru import logger
-from sqlalchemy import and_, desc, func, select, update
+from sqlalchemy import Select, and_, desc, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.models.helpers import json_field_text
 from app.models.idea_bank import IdeaBank
 from app.models.posts import Post
 from app.schemas.idea_bank import IdeaBankCreate, IdeaBankUpdate
 
+# Text form of a truthy JSON flag: JSON true, or a "true"/"True" string in
+# older rows (like the Python-side check it replaced, "1" is not truthy)
+JSON_TRUE_VALUE = "true"
+
+
+def _json_flag_filter(key: str, value: bool):
+    """
+    Build a WHERE clause for a boolean flag stored in ``IdeaBank.data``.
+
+    A missing or null flag counts as false. The expression matches the
+    ``lower(data ->> key)`` expression indexes on idea_banks.
+
+    Args:
+        key: Top-level key in the idea bank data
+        value: Whether the flag should be set
+
+    Returns:
+        SQL boolean expression
+    """
+    flag = func.lower(json_field_text(IdeaBank.data, key))
+    is_set = flag == JSON_TRUE_VALUE
+    return is_set if value else or_(flag.is_(None), ~is_set)
+
+
+def _latest_post_query(post, user_id: UUID, *columns) -> Select:
+    """
+    Select ``columns`` of the user's most recently updated post for the
+    enclosing query's idea bank (correlated to ``IdeaBank``).
+
+    Args:
+        post: ``Post`` or an alias of it
+        user_id: Owner of the posts
+        columns: Entities/columns to select
+
+    Returns:
+        Select limited to one row
+    """
+    return (
+        select(*columns)
+        .where(post.idea_bank_id == IdeaBank.id, post.user_id == user_id)
+        .order_by(desc(post.updated_at), desc(post.id))
+        .limit(1)
+    )
+
 
 class IdeaBankService:
     """Service for idea bank operations."""
@@ -41,8 +87,11 @@ class IdeaBankService:
             # For has_post and post_status filters, we need to join with posts
             join_posts = has_post is not None or post_status is not None
 
-            # Determine if we need to filter in-memory for JSON fields
-            in_memory_filter = ai_suggested is not None or evergreen is not None
+            if ai_suggested is not None:
+                filters.append(_json_flag_filter("ai_suggested", ai_suggested))
+            if evergreen is not None:
+                # Evergreen ideas are the ones not flagged time sensitive
+                filters.append(_json_flag_filter("time_sensitive", not evergreen))
 
             if join_posts:
                 query_base = select(IdeaBank).join(
@@ -59,57 +108,11 @@ class IdeaBankService:
 
             query = query_base.where(and_(*filters))
 
-            if in_memory_filter:
-                # Fetch all results from DB if we have in-memory filters
-                result = await self.db.execute(query.distinct())
-                all_idea_banks = result.scalars().all()
-
-                # In-memory filtering
-                filtered_idea_banks = []
-                for idea_bank in all_idea_banks:
-                    data = idea_bank.data or {}
-                    # AI suggested filter
-                    if ai_suggested is not None:
-                        bank_ai_suggested = data.get("ai_suggested", False)
-                        if isinstance(bank_ai_suggested, str):
-                            bank_ai_suggested = bank_ai_suggested.lower() == "true"
-                        if bank_ai_suggested != ai_suggested:
-                            continue
-                    # Evergreen filter
-                    if evergreen is not None:
-                        bank_time_sensitive = data.get("time_sensitive", False)
-                        if isinstance(bank_time_sensitive, str):
-                            bank_time_sensitive = bank_time_sensitive.lower() == "true"
-                        if (evergreen and bank_time_sensitive) or (
-                            not evergreen and not bank_time_sensitive
-                        ):
-                            continue
-                    filtered_idea_banks.append(idea_bank)
-
-                # In-memory sorting
-                reverse = order_direction.lower() == "desc"
-                filtered_idea_banks.sort(
-                    key=lambda ib: getattr(ib, order_by, ib.updated_at),
-                    reverse=reverse,
-                )
-
-                # In-memory pagination
-                total = len(filtered_idea_banks)
-                offset = (page - 1) * size
-                paginated_banks = filtered_idea_banks[offset : offset + size]
-
-                return {
-                    "items": paginated_banks,
-                    "total": total,
-                    "page": page,
-                    "size": size,
-                    "has_next": total > page * size,
-                }
-
-            # Original path (no in-memory filtering)
-            count_query_base = select(
+            # Count over the same FROM/WHERE (a subquery here would be
+            # cross joined with idea_banks)
+            count_query_base = query.with_only_columns(
                 func.count(IdeaBank.id.distinct() if join_posts else IdeaBank.id)
-            ).select_from(query.subquery())
+            )
             count_result = await self.db.execute(count_query_base)
             total = count_result.scalar() or 0
 
@@ -151,90 +154,53 @@ class IdeaBankService:
         try:
             # Build filters for idea banks
             filters = [IdeaBank.user_id == user_id]
+            if ai_suggested is not None:
+                filters.append(_json_flag_filter("ai_suggested", ai_suggested))
 
-            # Build subquery for latest posts
-            latest_post_subquery = (
-                select(
-                    Post.idea_bank_id,
-                    func.max(Post.updated_at).label("latest_updated_at"),
+            # Latest post per idea bank, scoped to this user's posts
+            if self.db.get_bind().dialect.name == "postgresql":
+                # LEFT JOIN LATERAL: one (idea_bank_id, updated_at) index
+                # probe per idea bank instead of grouping the whole table
+                latest_post = aliased(
+                    Post,
+                    _latest_post_query(Post, user_id, Post)
+                    .subquery("latest_post")
+                    .lateral(),
+                )
+                latest_post_match = latest_post.status != "dismissed"
+            else:
+                # No LATERAL (SQLite): match the same row by id instead
+                candidate = aliased(Post)
+                latest_post = Post
+                latest_post_match = and_(
+                    Post.id
+                    == _latest_post_query(
+                        candidate, user_id, candidate.id
+                    ).scalar_subquery(),
+                    Post.status != "dismissed",
                 )
-                .group_by(Post.idea_bank_id)
-                .subquery()
-            )
 
             # Build main query
-            query_base = (
-                select(IdeaBank, Post)
-                .outerjoin(
-                    latest_post_subquery,
-                    IdeaBank.id == latest_post_subquery.c.idea_bank_id,
-                )
-                .outerjoin(
-                    Post,
-                    and_(
-                        Post.idea_bank_id == latest_post_subquery.c.idea_bank_id,
-                        Post.updated_at == latest_post_subquery.c.latest_updated_at,
-                        Post.status != "dismissed",
-                    ),
-                )
+            query_base = select(IdeaBank, latest_post).outerjoin(
+                latest_post, latest_post_match
             )
 
             # Apply post-related filters
             if has_post is not None:
                 if has_post:
-                    filters.append(Post.id.isnot(None))
+                    filters.append(latest_post.id.isnot(None))
                 else:
-                    filters.append(Post.id.is_(None))
+                    filters.append(latest_post.id.is_(None))
 
             # Base query with filters
             query = query_base.where(and_(*filters))
 
-            # If filtering on a JSON field, we must fetch all, then filter/sort/paginate in memory.
-            if ai_suggested is not None:
-                result = await self.db.execute(query.distinct())
-                all_rows = result.all()
-
-                # In-memory filtering
-                items = []
-                for row in all_rows:
-                    idea_bank, post = row[0], row[1] if len(row) > 1 else None
-                    data = idea_bank.data or {}
-
-                    # Filter by AI suggested
-                    bank_ai_suggested = data.get("ai_suggested", False)
-                    if isinstance(bank_ai_suggested, str):
-                        bank_ai_suggested = bank_ai_suggested.lower() == "true"
-                    if bank_ai_suggested != ai_suggested:
-                        continue
-
-                    items.append({"idea_bank": idea_bank, "latest_post": post})
-
-                # In-memory sorting
-                reverse = order_direction.lower() == "desc"
-                items.sort(
-                    key=lambda x: getattr(
-                        x["idea_bank"], order_by, x["idea_bank"].updated_at
-                    ),
-                    reverse=reverse,
-                )
-
-                # In-memory pagination
-                total = len(items)
-                offset = (page - 1) * size
-                paginated_items = items[offset : offset + size]
-
-                return {
-                    "items": paginated_items,
-                    "total": total,
-                    "page": page,
-                    "size": size,
-                    "has_next": total > page * size,
-                }
-
-            # Original path (no JSON filtering)
-            count_query = select(func.count(IdeaBank.id.distinct())).select_from(
-                query.subquery()
-            )
+            # At most one latest post per idea bank, so rows are unique and
+            # the join only matters to the count when filtering on it
+            if has_post is None:
+                count_query = select(func.count(IdeaBank.id)).where(and_(*filters))
+            else:
+                count_query = query.with_only_columns(func.count(IdeaBank.id))
             count_result = await self.db.execute(count_query)
             total = count_result.scalar() or 0
 
@@ -244,9 +210,7 @@ class IdeaBankService:
             if order_direction.lower() == "desc":
                 order_column = desc(order_column)
 
-            paginated_query = (
-                query.order_by(order_column).offset(offset).limit(size).distinct()
-            )
+            paginated_query = query.order_by(order_column).offset(offset).limit(size)
 
             result = await self.db.execute(paginated_query)
             rows = result.all()
@@ -1,66 +1,26 @@
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic_ai import Agent
 from app.services.model_config import model_config
-from app.models.profile import UserPreferences
+from app.services.user_context import UserContextService
 
 
-class ImageGenService:
-    def __init__(self):
-        """
-        Creates the Pydantic-AI agent using shared model configuration.
-        Uses a smaller model for generating the image prompt.
-        """
-        # Use shared model configuration for consistency
-        self.agent = Agent[str, str](
-            model_config.get_chat_model(),
-            model_settings=model_config.get_chat_model_settings(),
-            output_type=str,
-            retries=2,  # Built-in retry mechanism
-        )
+# Sent unchanged on every request; the custom style and the post follow in the
+# user prompt.
+IMAGE_PROMPT_INSTRUCTIONS = """You are an expert creative director specializing in corporate branding. Your task is to create one single, high-quality image generation prompt based on the LinkedIn post provided in the message. Your goal is to produce a prompt that will generate a professional, visually striking, and conceptually relevant image suitable for LinkedIn, avoiding generic "AI slop."
 
-    async def generate_image_prompt(
-        self,
-        linkedin_post_text: str,
-        user_id: Optional[UUID] = None,
-        db: Optional[AsyncSession] = None,
-    ) -> str:
-        # Fetch user preferences if user_id and db are provided
-        custom_style = None
-        if user_id and db:
-            try:
-                user_pref_stmt = select(UserPreferences).where(
-                    UserPreferences.user_id == user_id
-                )
-                user_pref_res = await db.execute(user_pref_stmt)
-                user_pref = user_pref_res.scalars().first()
-
-                if user_pref and user_pref.image_generation_style:
-                    custom_style = user_pref.image_generation_style
-            except Exception:
-                # If there's any error fetching preferences, continue with default
-                pass
+Follow these steps in your reasoning, but only output the final prompt:
+
+Step 1: Analyze the Post
+Read the text to understand its core message, tone, and intended audience.
+
+Step 2: Identify the Core Metaphor
+Extract the single most powerful and visually interesting metaphor, analogy, or contrast from the text. This will be the subject of the image.
 
-        # Build the style options section
-        if custom_style:
-            style_section = f"""
-Step 3: MANDATORY Custom Style - MUST FOLLOW EXACTLY
-🎨 CRITICAL: The user has specified a custom image generation style that MUST be used.
-
-CUSTOM STYLE REQUIREMENT: {custom_style}
-
-⚠️ IMPORTANT INSTRUCTIONS:
-- This custom style is MANDATORY and takes absolute priority over all default options
-- You MUST incorporate this exact style into your final image generation prompt
-- Do NOT deviate from or ignore this custom style preference
-- The final prompt MUST reflect this style prominently and accurately
-- If the custom style conflicts with the content, adapt the content presentation to fit the style"""
-        else:
-            style_section = """
 Step 3: Select the Best Style
-Based on the core metaphor and the professional context, choose the most appropriate high-end art style from the expanded list below. Select the one that will best convey the message with clarity and sophistication.
+If the message contains a CUSTOM STYLE REQUIREMENT, skip the options below: the custom style is MANDATORY, takes absolute priority over all default options and MUST be used exactly. Do not deviate from or ignore it; if it conflicts with the content, adapt the content presentation to fit the style.
+
+Otherwise, based on the core metaphor and the professional context, choose the most appropriate high-end art style from the expanded list below. Select the one that will best convey the message with clarity and sophistication.
 
 Options:
 
@@ -80,36 +40,56 @@ Elegant Line Art: For a sophisticated, classic, or premium feel. Uses fine, deta
 
 Data Visualization Art: For posts about data, trends, or networks. Creates a beautiful, abstract representation of information rather than a literal chart or graph.
 
-Glassmorphism/Claymorphism 3D: Modern UI/UX-inspired styles. Glassmorphism uses a frosted-glass effect for a sleek, futuristic feel. Claymorphism uses soft, rounded shapes for a friendly, approachable look."""
-
-        # Build the main prompt with custom style emphasis if present
-        style_emphasis = ""
-        if custom_style:
-            style_emphasis = f" CRITICAL: The user has provided a custom style ({custom_style}) that MUST be followed exactly."
-
-        prompt = f"""
-        You are an expert creative director specializing in corporate branding. Your task is to create one single, high-quality image generation prompt based on the LinkedIn post provided below. Your goal is to produce a prompt that will generate a professional, visually striking, and conceptually relevant image suitable for LinkedIn, avoiding generic "AI slop."{style_emphasis}
+Glassmorphism/Claymorphism 3D: Modern UI/UX-inspired styles. Glassmorphism uses a frosted-glass effect for a sleek, futuristic feel. Claymorphism uses soft, rounded shapes for a friendly, approachable look.
 
-Follow these steps in your reasoning, but only output the final prompt:
+Step 4: Construct the Final Prompt
+Combine the elements above into a single, detailed paragraph. This prompt must be ready to be used in an image generation model. It must describe the scene, the style, the composition (e.g., "minimalist, centered on a clean background"), the lighting (e.g., "soft studio lighting," "dramatic side-lighting"), and the professional color palette. If a custom style was specified, it MUST be the dominant style element in your final prompt.
 
-Step 1: Analyze the Post
-Read the text to understand its core message, tone, and intended audience.
+Your final output must ONLY be the ready-to-use image generation prompt itself. Do not include your analysis, reasoning, or any other text.
+"""
 
-Step 2: Identify the Core Metaphor
-Extract the single most powerful and visually interesting metaphor, analogy, or contrast from the text. This will be the subject of the image.
-{style_section}
 
-Step 4: Construct the Final Prompt
-Combine the elements above into a single, detailed paragraph. This prompt must be ready to be used in an image generation model. It must describe the scene, the style, the composition (e.g., "minimalist, centered on a clean background"), the lighting (e.g., "soft studio lighting," "dramatic side-lighting"), and the professional color palette.
+class ImageGenService:
+    # Built on first use and shared by all instances (one is created per request)
+    _agent = None
 
-{"🎨 REMINDER: If a custom style was specified in Step 3, it MUST be the dominant style element in your final prompt. Make sure the custom style is clearly and prominently featured." if custom_style else ""}
+    def __init__(self):
+        """
+        Uses the shared Pydantic-AI agent built from the shared model
+        configuration, with a smaller model for generating the image prompt.
+        """
+        if ImageGenService._agent is None:
+            from pydantic_ai import Agent
+
+            ImageGenService._agent = Agent[str, str](
+                model_config.get_chat_model(),
+                model_settings=model_config.get_chat_model_settings(),
+                output_type=str,
+                instructions=IMAGE_PROMPT_INSTRUCTIONS,
+                retries=2,  # Built-in retry mechanism
+            )
+        self.agent = ImageGenService._agent
 
-Your final output must ONLY be the ready-to-use image generation prompt itself. Do not include your analysis, reasoning, or any other text.
+    async def generate_image_prompt(
+        self,
+        linkedin_post_text: str,
+        user_id: Optional[UUID] = None,
+        db: Optional[AsyncSession] = None,
+    ) -> str:
+        # Fetch user preferences if user_id and db are provided
+        custom_style = None
+        if user_id and db:
+            try:
+                context = await UserContextService(db).get_user_context(user_id)
+                custom_style = context.image_generation_style
+            except Exception:
+                # If there's any error fetching preferences, continue with default
+                pass
 
-LINKEDIN POST:
-{linkedin_post_text}
-"""
-        print(prompt)
+        prompt = ""
+        if custom_style:
+            prompt = f"CUSTOM STYLE REQUIREMENT (MANDATORY): {custom_style}\n\n"
+        prompt += f"LINKEDIN POST:\n{linkedin_post_text}\n"
 
         result = await self.agent.run(prompt)
         return result
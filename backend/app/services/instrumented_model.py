@@ -0,0 +1,88 @@
+"""
+OpenAI-compatible model with request instrumentation.
+Kept separate from model_config so pydantic_ai is only imported on first use.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from pydantic_ai.models import StreamedResponse
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.usage import Usage
+
+from app.core.metrics import (
+    llm_fallback_total,
+    llm_prompt_cache_requests_total,
+    llm_request_duration_seconds,
+    llm_tokens_total,
+)
+
+
+class InstrumentedOpenAIModel(OpenAIModel):
+    """OpenAI-compatible model that records latency, tokens and fallback usage."""
+
+    def _record(
+        self,
+        mode: str,
+        started: float,
+        outcome: str,
+        usage: Optional[Usage] = None,
+        served_model: Optional[str] = None,
+    ) -> None:
+        requested = self.model_name
+        llm_request_duration_seconds.observe(
+            time.perf_counter() - started, model=requested, mode=mode, outcome=outcome
+        )
+        if usage is not None:
+            if usage.request_tokens:
+                llm_tokens_total.inc(
+                    usage.request_tokens, model=requested, direction="prompt"
+                )
+                # OpenRouter reports prompt cache reads as
+                # prompt_tokens_details.cached_tokens
+                cached = (usage.details or {}).get("cached_tokens", 0)
+                llm_prompt_cache_requests_total.inc(
+                    model=requested, result="hit" if cached else "miss"
+                )
+                if cached:
+                    llm_tokens_total.inc(
+                        cached, model=requested, direction="prompt_cached"
+                    )
+            if usage.response_tokens:
+                llm_tokens_total.inc(
+                    usage.response_tokens, model=requested, direction="completion"
+                )
+        # OpenRouter reports the model that actually served the request
+        if served_model and not served_model.startswith(requested):
+            llm_fallback_total.inc(requested_model=requested, served_model=served_model)
+
+    async def request(self, messages, model_settings, model_request_parameters):
+        started = time.perf_counter()
+        try:
+            response = await super().request(
+                messages, model_settings, model_request_parameters
+            )
+        except Exception:
+            self._record("request", started, "error")
+            raise
+        self._record("request", started, "success", response.usage, response.model_name)
+        return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self, messages, model_settings, model_request_parameters
+    ) -> AsyncIterator[StreamedResponse]:
+        started = time.perf_counter()
+        streamed: Optional[StreamedResponse] = None
+        try:
+            async with super().request_stream(
+                messages, model_settings, model_request_parameters
+            ) as streamed:
+                yield streamed
+        except Exception:
+            self._record("stream", started, "error")
+            raise
+        self._record(
+            "stream", started, "success", streamed.usage(), streamed.model_name
+        )
@@ -3,18 +3,50 @@ Shared model configuration for PydanticAI agents.
 Provides consistent model settings and fallback configurations across all services.
 """
 
-from pydantic_ai.models.openai import OpenAIModel, OpenAIModelSettings
-from pydantic_ai.providers.openrouter import OpenRouterProvider
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+import httpx
+
 from app.core.config import settings
+from app.utils.model_health import CircuitBreaker, LatencyTracker
+
+if TYPE_CHECKING:
+    from pydantic_ai.models import Model
+    from pydantic_ai.models.openai import OpenAIModelSettings
+    from pydantic_ai.providers.openrouter import OpenRouterProvider
+
+
+class _ReopenableTransport(httpx.AsyncBaseTransport):
+    """
+    Connection pool that is opened on demand and can be closed and reopened.
+
+    Models keep a reference to the client that owns this transport, so
+    closing the pool (rather than the client) never leaves them with a
+    closed client.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncBaseTransport]):
+        self._factory = factory
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = self._factory()
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        transport, self._transport = self._transport, None
+        if transport is not None:
+            await transport.aclose()
 
 
 class ModelConfig:
     """Centralized model configuration for consistent setup across services."""
 
     def __init__(self):
-        self.provider = OpenRouterProvider(
-            api_key=settings.openrouter_api_key,
-        )
+        self._provider = None
+        self._http_client = None
+        self._transport: Optional[_ReopenableTransport] = None
 
         # Parse fallback models
         self.chat_fallback_models = [
@@ -29,29 +61,120 @@ class ModelConfig:
             if model.strip()
         ]
 
-    def get_chat_model(self) -> OpenAIModel:
-        """Get the primary chat model with OpenRouter provider."""
-        return OpenAIModel(
+        # Shared by every routed model: time to first chunk and model health
+        self.latency = LatencyTracker(
+            window=settings.llm_latency_window,
+            min_samples=settings.llm_latency_min_samples,
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.llm_breaker_failure_threshold,
+            recovery_seconds=settings.llm_breaker_recovery_seconds,
+            slow_threshold_seconds=settings.llm_breaker_slow_ttft_seconds,
+        )
+
+    def _open_transport(self) -> httpx.AsyncBaseTransport:
+        """Open a new keep-alive connection pool for OpenRouter."""
+        return httpx.AsyncHTTPTransport(
+            http2=settings.openrouter_http2,
+            limits=httpx.Limits(
+                max_connections=settings.openrouter_max_connections,
+                max_keepalive_connections=settings.openrouter_max_keepalive_connections,
+                keepalive_expiry=settings.openrouter_keepalive_expiry_seconds,
+            ),
+        )
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        Long-lived HTTP client shared by every OpenRouter model.
+
+        One keep-alive pool (HTTP/2 multiplexed when enabled) means chat turns,
+        post generation and image prompts reuse warm TLS connections.
+        """
+        if self._http_client is None:
+            self._transport = _ReopenableTransport(self._open_transport)
+            self._http_client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=httpx.Timeout(
+                    connect=settings.openrouter_connect_timeout_seconds,
+                    read=settings.openrouter_read_timeout_seconds,
+                    write=settings.openrouter_connect_timeout_seconds,
+                    pool=settings.openrouter_pool_timeout_seconds,
+                ),
+            )
+        return self._http_client
+
+    @property
+    def provider(self) -> "OpenRouterProvider":
+        """OpenRouter provider, created on first use (pydantic_ai is slow to import)."""
+        if self._provider is None:
+            from pydantic_ai.providers.openrouter import OpenRouterProvider
+
+            self._provider = OpenRouterProvider(
+                api_key=settings.openrouter_api_key,
+                http_client=self.http_client,
+            )
+        return self._provider
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled OpenRouter connections (on shutdown).
+
+        The client itself stays open: models created earlier keep using it,
+        and their next request opens a new pool.
+        """
+        if self._transport is not None:
+            await self._transport.aclose()
+
+    def _get_model(
+        self, primary: str, fallbacks: List[str], hedge_after_seconds: float = 0
+    ) -> "Model":
+        """Primary model, routed across its fallbacks when routing is enabled."""
+        from app.services.instrumented_model import InstrumentedOpenAIModel
+
+        models = [
+            InstrumentedOpenAIModel(name, provider=self.provider)
+            for name in dict.fromkeys([primary, *fallbacks])
+        ]
+        if not settings.llm_routing_enabled or len(models) == 1:
+            return models[0]
+
+        from app.services.routed_model import RoutedModel
+
+        return RoutedModel(
+            models,
+            latency=self.latency,
+            breaker=self.breaker,
+            hedge_after_seconds=hedge_after_seconds,
+        )
+
+    def get_chat_model(self) -> "Model":
+        """Get the primary chat model with OpenRouter provider (streams are hedged)."""
+        return self._get_model(
             settings.openrouter_model_primary,
-            provider=self.provider,
+            self.chat_fallback_models,
+            hedge_after_seconds=settings.llm_hedge_ttft_seconds,
         )
 
-    def get_large_model(self) -> OpenAIModel:
+    def get_large_model(self) -> "Model":
         """Get the primary large model with OpenRouter provider."""
-        return OpenAIModel(
-            settings.openrouter_large_model_primary,
-            provider=self.provider,
+        return self._get_model(
+            settings.openrouter_large_model_primary, self.large_fallback_models
         )
 
-    def get_chat_model_settings(self) -> OpenAIModelSettings:
+    def get_chat_model_settings(self) -> "OpenAIModelSettings":
         """Get model settings for chat operations with fallback configuration."""
+        from pydantic_ai.models.openai import OpenAIModelSettings
+
         return OpenAIModelSettings(
             temperature=settings.openrouter_model_temperature,
             extra_body={"models": self.chat_fallback_models},
         )
 
-    def get_large_model_settings(self) -> OpenAIModelSettings:
+    def get_large_model_settings(self) -> "OpenAIModelSettings":
         """Get model settings for large model operations with fallback configuration."""
+        from pydantic_ai.models.openai import OpenAIModelSettings
+
         return OpenAIModelSettings(
             temperature=settings.openrouter_large_model_temperature,
             extra_body={"models": self.large_fallback_models},
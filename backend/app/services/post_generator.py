@@ -2,12 +2,14 @@
 This service uses Pydantic-AI to generate posts based on user context.
 """
 
+import json
 from typing import List, Optional
 from dataclasses import dataclass
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
 
+from app.core.llm_response_cache import llm_response_cache, response_cache_key
 from app.services.model_config import model_config
 
 
@@ -22,6 +24,8 @@ class PostGenerationContext:
     conversation_context: Optional[str] = None
     previous_draft: Optional[str] = None
     user_feedback: Optional[str] = None
+    # Skip the LLM response cache (the user asked for a fresh draft)
+    bypass_cache: bool = False
 
 
 class GeneratedPost(BaseModel):
@@ -33,6 +37,71 @@ class GeneratedPost(BaseModel):
     )
 
 
+# Part of the response cache key, so schema changes invalidate cached posts
+GENERATED_POST_SCHEMA = json.dumps(GeneratedPost.model_json_schema(), sort_keys=True)
+
+# Agent instructions. Anything request-specific (source material, author
+# profile, drafts) goes in the user prompt so these never change between runs.
+POST_GENERATION_INSTRUCTIONS = """You are a world-class LinkedIn Ghostwriter and Content Strategist. Your expertise is in taking source material and conversation context to create compelling, authentic LinkedIn posts that drive engagement and position the user as a thought leader.
+
+The message you receive contains the context for the task:
+
+1.  **Source Material and Conversation Context:** the main content idea AND the conversation context with the user. Use both to understand what the user wants to convey and their personal perspective.
+
+2.  **Author's Profile:** the author's Bio and Writing Style.
+
+3.  **Specific Post Instructions:** the LinkedIn Post Style. This is a specific directive on the format and style of the post. You must follow it closely.
+
+**Your Task & Thought Process:**
+
+1.  **Understand the User's Intent**: Use the conversation context to understand:
+    - The user's specific angle or perspective on the topic
+    - Any personal experiences or anecdotes they've shared
+    - The key message they want to convey
+    - Their unique insights or takeaways
+
+2.  **Connect to the Author**: Frame the content from the author's perspective, using their Bio and the insights from the conversation. Include personal stories or opinions they've shared.
+
+3.  **Draft the Post**: Write the post following the LinkedIn Post Style, mimicking the author's Writing Style, and incorporating the conversational insights.
+
+**LinkedIn Post Best Practices to Apply:**
+
+-   **Use conversation insights**: If the user shared personal experiences, anecdotes, or specific perspectives in the conversation, incorporate them into the post
+-   **Provide their unique take**: Use the conversation context to understand their specific angle or opinion
+-   **Be human and authentic**: Write in a conversational tone. Use "I" statements. Use the user's writing style and any personal details they've shared
+-   **Structure for readability**: Use short paragraphs and white space
+
+**VERY IMPORTANT - Formatting and Content Rules:**
+
+-   **Plain Text Only:** The entire post must be plain text. Do NOT use any Markdown formatting (like `*bold*`, `_italics_`, or `- lists`).
+-   **No AI-giveaways:** Avoid generic phrases, emojis, or special characters (like em-dashes or arrows) that scream "AI-generated".
+-   **No Source Link:** Do NOT include the link to the original article in the post.
+-   **Topics, not Hashtags:** Identify a relevant topic for the post. Your options are: Education, Story-telling, Analysis, Validation, and/or Promotion. DO NOT format them as #hashtags.
+
+Finally, return the generated post and the topics in the required JSON format.
+"""
+
+POST_REVISION_INSTRUCTIONS = """You are an expert copy editor revising a LinkedIn post based on user feedback.
+Your primary goal is to follow the user's instructions precisely.
+
+The message you receive contains the original idea for the post, the previous draft, the user's feedback and the user's profile (for context).
+
+Instructions:
+1.  Carefully analyze the user's feedback to understand the requested changes.
+2.  Based on the feedback, decide whether to perform localized edits or a larger rewrite:
+    - If the user asks for **localized changes** (e.g., "remove the hashtags," "rephrase the second sentence," "fix a typo"), apply *only* those specific edits. Do not rewrite other parts of the post.
+    - If the user asks for a **rewrite** of a section or the entire post (e.g., "make this sound more professional," "rewrite this part to be a story"), then you should rewrite as requested.
+    - When in doubt, prefer making minimal, targeted edits to preserve the user's original voice.
+3.  Maintain the original tone and style unless the feedback specifies a change.
+4.  The revised post should be engaging and likely to get high engagement on LinkedIn.
+5.  The post must be plain text. DO NOT use markdown or special characters (like em-dashes) that suggest AI generation.
+6.  If the content idea was a URL, cite the source within the post but do not include the URL itself.
+7.  Identify a relevant topic for the post. Your options are: Education, Story-telling, Analysis, Validation, and/or Promotion. DO NOT format them as #hashtags.
+
+Finally, return the generated post and the topic in the required JSON format.
+"""
+
+
 class PostGeneratorService:
     """Service to generate posts using an AI agent with shared model configuration."""
 
@@ -52,7 +121,7 @@ class PostGeneratorService:
             output_type=GeneratedPost,
             model_settings=self.model_settings,
             retries=1,  # Built-in retry mechanism
-            system_prompt="",
+            instructions=POST_GENERATION_INSTRUCTIONS,
         )
 
     def _create_revision_agent(self) -> Agent:
@@ -62,9 +131,43 @@ class PostGeneratorService:
             output_type=GeneratedPost,
             model_settings=self.model_settings,
             retries=1,  # Built-in retry mechanism
-            system_prompt="",
+            instructions=POST_REVISION_INSTRUCTIONS,
         )
 
+    async def _run_cached(
+        self,
+        operation: str,
+        agent: Agent,
+        instructions: str,
+        prompt: str,
+        bypass_cache: bool,
+    ) -> GeneratedPost:
+        """Run ``agent`` on ``prompt`` through the LLM response cache."""
+        key = response_cache_key(
+            self.model.model_name,
+            self.model_settings,
+            instructions,
+            prompt,
+            GENERATED_POST_SCHEMA,
+        )
+
+        async def run() -> str:
+            result = await agent.run(prompt)
+            return result.output.model_dump_json()
+
+        response = await llm_response_cache.get_or_run(
+            operation, key, self.model.model_name, run, bypass=bypass_cache
+        )
+        return GeneratedPost.model_validate_json(response)
+
+    @staticmethod
+    def _source_material(idea_content: str, conversation_context: Optional[str]) -> str:
+        """Combine the content idea with the conversation context, if any."""
+        source_material = idea_content or "No specific content idea provided."
+        if conversation_context:
+            source_material += f"\n\nCONVERSATION CONTEXT:\n{conversation_context}"
+        return source_material
+
     async def generate_post(
         self,
         idea_content: str,
@@ -72,25 +175,22 @@ class PostGeneratorService:
         writing_style: Optional[str],
         linkedin_post_strategy: Optional[str],
         conversation_context: Optional[str] = None,
+        bypass_cache: bool = False,
     ) -> GeneratedPost:
         """
         Generates a LinkedIn post using the AI agent.
-        """
 
-        # Build the source material section
-        source_material = idea_content or "No specific content idea provided."
-        if conversation_context:
-            source_material += f"\n\nCONVERSATION CONTEXT:\n{conversation_context}"
-
-        prompt = f"""You are a world-class LinkedIn Ghostwriter and Content Strategist. Your expertise is in taking source material and conversation context to create compelling, authentic LinkedIn posts that drive engagement and position the user as a thought leader.
+        Identical requests are served from the LLM response cache when it is
+        enabled; ``bypass_cache`` forces a fresh generation.
+        """
+        source_material = self._source_material(idea_content, conversation_context)
 
-**Context for this Task:**
+        prompt = f"""**Context for this Task:**
 
 1.  **Source Material and Conversation Context:**
     ---
     {source_material}
     ---
-    This includes the main content idea AND the conversation context with the user. Use both to understand what the user wants to convey and their personal perspective.
 
 2.  **Author's Profile:**
     -   **Bio:** {bio}
@@ -98,40 +198,15 @@ class PostGeneratorService:
 
 3.  **Specific Post Instructions:**
     -   **LinkedIn Post Style:** {linkedin_post_strategy}
-    This is a specific directive on the format and style of the post. You must follow it closely.
-
-**Your Task & Thought Process:**
-
-1.  **Understand the User's Intent**: Use the conversation context to understand:
-    - The user's specific angle or perspective on the topic
-    - Any personal experiences or anecdotes they've shared
-    - The key message they want to convey
-    - Their unique insights or takeaways
-
-2.  **Connect to the Author**: Frame the content from the author's perspective, using their Bio and the insights from the conversation. Include personal stories or opinions they've shared.
-
-3.  **Draft the Post**: Write the post following the LinkedIn Post Style, mimicking the author's Writing Style, and incorporating the conversational insights.
-
-**LinkedIn Post Best Practices to Apply:**
-
--   **Use conversation insights**: If the user shared personal experiences, anecdotes, or specific perspectives in the conversation, incorporate them into the post
--   **Provide their unique take**: Use the conversation context to understand their specific angle or opinion
--   **Be human and authentic**: Write in a conversational tone. Use "I" statements. Use the user's writing style and any personal details they've shared
--   **Structure for readability**: Use short paragraphs and white space
-
-**VERY IMPORTANT - Formatting and Content Rules:**
-
--   **Plain Text Only:** The entire post must be plain text. Do NOT use any Markdown formatting (like `*bold*`, `_italics_`, or `- lists`).
--   **No AI-giveaways:** Avoid generic phrases, emojis, or special characters (like em-dashes or arrows) that scream "AI-generated".
--   **No Source Link:** Do NOT include the link to the original article in the post.
--   **Topics, not Hashtags:** Identify a relevant topic for the post. Your options are: Education, Story-telling, Analysis, Validation, and/or Promotion. DO NOT format them as #hashtags.
-
-Finally, return the generated post and the topics in the required JSON format.
 """
 
-        # Use the reusable agent instead of creating a new one
-        result = await self._generation_agent.run(prompt)
-        return result.output
+        return await self._run_cached(
+            "generate_post",
+            self._generation_agent,
+            POST_GENERATION_INSTRUCTIONS,
+            prompt,
+            bypass_cache,
+        )
 
     async def revise_post(
         self,
@@ -142,60 +217,39 @@ Finally, return the generated post and the topics in the required JSON format.
         previous_draft: Optional[str] = None,
         user_feedback: Optional[str] = None,
         conversation_context: Optional[str] = None,
+        bypass_cache: bool = False,
     ) -> GeneratedPost:
-        """Revises a LinkedIn post based on user feedback."""
-
-        # Build the source material section
-        source_material = idea_content or "No specific content idea provided."
-        if conversation_context:
-            source_material += f"\n\nCONVERSATION CONTEXT:\n{conversation_context}"
+        """Revises a LinkedIn post based on user feedback (cached like generate_post)."""
+        source_material = self._source_material(idea_content, conversation_context)
+
+        prompt = f"""The original idea for the post was:
+---
+{source_material}
+---
+
+Here is the previous draft:
+---
+{previous_draft}
+---
+
+Here is the user's feedback:
+---
+{user_feedback}
+---
+
+User Profile (for context):
+- Bio: {bio}
+- Writing Style: {writing_style}
+- LinkedIn Post Strategy: {linkedin_post_strategy}
+"""
 
-        prompt = f"""
-            You are an expert copy editor revising a LinkedIn post based on user feedback.
-            Your primary goal is to follow the user's instructions precisely.
-
-            - If the user asks for **localized changes** (e.g., "remove the hashtags", "rephrase the second sentence", "fix a typo"), apply *only* those specific edits. Do not rewrite other parts of the post.
-            - If the user asks for a **rewrite** of a section or the entire post (e.g., "make this sound more professional", "rewrite this part to be a story"), then you should rewrite as requested.
-            - When in doubt, prefer making minimal, targeted edits over a full rewrite to preserve the user's original voice and structure.
-
-            The original idea for the post was:
-            ---
-            {source_material}
-            ---
-
-            Here is the previous draft:
-            ---
-            {previous_draft}
-            ---
-
-            Here is the user's feedback:
-            ---
-            {user_feedback}
-            ---
-
-            User Profile (for context):
-            - Bio: {bio}
-            - Writing Style: {writing_style}
-            - LinkedIn Post Strategy: {linkedin_post_strategy}
-
-            Instructions:
-            1.  Carefully analyze the user's feedback to understand the requested changes.
-            2.  Based on the feedback, decide whether to perform localized edits or a larger rewrite:
-                - If the user asks for **localized changes** (e.g., "remove the hashtags," "rephrase the second sentence," "fix a typo"), apply *only* those specific edits. Do not rewrite other parts of the post.
-                - If the user asks for a **rewrite** of a section or the entire post (e.g., "make this sound more professional," "rewrite this part to be a story"), then you should rewrite as requested.
-                - When in doubt, prefer making minimal, targeted edits to preserve the user's original voice.
-            3.  Maintain the original tone and style unless the feedback specifies a change.
-            4.  The revised post should be engaging and likely to get high engagement on LinkedIn.
-            5.  The post must be plain text. DO NOT use markdown or special characters (like em-dashes) that suggest AI generation.
-            6.  If the content idea was a URL, cite the source within the post but do not include the URL itself.
-            7.  Identify a relevant topic for the post. Your options are: Education, Story-telling, Analysis, Validation, and/or Promotion. DO NOT format them as #hashtags.
-
-            Finally, return the generated post and the topic in the required JSON format.
-            """
-
-        # Use the reusable agent instead of creating a new one
-        result = await self._revision_agent.run(prompt)
-        return result.output
+        return await self._run_cached(
+            "revise_post",
+            self._revision_agent,
+            POST_REVISION_INSTRUCTIONS,
+            prompt,
+            bypass_cache,
+        )
 
 
 # Singleton instance used by the tool
@@ -220,6 +274,7 @@ async def generate_linkedin_post_tool(
             writing_style=ctx.deps.writing_style,
             linkedin_post_strategy=ctx.deps.linkedin_post_strategy,
             conversation_context=ctx.deps.conversation_context,
+            bypass_cache=ctx.deps.bypass_cache,
         )
         return post
     except Exception as e:
@@ -246,6 +301,7 @@ async def revise_linkedin_post_tool(
             previous_draft=ctx.deps.previous_draft,
             user_feedback=ctx.deps.user_feedback,
             conversation_context=ctx.deps.conversation_context,
+            bypass_cache=ctx.deps.bypass_cache,
         )
         return post
     except Exception as e:
@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.posts import Post
+from app.services.posts import PostsService
 
 
 class PostScheduleService:
@@ -47,6 +48,7 @@ class PostScheduleService:
             post.sharing_error = None
 
             await self.db.commit()
+            PostsService.invalidate_cached_counts(user_id)
             await self.db.refresh(post)
 
             logger.info(
@@ -78,6 +80,7 @@ class PostScheduleService:
             post.sharing_error = None
 
             await self.db.commit()
+            PostsService.invalidate_cached_counts(user_id)
             await self.db.refresh(post)
 
             logger.info(f"Unscheduled post {post_id}")
@@ -115,6 +118,7 @@ class PostScheduleService:
             post.sharing_error = None
 
             await self.db.commit()
+            PostsService.invalidate_cached_counts(user_id)
             await self.db.refresh(post)
 
             logger.info(
@@ -10,21 +10,19 @@ from uuid import UUID
 from fastapi import UploadFile
 
 from loguru import logger
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, bindparam, desc, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from google.cloud import storage
-from google.oauth2 import service_account
-from google.auth import default
-from google.auth import impersonated_credentials
-from google.cloud import iam_credentials_v1
 import asyncio
 
 from app.core.config import settings
+from app.core.signed_url_cache import signed_url_cache
 from app.models.posts import Post, PostMedia
-from app.schemas.posts import PostCreate, PostUpdate, PostBatchUpdate
+from app.schemas.posts import PostBatchUpdate, PostCreate, PostResponse, PostUpdate
 from app.services.profile import ProfileService
 from app.services.linkedin_service import LinkedInService
+from app.utils.cache import TTLCache
+from app.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
 
 
 class PostsService:
@@ -38,68 +36,214 @@ class PostsService:
     _shared_bucket = None
     _credentials_initialized = False
 
+    # Credential bootstrap state: pending -> initializing -> ready | failed
+    _credentials_status = "pending"
+    _credentials_task: Optional[asyncio.Task] = None
+
+    # Longest a GCS operation waits for an in-flight bootstrap
+    CREDENTIALS_WAIT_SECONDS = 30.0
+
+    # Signed URLs generated in parallel when signing a page of media
+    MEDIA_SIGNING_CONCURRENCY = 8
+
+    # Files uploaded to GCS in parallel per request, and the resumable upload
+    # chunk size (a multiple of 256 KiB) that bounds memory per file
+    MEDIA_UPLOAD_CONCURRENCY = 4
+    MEDIA_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+    # Per-user post totals, keyed by (user_id, kind, ...); invalidated on writes
+    _count_cache = TTLCache(
+        maxsize=4096, ttl_seconds=settings.posts_count_cache_ttl_seconds
+    )
+
     def __init__(self, db: AsyncSession):
         self._db = db
-        self._signed_url_cache = {}  # Instance-level cache for signed URLs
 
-        # Use shared credentials (initialized once per application lifecycle)
-        self.storage_client = PostsService._shared_storage_client
-        self.signing_credentials = PostsService._shared_signing_credentials
-        self.iam_client = PostsService._shared_iam_client
-        self.service_account_email = PostsService._shared_service_account_email
-        self.bucket = PostsService._shared_bucket
+    # Shared credentials are read on access so services created before the
+    # startup bootstrap finished still see the clients once they are ready.
+    @property
+    def storage_client(self):
+        return PostsService._shared_storage_client
+
+    @property
+    def signing_credentials(self):
+        return PostsService._shared_signing_credentials
 
-        # Initialize credentials if not already done
-        if settings.environment != "test" and not PostsService._credentials_initialized:
-            # Use synchronous initialization since __init__ can't be async
-            # This will only run once per application lifecycle
-            self._ensure_credentials_initialized()
+    @property
+    def iam_client(self):
+        return PostsService._shared_iam_client
+
+    @property
+    def service_account_email(self) -> Optional[str]:
+        return PostsService._shared_service_account_email
+
+    @property
+    def bucket(self):
+        return PostsService._shared_bucket
+
+    @classmethod
+    def credentials_status(cls) -> str:
+        """
+        Get the GCS credential bootstrap status for health reporting.
+
+        Returns:
+            str: "disabled" in tests, else "pending", "initializing", "ready"
+            or "failed"
+        """
+        if settings.environment == "test":
+            return "disabled"
+        return cls._credentials_status
+
+    @classmethod
+    def start_credentials_bootstrap(cls) -> Optional[asyncio.Task]:
+        """
+        Start the one-time GCS credential bootstrap on a worker thread.
+
+        Credential discovery does blocking file, metadata-server and SDK
+        work, so it runs via ``asyncio.to_thread`` rather than on the event
+        loop. Safe to call repeatedly; the bootstrap is only started once
+        per event loop and never retried after a failure.
+
+        Returns:
+            Optional[asyncio.Task]: The bootstrap task, or None when there is
+            nothing to wait for (tests, or already initialized)
+        """
+        if settings.environment == "test" or cls._credentials_initialized:
+            return None
+
+        task = cls._credentials_task
+        loop = asyncio.get_running_loop()
+        if task is None or (task.get_loop() is not loop and not task.done()):
+            task = loop.create_task(cls._bootstrap_credentials())
+            cls._credentials_task = task
+        return task
+
+    @classmethod
+    async def _bootstrap_credentials(cls) -> None:
+        cls._credentials_status = "initializing"
+        try:
+            await asyncio.to_thread(cls._ensure_credentials_initialized)
+        finally:
+            cls._credentials_status = (
+                "ready" if cls._credentials_initialized else "failed"
+            )
+
+    async def _wait_for_storage(self) -> None:
+        """Wait for an in-flight credential bootstrap without blocking the loop."""
+        task = PostsService.start_credentials_bootstrap()
+        if task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(task), timeout=self.CREDENTIALS_WAIT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "GCS credentials still initializing after "
+                f"{self.CREDENTIALS_WAIT_SECONDS:.0f}s"
+            )
 
     async def upload_media_for_post(
         self, user_id: UUID, post_id: UUID, files: List[UploadFile]
     ) -> List[PostMedia]:
-        """Uploads media for a post to GCS and creates PostMedia records."""
+        """
+        Upload media for a post to GCS and create PostMedia records.
+
+        Files are streamed from their spooled temporary files to GCS with
+        chunked resumable uploads on worker threads, up to
+        ``MEDIA_UPLOAD_CONCURRENCY`` at a time, so large videos are never
+        held in memory and the event loop is never blocked. All records are
+        inserted in one transaction once every upload has succeeded; if any
+        upload or the insert fails, the objects already uploaded are removed.
+        """
         post = await self.get_post(user_id, post_id)
         if not post:
             raise Exception("Post not found")
 
-        created_media = []
-        for file in files:
-            storage_path = f"{user_id}/{post_id}/{file.filename}"
-            blob = self.bucket.blob(storage_path)
+        await self._wait_for_storage()
+        semaphore = asyncio.Semaphore(self.MEDIA_UPLOAD_CONCURRENCY)
 
-            try:
-                # TODO: Use async upload method when available in google-cloud-storage
-                blob.upload_from_string(
-                    await file.read(), content_type=file.content_type
+        async def upload(file: UploadFile):
+            storage_path = f"{user_id}/{post_id}/{file.filename}"
+            blob = self.bucket.blob(
+                storage_path, chunk_size=self.MEDIA_UPLOAD_CHUNK_SIZE
+            )
+            async with semaphore:
+                await asyncio.to_thread(
+                    blob.upload_from_file,
+                    file.file,
+                    content_type=file.content_type,
+                    rewind=True,
                 )
-            except Exception as e:
-                logger.error(f"Error uploading to GCS: {e}")
-                raise
+            return file, blob
 
-            media_type = "image" if "image" in file.content_type else "video"
+        results = await asyncio.gather(
+            *(upload(file) for file in files), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            logger.error(f"Error uploading to GCS: {errors[0]}")
+            await self._delete_blobs_quietly(
+                [r[1] for r in results if not isinstance(r, BaseException)]
+            )
+            raise errors[0]
 
-            post_media = PostMedia(
+        created_media = [
+            PostMedia(
                 post_id=post_id,
                 user_id=user_id,
-                media_type=media_type,
+                media_type="image" if "image" in (file.content_type or "") else "video",
                 file_name=file.filename,
-                storage_path=storage_path,
+                storage_path=blob.name,
                 gcs_url=blob.public_url,
             )
-            self._db.add(post_media)
+            for file, blob in results
+        ]
+        try:
+            self._db.add_all(created_media)
             await self._db.commit()
-            await self._db.refresh(post_media)
-            created_media.append(post_media)
+        except Exception as e:
+            logger.error(f"Error saving media records for post {post_id}: {e}")
+            await self._db.rollback()
+            await self._delete_blobs_quietly([blob for _, blob in results])
+            raise
 
+        # Load server-generated timestamps for all rows in one query
+        result = await self._db.execute(
+            select(PostMedia)
+            .where(PostMedia.id.in_([media.id for media in created_media]))
+            .execution_options(populate_existing=True)
+        )
+        result.scalars().all()
         return created_media
 
+    @staticmethod
+    def _delete_blob_quietly(blob) -> None:
+        """Delete a GCS object, logging (not raising) failures."""
+        try:
+            blob.delete()
+            signed_url_cache.invalidate_path(blob.name)
+        except Exception as e:
+            logger.error(
+                f"Error removing {blob.name} from GCS after failed upload: {e}"
+            )
+
+    async def _delete_blobs_quietly(self, blobs: List[Any]) -> None:
+        """Remove uploaded objects concurrently on worker threads."""
+        await asyncio.gather(
+            *(asyncio.to_thread(self._delete_blob_quietly, blob) for blob in blobs)
+        )
+
     @classmethod
     def _ensure_credentials_initialized(cls):
         """Ensure credentials are initialized exactly once per application lifecycle."""
         if cls._credentials_initialized:
             return
 
+        # Deferred: the Google Cloud SDKs are slow to import
+        from google.auth import impersonated_credentials
+        from google.cloud import iam_credentials_v1, storage
+
         try:
             logger.info("Initializing GCS credentials (one-time setup)")
 
@@ -172,6 +316,9 @@ class PostsService:
     @classmethod
     def _initialize_shared_credentials(cls):
         """Initialize service account credentials for GCS signing (class-level)."""
+        from google.auth import default
+        from google.oauth2 import service_account
+
         try:
             # Try to use service account key file if provided
             if settings.gcp_service_account_key_path and os.path.exists(
@@ -257,6 +404,8 @@ class PostsService:
     @staticmethod
     def _get_service_account_email_static() -> Optional[str]:
         """Static version of _get_service_account_email for class-level initialization."""
+        from google.auth import default
+
         try:
             # Try to get from default credentials
             credentials, project = default()
@@ -288,42 +437,24 @@ class PostsService:
         if not credentials:
             return False
 
+        from google.auth import impersonated_credentials
+
         # Check if these are impersonated credentials
         return isinstance(credentials, impersonated_credentials.Credentials)
 
-    def _get_cache_key(self, storage_path: str, expiration_hours: int = 1) -> str:
-        """Generate cache key for signed URL."""
-        return f"signed_url:{storage_path}:{expiration_hours}"
-
-    def _is_url_expired(self, cached_data: Dict) -> bool:
-        """Check if cached signed URL is expired or will expire soon (within 5 minutes)."""
-        if "expires_at" not in cached_data:
-            return True
-
-        expires_at = datetime.fromisoformat(cached_data["expires_at"])
-        # Consider expired if it expires within 5 minutes
-        buffer_time = timedelta(minutes=5)
-        return datetime.now(timezone.utc) + buffer_time >= expires_at
-
     def _generate_signed_url(
         self, storage_path: str, expiration_hours: int = 1
     ) -> Optional[str]:
-        """Generate a signed URL for a GCS object with caching."""
+        """Get a signed URL for a GCS object from the process-wide cache."""
         if not self.bucket or not storage_path:
             return None
 
-        cache_key = self._get_cache_key(storage_path, expiration_hours)
-
-        # Check cache first
-        if cache_key in self._signed_url_cache:
-            cached_data = self._signed_url_cache[cache_key]
-            if not self._is_url_expired(cached_data):
-                logger.debug(f"Using cached signed URL for {storage_path}")
-                return cached_data["url"]
-            else:
-                # Remove expired entry
-                del self._signed_url_cache[cache_key]
+        return signed_url_cache.get_or_sign(
+            storage_path, expiration_hours, self._sign_url
+        )
 
+    def _sign_url(self, storage_path: str, expiration_hours: int) -> Optional[str]:
+        """Sign a URL for a GCS object (uncached; may call the IAM API)."""
         try:
             blob = self.bucket.blob(storage_path)
             expiration = timedelta(hours=expiration_hours)
@@ -340,7 +471,9 @@ class PostsService:
                     if self._has_private_key(self.signing_credentials)
                     else "impersonated"
                 )
-                logger.debug(f"Using {credential_type} credentials for {storage_path}")
+                logger.debug(
+                    "Using {} credentials for {}", credential_type, storage_path
+                )
                 signed_url = blob.generate_signed_url(
                     version="v4",
                     expiration=expiration,
@@ -349,7 +482,7 @@ class PostsService:
                 )
             # Method 2: Use IAM Service Account Credentials API (fallback for GCP environments)
             elif self.iam_client and self.service_account_email:
-                logger.debug(f"Using IAM credentials API fallback for {storage_path}")
+                logger.debug("Using IAM credentials API fallback for {}", storage_path)
                 signed_url = self._generate_signed_url_with_iam(
                     blob, expiration, storage_path
                 )
@@ -362,7 +495,9 @@ class PostsService:
                     else "None"
                 )
                 logger.debug(
-                    f"Attempting final fallback signing for {storage_path} with {credential_type}"
+                    "Attempting final fallback signing for {} with {}",
+                    storage_path,
+                    credential_type,
                 )
 
                 # For user OAuth2 credentials, this will fail with a helpful error message
@@ -374,15 +509,7 @@ class PostsService:
                 )
 
             if signed_url:
-                # Cache the signed URL
-                expires_at = datetime.now(timezone.utc) + expiration
-                self._signed_url_cache[cache_key] = {
-                    "url": signed_url,
-                    "expires_at": expires_at.isoformat(),
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                }
-
-                logger.debug(f"Generated and cached signed URL for {storage_path}")
+                logger.debug("Generated signed URL for {}", storage_path)
                 return signed_url
             else:
                 logger.error(f"Failed to generate signed URL for {storage_path}")
@@ -401,6 +528,8 @@ class PostsService:
             import urllib.parse
             from datetime import datetime, timezone
 
+            from google.cloud import iam_credentials_v1
+
             # Calculate expiration timestamp
             expires_timestamp = int(
                 (datetime.now(timezone.utc) + expiration).timestamp()
@@ -468,25 +597,19 @@ class PostsService:
 
         # Delete from GCS
         if media.storage_path:
+            await self._wait_for_storage()
             try:
                 blob = self.bucket.blob(media.storage_path)
                 if blob.exists():
                     # TODO: Use async delete method
                     blob.delete()
+                signed_url_cache.invalidate_path(media.storage_path)
             except Exception as e:
                 logger.error(f"Error deleting {media.storage_path} from GCS: {e}")
 
         await self._db.delete(media)
         await self._db.commit()
 
-    async def _get_post_by_ids(self, post_ids: List[UUID]) -> List[Post]:
-        """Get a post by id."""
-        query = (
-            select(Post).where(Post.id.in_(post_ids)).options(selectinload(Post.media))
-        )
-        result = await self._db.execute(query)
-        return result.scalars().all()
-
     async def get_posts_list(
         self,
         user_id: UUID,
@@ -498,129 +621,362 @@ class PostsService:
         size: int = 20,
         order_by: str = "scheduled_at",
         order_direction: str = "desc",
+        include_signed_media: bool = False,
+        paginate_by_cursor: bool = False,
+        cursor: Optional[str] = None,
+        include_total: Optional[bool] = None,
     ) -> Dict[str, Any]:
-        """Get a paginated list of posts for a user."""
+        """
+        Get a paginated list of posts for a user.
+
+        With ``include_signed_media``, items are returned as ``PostResponse``
+        models whose media carry signed URLs, signed for the whole page in
+        one batch, so clients need no per-post media requests.
+
+        With ``paginate_by_cursor``, pages are fetched by keyset on
+        ``(order_by, id)`` starting after ``cursor``, so every page costs the
+        same regardless of depth. The total is then only computed when
+        ``include_total`` is set, and is served from a short-lived per-user
+        cache.
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid or cursor mode is
+                combined with several order_by columns
+        """
+        if include_total is None:
+            include_total = not paginate_by_cursor
         try:
-            offset = (page - 1) * size
-
-            filters = [Post.user_id == user_id]
-            if platform:
-                filters.append(Post.platform == platform)
-            if status:
-                filters.append(Post.status.in_(status))
-
-            # Enhanced date filtering logic for calendar queries
-            if after_date or before_date:
-                date_filters = []
-
-                # For scheduled posts, filter by scheduled_at
-                if after_date and before_date:
-                    scheduled_filter = and_(
-                        Post.scheduled_at >= after_date,
-                        Post.scheduled_at <= before_date,
-                        Post.status == "scheduled",
-                    )
-                    posted_filter = and_(
-                        Post.posted_at >= after_date,
-                        Post.posted_at <= before_date,
-                        Post.status == "posted",
-                    )
-                    date_filters.extend([scheduled_filter, posted_filter])
-                elif after_date:
-                    scheduled_filter = and_(
-                        Post.scheduled_at >= after_date, Post.status == "scheduled"
-                    )
-                    posted_filter = and_(
-                        Post.posted_at >= after_date, Post.status == "posted"
-                    )
-                    date_filters.extend([scheduled_filter, posted_filter])
-                elif before_date:
-                    scheduled_filter = and_(
-                        Post.scheduled_at <= before_date, Post.status == "scheduled"
-                    )
-                    posted_filter = and_(
-                        Post.posted_at <= before_date, Post.status == "posted"
-                    )
-                    date_filters.extend([scheduled_filter, posted_filter])
+            filters = self._build_list_filters(
+                user_id, platform, status, after_date, before_date
+            )
+            if paginate_by_cursor:
+                count_key = (
+                    str(user_id),
+                    "list_total",
+                    platform,
+                    tuple(sorted(status or ())),
+                    after_date,
+                    before_date,
+                )
+                return await self._get_posts_page_by_cursor(
+                    filters,
+                    cursor=cursor,
+                    size=size,
+                    order_by=order_by,
+                    order_direction=order_direction,
+                    count_key=count_key if include_total else None,
+                    include_signed_media=include_signed_media,
+                )
+            return await self._get_posts_page_by_offset(
+                filters,
+                page=page,
+                size=size,
+                order_by=order_by,
+                order_direction=order_direction,
+                include_total=include_total,
+                include_signed_media=include_signed_media,
+            )
+        except Exception as e:
+            logger.error(f"Error getting posts list for user {user_id}: {e}")
+            raise
 
-                # If we have multiple status types and date filters, we need to handle them properly
-                if (
-                    status
-                    and len(status) > 1
-                    and ("scheduled" in status and "posted" in status)
-                ):
-                    # For calendar queries with both scheduled and posted posts
-                    from sqlalchemy import or_
-
-                    filters.append(or_(*date_filters))
-                elif status and "scheduled" in status and "posted" not in status:
-                    # Only scheduled posts
-                    if after_date:
-                        filters.append(Post.scheduled_at >= after_date)
-                    if before_date:
-                        filters.append(Post.scheduled_at <= before_date)
-                elif status and "posted" in status and "scheduled" not in status:
-                    # Only posted posts
-                    if after_date:
-                        filters.append(Post.posted_at >= after_date)
-                    if before_date:
-                        filters.append(Post.posted_at <= before_date)
-                else:
-                    # Default behavior for backward compatibility
-                    if after_date:
-                        filters.append(Post.scheduled_at >= after_date)
-                    if before_date:
-                        filters.append(Post.scheduled_at <= before_date)
+    @staticmethod
+    def _build_list_filters(
+        user_id: UUID,
+        platform: Optional[str],
+        status: Optional[List[str]],
+        after_date: Optional[datetime],
+        before_date: Optional[datetime],
+    ) -> List[Any]:
+        """Build the WHERE clauses shared by both pagination modes."""
+        filters = [Post.user_id == user_id]
+        if platform:
+            filters.append(Post.platform == platform)
+        if status:
+            filters.append(Post.status.in_(status))
+
+        # Enhanced date filtering logic for calendar queries
+        if after_date or before_date:
+            date_filters = []
+
+            # For scheduled posts, filter by scheduled_at
+            if after_date and before_date:
+                scheduled_filter = and_(
+                    Post.scheduled_at >= after_date,
+                    Post.scheduled_at <= before_date,
+                    Post.status == "scheduled",
+                )
+                posted_filter = and_(
+                    Post.posted_at >= after_date,
+                    Post.posted_at <= before_date,
+                    Post.status == "posted",
+                )
+                date_filters.extend([scheduled_filter, posted_filter])
+            elif after_date:
+                scheduled_filter = and_(
+                    Post.scheduled_at >= after_date, Post.status == "scheduled"
+                )
+                posted_filter = and_(
+                    Post.posted_at >= after_date, Post.status == "posted"
+                )
+                date_filters.extend([scheduled_filter, posted_filter])
+            elif before_date:
+                scheduled_filter = and_(
+                    Post.scheduled_at <= before_date, Post.status == "scheduled"
+                )
+                posted_filter = and_(
+                    Post.posted_at <= before_date, Post.status == "posted"
+                )
+                date_filters.extend([scheduled_filter, posted_filter])
 
+            # If we have multiple status types and date filters, we need to handle them properly
+            if (
+                status
+                and len(status) > 1
+                and ("scheduled" in status and "posted" in status)
+            ):
+                # For calendar queries with both scheduled and posted posts
+                filters.append(or_(*date_filters))
+            elif status and "scheduled" in status and "posted" not in status:
+                # Only scheduled posts
+                if after_date:
+                    filters.append(Post.scheduled_at >= after_date)
+                if before_date:
+                    filters.append(Post.scheduled_at <= before_date)
+            elif status and "posted" in status and "scheduled" not in status:
+                # Only posted posts
+                if after_date:
+                    filters.append(Post.posted_at >= after_date)
+                if before_date:
+                    filters.append(Post.posted_at <= before_date)
+            else:
+                # Default behavior for backward compatibility
+                if after_date:
+                    filters.append(Post.scheduled_at >= after_date)
+                if before_date:
+                    filters.append(Post.scheduled_at <= before_date)
+        return filters
+
+    @staticmethod
+    def _single_column_order(order_by: str, order_direction: str) -> List[Any]:
+        """
+        ORDER BY for a single posts column, with ``id`` as the tie-breaker.
+
+        NULLs sort below every value (last when descending, first when
+        ascending), so either direction is a forward or backward walk of the
+        ``(user_id, status, <column> DESC NULLS LAST, id DESC)`` indexes.
+        """
+        column = getattr(Post, order_by)
+        if order_direction == "desc":
+            ordered, tie_breaker = column.desc(), Post.id.desc()
+            if Post.__table__.columns[order_by].nullable:
+                ordered = ordered.nulls_last()
+        else:
+            ordered, tie_breaker = column.asc(), Post.id.asc()
+            if Post.__table__.columns[order_by].nullable:
+                ordered = ordered.nulls_first()
+        return [ordered, tie_breaker]
+
+    async def _get_posts_page_by_offset(
+        self,
+        filters: List[Any],
+        page: int,
+        size: int,
+        order_by: str,
+        order_direction: str,
+        include_total: bool,
+        include_signed_media: bool,
+    ) -> Dict[str, Any]:
+        """Fetch one OFFSET/LIMIT page, optionally with the filtered total."""
+        offset = (page - 1) * size
+        total = total_pages = None
+        if include_total:
             count_query = select(func.count()).select_from(Post).where(and_(*filters))
             count_result = await self._db.execute(count_query)
             total = count_result.scalar() or 0
             total_pages = math.ceil(total / size) if size > 0 else 0
 
-            # Handle multiple order_by fields for calendar queries
-            order_fields = []
-            if "," in order_by:
-                # Multiple order fields (e.g., "scheduled_at,posted_at")
-                for field in order_by.split(","):
-                    field = field.strip()
-                    if hasattr(Post, field):
-                        if order_direction == "desc":
-                            order_fields.append(desc(getattr(Post, field)))
-                        else:
-                            order_fields.append(getattr(Post, field))
-            else:
-                # Single order field
-                if hasattr(Post, order_by):
+        # Handle multiple order_by fields for calendar queries
+        order_fields = []
+        if "," in order_by:
+            # Multiple order fields (e.g., "scheduled_at,posted_at")
+            for field in order_by.split(","):
+                field = field.strip()
+                if hasattr(Post, field):
                     if order_direction == "desc":
-                        order_fields.append(desc(getattr(Post, order_by)))
+                        order_fields.append(desc(getattr(Post, field)))
                     else:
-                        order_fields.append(getattr(Post, order_by))
-                else:
-                    # Fallback to created_at if order_by field doesn't exist
-                    order_fields.append(desc(Post.created_at))
+                        order_fields.append(getattr(Post, field))
+        elif order_by in Post.__table__.columns:
+            # Single order field, in the same order as cursor pages
+            order_fields = self._single_column_order(order_by, order_direction)
+        else:
+            # Fallback to created_at if order_by field doesn't exist
+            order_fields = self._single_column_order("created_at", "desc")
 
-            query = (
-                select(Post)
-                .where(and_(*filters))
-                .options(selectinload(Post.media))
-                .order_by(*order_fields)
-                .offset(offset)
-                .limit(size)
+        query = (
+            select(Post)
+            .where(and_(*filters))
+            .options(selectinload(Post.media))
+            .order_by(*order_fields)
+            .offset(offset)
+            .limit(size)
+        )
+
+        result = await self._db.execute(query)
+        posts = result.scalars().all()
+        if include_signed_media:
+            posts = await self._with_signed_media(posts)
+
+        return {
+            "items": posts,
+            "total": total,
+            "page": page,
+            "size": size,
+            "total_pages": total_pages,
+        }
+
+    async def _get_posts_page_by_cursor(
+        self,
+        filters: List[Any],
+        cursor: Optional[str],
+        size: int,
+        order_by: str,
+        order_direction: str,
+        count_key: Optional[tuple],
+        include_signed_media: bool,
+    ) -> Dict[str, Any]:
+        """
+        Fetch one keyset page ordered by ``(order_by, id)``.
+
+        NULLs sort below every value, as in ``_single_column_order``.
+        """
+        if "," in order_by:
+            raise InvalidCursorError(
+                "Cursor pagination supports a single order_by column"
             )
+        if order_by not in Post.__table__.columns:
+            order_by, order_direction = "created_at", "desc"
+
+        column = getattr(Post, order_by)
+        nullable = Post.__table__.columns[order_by].nullable
+        descending = order_direction == "desc"
+        page_filters = list(filters)
+
+        if cursor:
+            position = decode_cursor(cursor, order_by, order_direction)
+            value, last_id = position["value"], position["id"]
+            id_after = Post.id < last_id if descending else Post.id > last_id
+            if value is None:
+                after = [and_(column.is_(None), id_after)]
+                if not descending:
+                    after.append(column.is_not(None))
+            else:
+                after = [
+                    column < value if descending else column > value,
+                    and_(column == value, id_after),
+                ]
+                if nullable and descending:
+                    after.append(column.is_(None))
+            page_filters.append(or_(*after))
 
-            result = await self._db.execute(query)
-            posts = result.scalars().all()
+        query = (
+            select(Post)
+            .where(and_(*page_filters))
+            .options(selectinload(Post.media))
+            .order_by(*self._single_column_order(order_by, order_direction))
+            .limit(size + 1)
+        )
+        result = await self._db.execute(query)
+        posts = result.scalars().all()
+
+        next_cursor = None
+        if len(posts) > size:
+            posts = posts[:size]
+            last = posts[-1]
+            next_cursor = encode_cursor(
+                order_by, order_direction, getattr(last, order_by), last.id
+            )
 
-            return {
-                "items": posts,
-                "total": total,
-                "page": page,
-                "size": size,
-                "total_pages": total_pages,
-            }
-        except Exception as e:
-            logger.error(f"Error getting posts list for user {user_id}: {e}")
-            raise
+        total = total_pages = None
+        if count_key is not None:
+            total = self._count_cache.get(count_key)
+            if total is None:
+                count_result = await self._db.execute(
+                    select(func.count()).select_from(Post).where(and_(*filters))
+                )
+                total = count_result.scalar() or 0
+                self._count_cache.set(count_key, total)
+            total_pages = math.ceil(total / size) if size > 0 else 0
+
+        if include_signed_media:
+            posts = await self._with_signed_media(posts)
+
+        return {
+            "items": posts,
+            "total": total,
+            "page": None,
+            "size": size,
+            "total_pages": total_pages,
+            "next_cursor": next_cursor,
+        }
+
+    @classmethod
+    def invalidate_cached_counts(cls, user_id: UUID) -> None:
+        """Drop cached totals/counts for a user after their posts change."""
+        user_key = str(user_id)
+        cls._count_cache.invalidate_where(lambda key, _value: key[0] == user_key)
+
+    async def _sign_storage_paths(
+        self, storage_paths: List[str], expiration_hours: int = 1
+    ) -> Dict[str, Optional[str]]:
+        """
+        Sign many storage paths concurrently on worker threads.
+
+        Cached URLs come back without signing work; misses (which may call
+        the IAM API) run in parallel, bounded by ``MEDIA_SIGNING_CONCURRENCY``.
+
+        Returns:
+            Dict mapping each unique storage path to its signed URL or None
+        """
+        await self._wait_for_storage()
+        semaphore = asyncio.Semaphore(self.MEDIA_SIGNING_CONCURRENCY)
+
+        async def sign(path: str) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._generate_signed_url, path, expiration_hours
+                )
+
+        unique_paths = list(dict.fromkeys(storage_paths))
+        urls = await asyncio.gather(*(sign(path) for path in unique_paths))
+        return dict(zip(unique_paths, urls))
+
+    async def _with_signed_media(self, posts: List[Post]) -> List[PostResponse]:
+        """Convert posts to responses with signed media URLs (not persisted)."""
+        signed_urls = await self._sign_storage_paths(
+            [m.storage_path for post in posts for m in post.media if m.storage_path]
+        )
+
+        responses = []
+        for post in posts:
+            response = PostResponse.model_validate(post)
+            media = []
+            for item, media_response in zip(post.media, response.media):
+                if item.storage_path:
+                    signed_url = signed_urls.get(item.storage_path)
+                    if not signed_url:
+                        logger.warning(
+                            f"Failed to generate signed URL for {item.storage_path}, skipping media item"
+                        )
+                        continue
+                    media_response.gcs_url = signed_url
+                elif not item.gcs_url:
+                    continue
+                media.append(media_response)
+            response.media = media
+            responses.append(response)
+        return responses
 
     async def get_post(self, user_id: UUID, post_id: UUID) -> Optional[Post]:
         """Get a specific post."""
@@ -658,6 +1014,7 @@ class PostsService:
 
             self._db.add(post)
             await self._db.commit()
+            self.invalidate_cached_counts(user_id)
 
             # Eagerly load media relationship to prevent lazy-loading outside of async context
             result = await self._db.execute(
@@ -686,6 +1043,7 @@ class PostsService:
                 setattr(post, field, value)
 
             await self._db.commit()
+            self.invalidate_cached_counts(user_id)
             await self._db.refresh(post)
             return post
 
@@ -696,20 +1054,55 @@ class PostsService:
 
     async def batch_update_posts(
         self, user_id: UUID, posts: PostBatchUpdate
-    ) -> List[Post]:
-        """Batch update posts."""
+    ) -> Dict[str, Any]:
+        """
+        Batch update posts in one transaction.
+
+        Items are grouped by the set of fields they change and each group is
+        applied as one executemany ``UPDATE ... WHERE id = :id AND
+        user_id = :user_id``, so ownership is enforced per row in SQL and
+        posts of other users are silently skipped. The updated posts are then
+        fetched with a single SELECT.
+        """
         try:
             items = posts.posts
+            posts_table = Post.__table__
+            groups: Dict[tuple, List[Dict[str, Any]]] = {}
             for post_item in items:
-                # Convert batch item to PostUpdate while excluding the id to avoid primary key updates
-                update_data = PostUpdate.model_validate(
+                # Exclude the id to avoid primary key updates
+                changes = PostUpdate.model_validate(
                     post_item.model_dump(exclude={"id"}, exclude_unset=True)
+                ).model_dump(exclude_unset=True)
+                if not changes:
+                    continue
+                params = {f"b_{field}": value for field, value in changes.items()}
+                params.update(b_id=post_item.id, b_user_id=user_id)
+                groups.setdefault(tuple(sorted(changes)), []).append(params)
+
+            for fields, rows in groups.items():
+                statement = (
+                    update(posts_table)
+                    .where(
+                        posts_table.c.id == bindparam("b_id"),
+                        posts_table.c.user_id == bindparam("b_user_id"),
+                    )
+                    .values({field: bindparam(f"b_{field}") for field in fields})
                 )
-                await self.update_post(user_id, post_item.id, update_data)
+                await self._db.execute(statement, rows)
+
+            await self._db.commit()
+            self.invalidate_cached_counts(user_id)
 
-            updated_posts = await self._get_post_by_ids(
-                [post_item.id for post_item in items]
+            result = await self._db.execute(
+                select(Post)
+                .where(
+                    Post.user_id == user_id,
+                    Post.id.in_([post_item.id for post_item in items]),
+                )
+                .options(selectinload(Post.media))
+                .execution_options(populate_existing=True)
             )
+            updated_posts = result.scalars().all()
 
             return {
                 "items": updated_posts,
@@ -732,6 +1125,7 @@ class PostsService:
 
             await self._db.delete(post)
             await self._db.commit()
+            self.invalidate_cached_counts(user_id)
             return True
 
         except Exception as e:
@@ -748,6 +1142,7 @@ class PostsService:
 
             # Delete any associated media files (GCS & DB)
             if post.media:
+                await self._wait_for_storage()
                 for media_item in list(post.media):
                     # Remove from GCS if we have a storage path & bucket is configured
                     if media_item.storage_path and self.bucket:
@@ -756,6 +1151,7 @@ class PostsService:
                             if blob.exists():
                                 # TODO: use async delete when available
                                 blob.delete()
+                            signed_url_cache.invalidate_path(media_item.storage_path)
                         except Exception as e:
                             logger.error(
                                 f"Error deleting media {media_item.storage_path} from GCS during dismiss: {e}"
@@ -771,6 +1167,7 @@ class PostsService:
             post.status = "dismissed"
 
             await self._db.commit()
+            self.invalidate_cached_counts(user_id)
             await self._db.refresh(post)
             return post
 
@@ -788,6 +1185,7 @@ class PostsService:
 
             post.status = "posted"
             await self._db.commit()
+            self.invalidate_cached_counts(user_id)
             await self._db.refresh(post)
             return post
 
@@ -850,6 +1248,7 @@ class PostsService:
 
                 media_payloads = []
                 if post.media:
+                    await self._wait_for_storage()
                     for media_item in post.media:
                         if (
                             media_item.media_type in ["image", "video"]
@@ -940,13 +1339,14 @@ class PostsService:
         if not post:
             raise Exception("Post not found")
 
+        signed_urls = await self._sign_storage_paths(
+            [media.storage_path for media in post.media if media.storage_path]
+        )
+
         media_items: List[PostMedia] = []
         for media in post.media:
             if media.storage_path:
-                # Generate signed URL with caching
-                signed_url = self._generate_signed_url(
-                    media.storage_path, expiration_hours=1
-                )
+                signed_url = signed_urls.get(media.storage_path)
                 if signed_url:
                     # Do not persist to DB; modify in-memory only
                     media.gcs_url = signed_url  # type: ignore
@@ -965,39 +1365,36 @@ class PostsService:
     async def get_post_counts(self, user_id: UUID) -> Dict[str, int]:
         """Return counts of drafts, scheduled, and posted posts for a user.
 
-        Drafts are considered any posts in status: suggested, saved, or draft.
+        Drafts are considered any posts in status: suggested or draft. All
+        counts come from a single ``GROUP BY status`` scan and are cached per
+        user until one of their posts changes (or the cache TTL passes).
         """
+        cache_key = (str(user_id), "status_counts")
+        cached = self._count_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            # Drafts (multiple statuses)
             draft_statuses = ["suggested", "draft"]
 
-            draft_count_query = (
-                select(func.count())
-                .select_from(Post)
-                .where(Post.user_id == user_id, Post.status.in_(draft_statuses))
-            )
-            scheduled_count_query = (
-                select(func.count())
-                .select_from(Post)
-                .where(Post.user_id == user_id, Post.status == "scheduled")
-            )
-            posted_count_query = (
-                select(func.count())
-                .select_from(Post)
-                .where(Post.user_id == user_id, Post.status == "posted")
-            )
-
-            draft_result, scheduled_result, posted_result = await asyncio.gather(
-                self._db.execute(draft_count_query),
-                self._db.execute(scheduled_count_query),
-                self._db.execute(posted_count_query),
+            query = (
+                select(Post.status, func.count())
+                .where(
+                    Post.user_id == user_id,
+                    Post.status.in_([*draft_statuses, "scheduled", "posted"]),
+                )
+                .group_by(Post.status)
             )
+            result = await self._db.execute(query)
+            by_status = {status: count for status, count in result.all()}
 
-            drafts = draft_result.scalar() or 0
-            scheduled = scheduled_result.scalar() or 0
-            posted = posted_result.scalar() or 0
-
-            return {"drafts": drafts, "scheduled": scheduled, "posted": posted}
+            counts = {
+                "drafts": sum(by_status.get(s, 0) for s in draft_statuses),
+                "scheduled": by_status.get("scheduled", 0),
+                "posted": by_status.get("posted", 0),
+            }
+            self._count_cache.set(cache_key, counts)
+            return dict(counts)
         except Exception as e:
             logger.error(f"Error fetching post counts for user {user_id}: {e}")
             raise
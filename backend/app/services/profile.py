@@ -16,6 +16,7 @@ from app.core.config import settings
 from app.models.profile import SocialConnection, UserPreferences, WritingStyleAnalysis
 from app.models.content_strategies import ContentStrategy
 from app.schemas.profile import SocialConnectionUpdate, UserPreferencesUpdate
+from app.services.user_context import UserContextService
 
 from app.utils.gcp import trigger_gcp_cloud_run
 
@@ -68,6 +69,7 @@ class ProfileService:
                 existing.updated_at = datetime.now(timezone.utc)
                 await self.db.commit()
                 await self.db.refresh(existing)
+                UserContextService.invalidate(user_id)
                 logger.info(f"Updated content strategy {platform} for {user_id}")
                 return existing
             else:
@@ -80,6 +82,7 @@ class ProfileService:
                 self.db.add(strategy_obj)
                 await self.db.commit()
                 await self.db.refresh(strategy_obj)
+                UserContextService.invalidate(user_id)
                 logger.info(f"Created content strategy {platform} for {user_id}")
                 return strategy_obj
 
@@ -168,6 +171,7 @@ INSTEAD, use high-effort questions like:
                 await self.db.refresh(preferences)
                 existing = preferences
                 logger.info(f"Created user preferences for {user_id}")
+            UserContextService.invalidate(user_id)
 
             # Handle content strategies if provided
             if content_strategies_data:
@@ -790,6 +794,7 @@ INSTEAD, use high-effort questions like:
 
                 await self.db.commit()
                 await self.db.refresh(existing)
+                UserContextService.invalidate(user_id)
                 logger.info(f"Updated writing style analysis for {user_id}")
                 return existing
             else:
@@ -801,6 +806,7 @@ INSTEAD, use high-effort questions like:
                 self.db.add(analysis)
                 await self.db.commit()
                 await self.db.refresh(analysis)
+                UserContextService.invalidate(user_id)
                 logger.info(f"Created writing style analysis for {user_id}")
                 return analysis
 
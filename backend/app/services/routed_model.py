@@ -0,0 +1,218 @@
+"""
+Latency-aware routing across a primary model and its fallbacks.
+Kept separate from model_config so pydantic_ai is only imported on first use.
+"""
+
+import asyncio
+import sys
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+from pydantic_ai.models import Model, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+
+from app.core.metrics import (
+    llm_circuit_breaker_transitions_total,
+    llm_hedged_requests_total,
+)
+from app.utils.model_health import CircuitBreaker, LatencyTracker
+
+_Attempt = Tuple[AsyncExitStack, StreamedResponse]
+
+
+class RoutedModel(WrapperModel):
+    """
+    Primary model with client-side failover, circuit breaking and hedging.
+
+    Models are tried in order, skipping any whose circuit is open (the
+    primary is used regardless if every circuit is open); an error fails over
+    to the next model. A stream that has not produced its first chunk within
+    the hedge delay (the model's rolling p95, capped at
+    ``hedge_after_seconds``) is raced against the next model, and whichever
+    answers first is used while the other request is cancelled. A
+    cancelled request's wait counts as a latency sample (and as a failure
+    once past the breaker's slow threshold), so a consistently slow primary
+    still moves its p95 and eventually has its circuit opened.
+
+    Attribute access falls through to the primary model.
+    """
+
+    def __init__(
+        self,
+        models: Sequence[Model],
+        latency: LatencyTracker,
+        breaker: CircuitBreaker,
+        hedge_after_seconds: float = 0,
+    ):
+        super().__init__(models[0])
+        self.models: List[Model] = list(models)
+        self.latency = latency
+        self.breaker = breaker
+        self.hedge_after_seconds = hedge_after_seconds
+
+    def _route(self) -> Iterator[Model]:
+        """Yield models to try, checking each circuit only when it is reached."""
+        routed = False
+        for model in self.models:
+            if self.breaker.allow(model.model_name):
+                routed = True
+                yield model
+        if not routed:
+            yield self.models[0]
+
+    def _record_success(self, model: Model, ttft: Optional[float] = None) -> None:
+        name = model.model_name
+        before = self.breaker.state(name)
+        if ttft is not None:
+            self.latency.record(name, ttft)
+        after = self.breaker.record_success(name, ttft)
+        self._record_transition(name, before, after)
+
+    def _record_failure(self, model: Model, error: Exception) -> None:
+        name = model.model_name
+        before = self.breaker.state(name)
+        after = self.breaker.record_failure(name)
+        self._record_transition(name, before, after)
+        logger.warning(f"LLM request to {name} failed: {error}")
+
+    def _record_abandoned(self, model: Model, waited: float) -> None:
+        """Record a stream cancelled after ``waited`` seconds without a chunk."""
+        name = model.model_name
+        # A lower bound on its time to first chunk, still better than no sample
+        self.latency.record(name, waited)
+        slow = self.breaker.slow_threshold_seconds
+        if slow and waited > slow:
+            before = self.breaker.state(name)
+            after = self.breaker.record_failure(name)
+            self._record_transition(name, before, after)
+
+    @staticmethod
+    def _record_transition(name: str, before: str, after: str) -> None:
+        if after == before or after == "half_open":
+            return
+        llm_circuit_breaker_transitions_total.inc(model=name, state=after)
+        if after == "open":
+            logger.warning(f"Circuit opened for LLM model {name}")
+
+    def _hedge_delay(self, model: Model) -> Optional[float]:
+        if self.hedge_after_seconds <= 0:
+            return None
+        p95 = self.latency.p95(model.model_name)
+        if p95 is None:
+            return self.hedge_after_seconds
+        return min(p95, self.hedge_after_seconds)
+
+    async def request(self, messages, model_settings, model_request_parameters):
+        errors: List[Exception] = []
+        for model in self._route():
+            try:
+                response = await model.request(
+                    messages, model_settings, model_request_parameters
+                )
+            except Exception as e:
+                self._record_failure(model, e)
+                errors.append(e)
+                continue
+            self._record_success(model)
+            return response
+        raise errors[-1]
+
+    @asynccontextmanager
+    async def request_stream(
+        self, messages, model_settings, model_request_parameters
+    ) -> AsyncIterator[StreamedResponse]:
+        stack, streamed = await self._open_stream(
+            messages, model_settings, model_request_parameters
+        )
+        try:
+            yield streamed
+        except BaseException:
+            if not await stack.__aexit__(*sys.exc_info()):
+                raise
+        else:
+            await stack.aclose()
+
+    async def _open_stream(
+        self, messages, model_settings, model_request_parameters
+    ) -> _Attempt:
+        """Open the first stream to produce a chunk, hedging and failing over."""
+
+        async def attempt(model: Model) -> _Attempt:
+            stack = AsyncExitStack()
+            try:
+                # OpenAI-compatible models only enter once the first chunk arrives
+                streamed = await stack.enter_async_context(
+                    model.request_stream(
+                        messages, model_settings, model_request_parameters
+                    )
+                )
+            except BaseException:
+                await stack.aclose()
+                raise
+            return stack, streamed
+
+        route = self._route()
+        first = next(route)
+        pending: Dict["asyncio.Task[_Attempt]", Tuple[Model, float]] = {}
+        errors: List[Exception] = []
+        hedged = False
+
+        def start(model: Model) -> None:
+            pending[asyncio.create_task(attempt(model))] = (model, time.perf_counter())
+
+        start(first)
+        hedge_at = self._hedge_delay(first)
+        try:
+            while pending:
+                timeout = None
+                if not hedged and hedge_at is not None:
+                    started = next(iter(pending.values()))[1]
+                    timeout = max(hedge_at - (time.perf_counter() - started), 0)
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedged = True
+                    hedge = next(route, None)
+                    if hedge is not None:
+                        start(hedge)
+                    continue
+
+                for task in done:
+                    model, started = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        self._record_failure(model, e)
+                        errors.append(e)
+                        continue
+                    now = time.perf_counter()
+                    self._record_success(model, now - started)
+                    if hedged:
+                        llm_hedged_requests_total.inc(
+                            model=first.model_name, served_by=model.model_name
+                        )
+                    for loser, loser_started in pending.values():
+                        self._record_abandoned(loser, now - loser_started)
+                    return result
+
+                # Every in-flight attempt failed: fail over to the next model
+                if not pending:
+                    fallback = next(route, None)
+                    if fallback is not None:
+                        start(fallback)
+            raise errors[-1]
+        finally:
+            await self._cancel(pending)
+
+    @staticmethod
+    async def _cancel(pending: Dict["asyncio.Task[_Attempt]", Tuple]) -> None:
+        """Cancel losing attempts, closing any that opened meanwhile."""
+        for task in pending:
+            task.cancel()
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, tuple):
+                await result[0].aclose()
@@ -0,0 +1,100 @@
+"""
+User writing context shared by chat, post generation and image prompts.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.content_strategies import ContentStrategy
+from app.models.profile import UserPreferences, WritingStyleAnalysis
+from app.utils.cache import TTLCache
+
+NOT_PROVIDED = "Not provided"
+
+
+@dataclass(frozen=True)
+class UserWritingContext:
+    """Profile data the LLM prompts are personalised with."""
+
+    bio: Optional[str] = None
+    writing_style: Optional[str] = None
+    linkedin_post_strategy: Optional[str] = None
+    image_generation_style: Optional[str] = None
+
+    def profile_data(self) -> Dict[str, str]:
+        """Bio, writing style and LinkedIn strategy with prompt placeholders."""
+        return {
+            "bio": self.bio or NOT_PROVIDED,
+            "writing_style": self.writing_style or NOT_PROVIDED,
+            "linkedin_post_strategy": self.linkedin_post_strategy or NOT_PROVIDED,
+        }
+
+
+class UserContextService:
+    """Loads and caches each user's writing context."""
+
+    # Shared across instances; ProfileService invalidates on writes
+    _cache = TTLCache(
+        maxsize=settings.user_context_cache_max_size,
+        ttl_seconds=settings.user_context_cache_ttl_seconds,
+    )
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_user_context(self, user_id: UUID) -> UserWritingContext:
+        """
+        Get a user's writing context, from cache when possible.
+
+        Args:
+            user_id: User to load the context for
+
+        Returns:
+            UserWritingContext: Missing profile rows leave fields as None
+        """
+        key = str(user_id)
+        context = self._cache.get(key)
+        if context is not None:
+            return context
+
+        # One round trip: each source is a scalar subquery keyed by user_id
+        def scalar(column, *criteria):
+            return select(column).where(*criteria).limit(1).scalar_subquery()
+
+        stmt = select(
+            scalar(UserPreferences.bio, UserPreferences.user_id == user_id),
+            scalar(
+                UserPreferences.image_generation_style,
+                UserPreferences.user_id == user_id,
+            ),
+            scalar(
+                WritingStyleAnalysis.analysis_data,
+                WritingStyleAnalysis.user_id == user_id,
+            ),
+            scalar(
+                ContentStrategy.strategy,
+                ContentStrategy.user_id == user_id,
+                ContentStrategy.platform == "linkedin",
+            ),
+        )
+        result = await self.db.execute(stmt)
+        bio, image_style, writing_style, strategy = result.one()
+
+        context = UserWritingContext(
+            bio=bio,
+            writing_style=writing_style,
+            linkedin_post_strategy=strategy,
+            image_generation_style=image_style,
+        )
+        self._cache.set(key, context)
+        return context
+
+    @classmethod
+    def invalidate(cls, user_id: UUID) -> None:
+        """Drop a user's cached context after their profile changes."""
+        cls._cache.pop(str(user_id))
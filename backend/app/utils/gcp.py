@@ -2,14 +2,7 @@ import json
 import logging
 from typing import Any, Dict, Optional
 
-import google.auth
-import google.auth.transport.requests
 import httpx
-import google.oauth2.id_token
-import google.oauth2.service_account
-from google.auth import compute_engine
-from google.auth.transport import requests as google_auth_requests
-from google.auth import exceptions
 
 from app.core.config import settings
 
@@ -29,6 +22,13 @@ def get_id_token(target_url: str) -> Optional[str]:
     Returns:
         str: ID token if successful, None otherwise
     """
+    # Deferred: google.auth and its transports are slow to import
+    import google.auth
+    import google.oauth2.id_token
+    import google.oauth2.service_account
+    from google.auth import compute_engine
+    from google.auth.transport import requests as google_auth_requests
+
     auth_req = google_auth_requests.Request()
 
     # 1. Try service account key file (for local development)
@@ -111,6 +111,7 @@ async def trigger_gcp_cloud_run(
 
         # Get ID token for authentication
         # Fetch an ID token using Google helper; this allows tests to patch fetch_id_token.
+        from google.auth import exceptions
         from google.auth.transport.requests import Request as GoogleRequest
         from google.oauth2.id_token import fetch_id_token
 
@@ -0,0 +1,154 @@
+"""
+Per-model latency and health tracking for client-side LLM routing.
+Kept free of pydantic_ai so ModelConfig can own these at import time.
+"""
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional
+
+
+class LatencyTracker:
+    """Rolling window of recent latencies per model, for percentile queries."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, model: str, seconds: float) -> None:
+        """Add a latency sample for ``model``."""
+        samples = self._samples.get(model)
+        if samples is None:
+            samples = self._samples[model] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, model: str, q: float) -> Optional[float]:
+        """
+        Nearest-rank percentile of the window, or None with too few samples.
+
+        Args:
+            model: Model name
+            q: Percentile in (0, 100]
+        """
+        samples = self._samples.get(model)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(math.ceil(q / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def p95(self, model: str) -> Optional[float]:
+        """95th percentile latency for ``model``."""
+        return self.percentile(model, 95)
+
+    def snapshot(self) -> Dict[str, float]:
+        """p95 of every model with enough samples (for metrics)."""
+        result = {}
+        for model in list(self._samples):
+            p95 = self.p95(model)
+            if p95 is not None:
+                result[model] = p95
+        return result
+
+
+@dataclass
+class _BreakerState:
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probe_started: Optional[float] = None
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker per model.
+
+    A model's circuit opens after ``failure_threshold`` consecutive failures
+    (errors, or responses slower than ``slow_threshold_seconds``). While open
+    the model is skipped; after ``recovery_seconds`` a single probe request is
+    let through (half-open) and its outcome closes or re-opens the circuit.
+    A probe that never reports back (e.g. a cancelled hedge) is replaced after
+    another ``recovery_seconds``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        slow_threshold_seconds: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.slow_threshold_seconds = slow_threshold_seconds
+        self._timer = timer
+        self._states: Dict[str, _BreakerState] = {}
+
+    def _state(self, model: str) -> _BreakerState:
+        state = self._states.get(model)
+        if state is None:
+            state = self._states[model] = _BreakerState()
+        return state
+
+    def state(self, model: str) -> str:
+        """Current state: ``closed``, ``open`` or ``half_open``."""
+        state = self._state(model)
+        if state.opened_at is None:
+            return "closed"
+        if self._timer() - state.opened_at >= self.recovery_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self, model: str) -> bool:
+        """
+        Whether a request may be sent to ``model`` now.
+
+        In the half-open state only the first caller gets through; it must
+        report its outcome with ``record_success``/``record_failure``.
+        """
+        current = self.state(model)
+        if current == "closed":
+            return True
+        if current == "open":
+            return False
+        state = self._state(model)
+        now = self._timer()
+        if (
+            state.probe_started is not None
+            and now - state.probe_started < self.recovery_seconds
+        ):
+            return False
+        state.probe_started = now
+        return True
+
+    def record_success(self, model: str, seconds: Optional[float] = None) -> str:
+        """
+        Report a completed request; too slow a response counts as a failure.
+
+        Returns:
+            str: The model's state afterwards
+        """
+        if (
+            seconds is not None
+            and self.slow_threshold_seconds
+            and seconds > self.slow_threshold_seconds
+        ):
+            return self.record_failure(model)
+        self._states[model] = _BreakerState()
+        return "closed"
+
+    def record_failure(self, model: str) -> str:
+        """
+        Report a failed request.
+
+        Returns:
+            str: The model's state afterwards
+        """
+        state = self._state(model)
+        state.failures += 1
+        if state.probe_started is not None or state.failures >= self.failure_threshold:
+            state.opened_at = self._timer()
+        state.probe_started = None
+        return self.state(model)
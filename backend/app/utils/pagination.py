@@ -0,0 +1,67 @@
+"""
+Keyset (cursor) pagination helpers.
+Cursors are opaque URL-safe tokens carrying the sort key of the last row seen.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be used for the request."""
+
+
+def encode_cursor(
+    order_by: str, direction: str, value: Optional[Any], row_id: UUID
+) -> str:
+    """
+    Encode the position after a row as an opaque cursor.
+
+    Args:
+        order_by: Column the listing is sorted by
+        direction: "asc" or "desc"
+        value: The row's value for ``order_by`` (datetime, str, number or None)
+        row_id: The row's primary key (tie-breaker)
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    payload = {"o": order_by, "d": direction, "v": value, "id": str(row_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, order_by: str, direction: str) -> Dict[str, Any]:
+    """
+    Decode a cursor produced by ``encode_cursor`` for the same sort order.
+
+    Args:
+        token: Cursor token from a previous page
+        order_by: Column the listing is sorted by
+        direction: "asc" or "desc"
+
+    Returns:
+        Dict with the last row's ``value`` and ``id``
+
+    Raises:
+        InvalidCursorError: If the token is malformed or was issued for
+            another order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        value = payload["v"]
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["dt"])
+        row_id = UUID(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+    if payload.get("o") != order_by or payload.get("d") != direction:
+        raise InvalidCursorError("Pagination cursor does not match the requested order")
+    return {"value": value, "id": row_id}
@@ -0,0 +1,97 @@
+"""
+Streaming helpers.
+Re-chunks token deltas into fewer, larger frames and fills idle gaps with
+heartbeats so proxies keep long-running streams open.
+"""
+
+import asyncio
+from contextlib import suppress
+from typing import AsyncIterator, List, Optional
+
+_END = object()
+
+
+async def coalesce_deltas(
+    deltas: AsyncIterator[str],
+    max_chars: int,
+    max_delay: float,
+    heartbeat_interval: float,
+) -> AsyncIterator[Optional[str]]:
+    """
+    Group text deltas into frames and yield heartbeats while the source is idle.
+
+    ``deltas`` is consumed on a background task so that silence from the
+    source (e.g. the model running a tool) can be filled with heartbeats.
+    The first delta is released immediately to keep time-to-first-token
+    low; after that a frame is released once it holds ``max_chars``
+    characters or its oldest delta is ``max_delay`` seconds old. Pending
+    text is flushed before an error from the source is re-raised.
+
+    Args:
+        deltas: Source of text deltas
+        max_chars: Release a frame once it reaches this many characters
+        max_delay: Longest a delta may wait for more text, in seconds
+        heartbeat_interval: Yield ``None`` after this many seconds without
+            output
+
+    Yields:
+        Optional[str]: A text frame, or None for a heartbeat
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for delta in deltas:
+                if delta:
+                    queue.put_nowait(delta)
+        finally:
+            queue.put_nowait(_END)
+
+    task = asyncio.create_task(pump())
+    pending: List[str] = []
+    pending_chars = 0
+    pending_since = 0.0
+    first_frame = True
+    last_output = loop.time()
+
+    def flush() -> str:
+        nonlocal pending_chars
+        frame = "".join(pending)
+        pending.clear()
+        pending_chars = 0
+        return frame
+
+    try:
+        while True:
+            now = loop.time()
+            timeout = last_output + heartbeat_interval - now
+            if pending:
+                timeout = min(timeout, pending_since + max_delay - now)
+            try:
+                item = await asyncio.wait_for(queue.get(), max(timeout, 0))
+            except asyncio.TimeoutError:
+                yield flush() if pending else None
+                last_output = loop.time()
+                continue
+
+            if item is _END:
+                break
+            if not pending:
+                pending_since = loop.time()
+            pending.append(item)
+            pending_chars += len(item)
+            if first_frame or pending_chars >= max_chars:
+                first_frame = False
+                yield flush()
+                last_output = loop.time()
+
+        if pending:
+            yield flush()
+        # Re-raise anything the source raised
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
@@ -3,13 +3,15 @@ Supabase client wrapper with enhanced error handling and logging.
 Provides a centralized interface for all Supabase operations.
 """
 
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from loguru import logger
-from supabase import create_client, Client
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 
 class SupabaseClient:
     """
@@ -21,17 +23,18 @@ class SupabaseClient:
 
     def __init__(self):
         """Initialize Supabase client wrapper."""
-        self._client: Optional[Client] = None
-        self._admin_client: Optional[Client] = None
+        self._client: Optional["Client"] = None
+        self._admin_client: Optional["Client"] = None
         self.url = settings.supabase_url
         self.key = settings.supabase_key
         self.service_key = settings.supabase_service_key
 
     @property
-    def client(self) -> Client:
+    def client(self) -> "Client":
         """Lazy initialization of Supabase client."""
         if self._client is None:
             from gotrue import SyncMemoryStorage
+            from supabase import create_client
             from supabase.lib.client_options import ClientOptions
 
             # Configure client with PKCE flow for OAuth
@@ -45,9 +48,11 @@ class SupabaseClient:
         return self._client
 
     @property
-    def admin_client(self) -> Client:
+    def admin_client(self) -> "Client":
         """Lazy initialization of Supabase admin client."""
         if self._admin_client is None:
+            from supabase import create_client
+
             self._admin_client = create_client(self.url, self.service_key)
         return self._admin_client
 
@@ -0,0 +1,96 @@
+"""
+Compare the previous cumulative-text chat streaming loop (``stream_text()``
+plus ``text[last_len:]`` slicing) with delta streaming and frame coalescing
+in ``ChatService._stream_with_agent``.
+
+Both run a real pydantic-ai agent on a ``FunctionModel`` that streams a long
+draft in small token-sized chunks, and report time-to-first-token, frames
+sent and CPU time per streamed kilobyte:
+
+    python -m benchmarks.chat_streaming
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+from loguru import logger
+from pydantic_ai import Agent
+from pydantic_ai.models.function import FunctionModel
+
+from app.services.chat_service import ChatService
+
+CHUNK = "word "
+RESPONSE_SIZES = (2_000, 8_000, 32_000)
+CHUNK_INTERVAL = 0.0005
+RUNS = 3
+
+
+def _model(chunks: int) -> FunctionModel:
+    async def stream_function(messages, agent_info):
+        for _ in range(chunks):
+            await asyncio.sleep(CHUNK_INTERVAL)
+            yield CHUNK
+
+    return FunctionModel(stream_function=stream_function)
+
+
+async def legacy_stream(model: FunctionModel):
+    agent = Agent(model, output_type=str, instructions="Write a draft.")
+    async with agent.run_stream("Go") as result:
+        last_len = 0
+        async for text in result.stream_text():
+            delta = text[last_len:]
+            last_len = len(text)
+            if delta:
+                yield delta
+
+
+async def delta_stream(model: FunctionModel):
+    service = ChatService.__new__(ChatService)
+    service.model = model
+    service.model_settings = None
+
+    async def _discard(*_args):
+        return None
+
+    service._add_message_to_db = _discard
+    async for response in service._stream_with_agent(
+        uuid4(), "Write a draft.", "Go", [], None
+    ):
+        if response.type == "message":
+            yield response.content
+
+
+async def measure(stream_factory, chunks: int):
+    ttft = cpu = 0.0
+    frames = size = 0
+    for _ in range(RUNS):
+        start, cpu_start = time.perf_counter(), time.process_time()
+        first = None
+        async for frame in stream_factory(_model(chunks)):
+            if first is None:
+                first = time.perf_counter() - start
+            frames += 1
+            size += len(frame)
+        cpu += time.process_time() - cpu_start
+        ttft += first
+    kilobytes = size / 1024
+    return ttft / RUNS * 1000, frames / RUNS, cpu / kilobytes * 1000
+
+
+async def main() -> None:
+    logger.remove()
+    # Warm up imports and agent construction for both paths
+    for factory in (legacy_stream, delta_stream):
+        await measure(factory, 10)
+    print(f"{'path':<10}{'chars':>8}{'TTFT ms':>10}{'frames':>9}{'CPU ms/KB':>12}")
+    for chars in RESPONSE_SIZES:
+        chunks = chars // len(CHUNK)
+        for name, factory in (("legacy", legacy_stream), ("delta", delta_stream)):
+            ttft, frames, cpu_per_kb = await measure(factory, chunks)
+            print(f"{name:<10}{chars:>8}{ttft:>10.2f}{frames:>9.0f}{cpu_per_kb:>12.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
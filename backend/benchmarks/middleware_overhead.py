@@ -0,0 +1,139 @@
+"""
+Compare middleware overhead of the previous ``@app.middleware("http")`` pair
+with the single ASGI ``RequestContextMiddleware``.
+
+Drives the ASGI apps directly (no network, no client buffering) and reports
+requests/sec on a trivial route and time-to-first-byte on an SSE route:
+
+    python -m benchmarks.middleware_overhead
+"""
+
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from loguru import logger
+
+from app.core.middleware import SECURITY_HEADERS, RequestContextMiddleware
+
+REQUESTS = 3000
+SSE_RUNS = 50
+SSE_DELAY = 0.05
+
+
+def _add_routes(app: FastAPI) -> FastAPI:
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/sse")
+    async def sse():
+        async def events():
+            yield "data: first\n\n"
+            await asyncio.sleep(SSE_DELAY)
+            yield "data: second\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def legacy_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        client_ip = request.client.host if request.client else "unknown"
+        logger.info(f"Request: {request.method} {request.url} from {client_ip}")
+        response = await call_next(request)
+        logger.info(f"Response: {response.status_code} for {request.method}")
+        return response
+
+    @app.middleware("http")
+    async def add_security_headers(request: Request, call_next):
+        response = await call_next(request)
+        for name, value in SECURITY_HEADERS.items():
+            response.headers[name] = value
+        return response
+
+    return _add_routes(app)
+
+
+def asgi_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    return _add_routes(app)
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("bench", 80),
+    }
+
+
+async def _call(app, path: str, on_body=None) -> None:
+    sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Like a server: block until the client goes away
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if on_body and message["type"] == "http.response.body" and message["body"]:
+            on_body()
+
+    await app(_scope(path), receive, send)
+
+
+async def requests_per_second(app) -> float:
+    await _call(app, "/ping")
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await _call(app, "/ping")
+    return REQUESTS / (time.perf_counter() - start)
+
+
+async def sse_ttfb_ms(app) -> float:
+    total = 0.0
+    for _ in range(SSE_RUNS):
+        start = time.perf_counter()
+        first = []
+        await _call(
+            app,
+            "/sse",
+            on_body=lambda: first or first.append(time.perf_counter() - start),
+        )
+        total += first[0]
+    return total / SSE_RUNS * 1000
+
+
+async def main() -> None:
+    logger.remove()
+    apps = {"legacy (2x http middleware)": legacy_app(), "asgi": asgi_app()}
+    print(f"{'stack':<30}{'req/s':>10}{'SSE TTFB ms':>14}")
+    for name, app in apps.items():
+        rps = await requests_per_second(app)
+        ttfb = await sse_ttfb_ms(app)
+        print(f"{name:<30}{rps:>10.0f}{ttfb:>14.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""
+Count the statements issued per request for the RLS user context.
+
+Compares the previous flow (eager ``set_config`` on bind plus an explicit
+clear before close) with session-checkout application via ``RLSSession``.
+Runs against SQLite with a stand-in ``set_config`` function, so it needs no
+database server:
+
+    python -m benchmarks.rls_statement_counts
+"""
+
+import asyncio
+import uuid
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core import rls
+from app.core.database import RLSSession
+
+REQUESTS = 200
+
+
+def _make_engine():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register_set_config(dbapi_connection, _):
+        dbapi_connection.create_function("set_config", 3, lambda n, v, local: v)
+
+    counter = {"statements": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(*_):
+        counter["statements"] += 1
+
+    return engine, counter
+
+
+async def _legacy_request(session: AsyncSession, user_id: str) -> None:
+    await session.execute(
+        text("SELECT set_config('app.current_user_id', :user_id, true)"),
+        {"user_id": user_id},
+    )
+    await session.execute(text("SELECT 1"))
+    await session.commit()
+    await session.execute(text("SELECT set_config('app.current_user_id', '', true)"))
+
+
+async def _checkout_request(session: AsyncSession, user_id: str) -> None:
+    await rls.AuthContextHandler.set_current_user(session, user_id)
+    await session.execute(text("SELECT 1"))
+    await session.commit()
+
+
+async def _run(flow, user_ids) -> float:
+    engine, counter = _make_engine()
+    sync_class = RLSSession if flow is _checkout_request else None
+    kwargs = {"sync_session_class": sync_class} if sync_class else {}
+    factory = async_sessionmaker(engine, class_=AsyncSession, **kwargs)
+
+    for i in range(REQUESTS):
+        async with factory() as session:
+            await flow(session, user_ids[i % len(user_ids)])
+
+    await engine.dispose()
+    # Subtract the application query itself
+    return counter["statements"] / REQUESTS - 1
+
+
+async def main() -> None:
+    rls.RLS_DIALECTS.add("sqlite")
+    scenarios = {
+        "same user": [str(uuid.uuid4())],
+        "alternating users": [str(uuid.uuid4()), str(uuid.uuid4())],
+    }
+    print(f"{'scenario':<20}{'legacy':>10}{'checkout':>10}  (RLS statements/request)")
+    for name, user_ids in scenarios.items():
+        legacy = await _run(_legacy_request, user_ids)
+        checkout = await _run(_checkout_request, user_ids)
+        print(f"{name:<20}{legacy:>10.2f}{checkout:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,9 +6,12 @@ Sets up test database and environment variables for testing.
 import asyncio
 import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
 # Add the backend app directory to Python path
@@ -68,3 +71,52 @@ def test_settings():
     from app.core.config import settings
 
     return settings
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session_factory():
+    """Create a session factory for a fresh in-memory database with all tables."""
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import app.models  # noqa: F401 (register every table on Base.metadata)
+    import app.models.chat  # noqa: F401
+    from app.core.database import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(db_session_factory):
+    """Create a session on the in-memory test database."""
+    async with db_session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def count_statements():
+    """
+    Record the statements a session executes inside a ``with`` block.
+
+    Usage: ``with count_statements(session) as statements: ...``
+    """
+
+    @contextmanager
+    def counter(session):
+        statements = []
+        original_execute = session.execute
+
+        async def counting_execute(*args, **kwargs):
+            statements.append(args[0])
+            return await original_execute(*args, **kwargs)
+
+        with patch.object(session, "execute", counting_execute):
+            yield statements
+
+    return counter
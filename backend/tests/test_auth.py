@@ -137,6 +137,52 @@ class TestAuthService:
         result = await test_auth_service.get_current_user("invalid_token")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_current_user_uses_principal_cache(self, test_auth_service):
+        """Test that a verified principal is served from cache on repeat lookups."""
+        from app.core.principal_cache import principal_cache
+        from app.core.security import create_access_token
+        from app.models.user import User
+
+        user_id = str(uuid.uuid4())
+        test_auth_service.db.add(User(id=user_id, email="cached@example.com"))
+        await test_auth_service.db.commit()
+
+        access_token = create_access_token(user_id)
+        first = await test_auth_service.get_current_user(access_token)
+
+        with patch.object(
+            test_auth_service, "_get_user_by_id", side_effect=AssertionError
+        ):
+            second = await test_auth_service.get_current_user(access_token)
+
+        assert first is not None
+        assert second is first
+        principal_cache.invalidate_token(access_token)
+
+    @pytest.mark.asyncio
+    async def test_update_user_invalidates_principal_cache(self, test_auth_service):
+        """Test that profile updates drop cached principals for the user."""
+        from app.core.principal_cache import principal_cache
+        from app.core.security import create_access_token
+        from app.models.user import User
+        from app.schemas.auth import UserUpdate
+
+        user_id = str(uuid.uuid4())
+        test_auth_service.db.add(User(id=user_id, email="stale@example.com"))
+        await test_auth_service.db.commit()
+
+        access_token = create_access_token(user_id)
+        await test_auth_service.get_current_user(access_token)
+        assert principal_cache.get(access_token) is not None
+
+        await test_auth_service.update_user(user_id, UserUpdate(full_name="New Name"))
+        assert principal_cache.get(access_token) is None
+
+        refreshed = await test_auth_service.get_current_user(access_token)
+        assert refreshed.full_name == "New Name"
+        principal_cache.invalidate_token(access_token)
+
 
 class TestAuthEndpoints:
     """Test cases for authentication endpoints."""
@@ -291,6 +337,39 @@ class TestSecurityUtilities:
         assert verify_token("") is None
 
 
+class TestPrincipalCache:
+    """Test cases for the verified-principal cache."""
+
+    def test_entries_do_not_outlive_token_expiry(self):
+        """Test that principals for already-expired tokens are not cached."""
+        import time
+        from app.core.principal_cache import PrincipalCache
+
+        cache = PrincipalCache(maxsize=10, ttl_seconds=60)
+        principal = Mock(id="user-1")
+
+        cache.set("expired-token", principal, expires_at=time.time() - 1)
+        cache.set("live-token", principal, expires_at=time.time() + 600)
+
+        assert cache.get("expired-token") is None
+        assert cache.get("live-token") is principal
+
+    def test_invalidate_user_and_size_bound(self):
+        """Test per-user invalidation and LRU size bound."""
+        from app.core.principal_cache import PrincipalCache
+
+        cache = PrincipalCache(maxsize=2, ttl_seconds=60)
+        cache.set("a", Mock(id="user-1"))
+        cache.set("b", Mock(id="user-2"))
+        cache.set("c", Mock(id="user-1"))
+
+        # "a" was evicted by the size bound
+        assert cache.get("a") is None
+        assert cache.invalidate_user("user-1") == 1
+        assert cache.get("c") is None
+        assert cache.get("b") is not None
+
+
 class TestConfiguration:
     """Test cases for configuration."""
 
@@ -0,0 +1,243 @@
+"""
+Tests for chat response streaming.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.utils.streaming import coalesce_deltas
+
+
+async def _collect(source, **kwargs):
+    options = {"max_chars": 10, "max_delay": 0.02, "heartbeat_interval": 60}
+    options.update(kwargs)
+    return [frame async for frame in coalesce_deltas(source, **options)]
+
+
+class TestCoalesceDeltas:
+    """Test cases for coalesce_deltas."""
+
+    @pytest.mark.asyncio
+    async def test_first_delta_immediate_then_size_and_time_windows(self):
+        """The first delta goes out alone; later ones are grouped by size or age."""
+
+        async def source():
+            for delta in ["Hel", "lo", " wo", "rld", "!!", "!!", "!!", "!"]:
+                yield delta
+            await asyncio.sleep(0.05)
+            yield "tail"
+
+        frames = await _collect(source())
+
+        assert frames[0] == "Hel"
+        assert "".join(frames) == "Hello world!!!!!!!tail"
+        assert frames[1] == "lo world!!"
+        assert frames[-1] == "tail"
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_while_source_is_silent(self):
+        """None is yielded while the source is idle, e.g. during a tool call."""
+
+        async def source():
+            await asyncio.sleep(0.12)
+            yield "done"
+
+        frames = await _collect(source(), heartbeat_interval=0.05)
+
+        assert frames[-1] == "done"
+        assert frames[:-1] and all(frame is None for frame in frames[:-1])
+
+    @pytest.mark.asyncio
+    async def test_pending_text_flushed_before_source_error(self):
+        """Text received before a failure is delivered, then the error is raised."""
+        received = []
+
+        async def source():
+            yield "a"
+            yield "b"
+            raise RuntimeError("provider failed")
+
+        with pytest.raises(RuntimeError, match="provider failed"):
+            async for frame in coalesce_deltas(
+                source(), max_chars=10, max_delay=1, heartbeat_interval=60
+            ):
+                received.append(frame)
+
+        assert received == ["a", "b"]
+
+
+class TestChatServiceStreaming:
+    """Test cases for ChatService._stream_with_agent."""
+
+    @pytest.mark.asyncio
+    async def test_streams_deltas_and_persists_full_reply(self):
+        """Frames concatenate to the model's reply, which is saved once."""
+        from pydantic_ai.models.function import FunctionModel
+
+        from app.services.chat_service import ChatService
+
+        chunks = [f"token{i} " for i in range(200)]
+
+        async def stream_function(messages, agent_info):
+            for chunk in chunks:
+                yield chunk
+
+        service = ChatService(MagicMock())
+        service.model = FunctionModel(stream_function=stream_function)
+        service._add_message_to_db = AsyncMock()
+        conversation_id = uuid4()
+
+        responses = [
+            response
+            async for response in service._stream_with_agent(
+                conversation_id, "Be helpful.", "Hi", [], None
+            )
+        ]
+
+        messages = [r.content for r in responses if r.type == "message"]
+        assert "".join(messages) == "".join(chunks)
+        # Coalesced: far fewer frames than model chunks
+        assert len(messages) < len(chunks) / 4
+        assert responses[-1].type == "end"
+        service._add_message_to_db.assert_awaited_once_with(
+            conversation_id, "assistant", "".join(chunks)
+        )
+
+    @pytest.mark.asyncio
+    async def test_agent_reused_and_user_context_follows_static_prefix(self):
+        """Instructions start with the static template; user data comes after."""
+        from pydantic_ai.models.function import FunctionModel
+
+        from app.services.chat_service import (
+            GENERATION_INSTRUCTIONS,
+            ChatService,
+            _get_chat_agent,
+        )
+        from app.services.post_generator import PostGenerationContext
+
+        seen = []
+
+        async def stream_function(messages, agent_info):
+            seen.append(messages[-1].instructions)
+            yield "ok"
+
+        service = ChatService(MagicMock())
+        service.model = FunctionModel(stream_function=stream_function)
+        service._add_message_to_db = AsyncMock()
+
+        for bio in ("Bio A", "Bio B"):
+            deps = PostGenerationContext(
+                idea_content="idea",
+                bio=bio,
+                writing_style="style",
+                linkedin_post_strategy="strategy",
+            )
+            async for _ in service._stream_with_agent(
+                uuid4(), GENERATION_INSTRUCTIONS, "Hi", [], deps
+            ):
+                pass
+
+        assert _get_chat_agent(GENERATION_INSTRUCTIONS) is _get_chat_agent(
+            GENERATION_INSTRUCTIONS
+        )
+        prefix = GENERATION_INSTRUCTIONS.strip()
+        assert all(instructions.startswith(prefix) for instructions in seen)
+        assert "Bio A" in seen[0] and "Bio B" in seen[1]
+
+
+class TestChatHistoryWindow:
+    """Test cases for ChatHistoryService."""
+
+    @pytest.mark.asyncio
+    async def test_window_keeps_budgeted_tail_and_rolls_summary(
+        self, monkeypatch, db_session, db_session_factory
+    ):
+        """Old turns leave the window and are summarised in bounded batches."""
+        import json
+        from datetime import datetime, timedelta, timezone
+
+        from app.core.config import settings
+        from app.models.chat import Conversation, Message
+        from app.core import database
+        from app.services.chat_history import (
+            ChatHistoryService,
+            refresh_summary_after_turn,
+        )
+
+        monkeypatch.setattr(settings, "chat_history_max_messages", 6)
+        monkeypatch.setattr(settings, "chat_history_token_budget", 9)
+        monkeypatch.setattr(settings, "chat_history_summary_batch", 3)
+        # "ASSISTANT: msg00" is 4 tokens: a summariser call takes four messages
+        monkeypatch.setattr(settings, "chat_history_summary_max_tokens", 16)
+
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        conversation = Conversation(
+            user_id=uuid4(), title="t", conversation_type="idea_bank"
+        )
+        db_session.add(conversation)
+        await db_session.flush()
+        contents = [f"msg{i:02d}" for i in range(9)]
+        contents.append(json.dumps({"linkedin_post": "draft"}))
+        for i, content in enumerate(contents):
+            db_session.add(
+                Message(
+                    conversation_id=conversation.id,
+                    role="tool" if i == 9 else ("user" if i % 2 else "assistant"),
+                    content=content,
+                    created_at=start + timedelta(minutes=i),
+                )
+            )
+        await db_session.commit()
+
+        service = ChatHistoryService(db_session)
+        transcripts = []
+
+        async def summarize(self, previous, transcript):
+            transcripts.append(transcript)
+            return f"summary of {transcript.count(':')} messages"
+
+        monkeypatch.setattr(ChatHistoryService, "_summarize", summarize)
+        monkeypatch.setattr(
+            database, "get_async_session_local", lambda: db_session_factory
+        )
+
+        window = await service.load_window(conversation)
+        # 2 tokens each: four messages fit a budget of 9; tool JSON is compacted
+        assert [m.content for m in window.messages] == [
+            "msg06",
+            "msg07",
+            "msg08",
+            "draft",
+        ]
+        assert window.summary is None and window.first_kept == 6
+
+        # After the turn, in a session of its own
+        assert await refresh_summary_after_turn(
+            conversation.id, conversation.user_id, window
+        )
+        assert transcripts[0].startswith("ASSISTANT: msg00")
+
+        await db_session.refresh(conversation)
+        window = await service.load_window(conversation)
+        assert window.chat_messages()[0].role == "system"
+        assert window.summary == "summary of 4 messages"
+        # The rest of the backlog waits for the next full batch
+        assert window.summarized == 4 and window.unsummarized == 2
+        assert not await service.refresh_summary(conversation, window)
+
+    def test_tool_messages_replayed_as_post_text(self):
+        """Tool rows replay as post text whether or not they hold post JSON."""
+        import json
+
+        from app.schemas.chat import ChatMessage
+        from app.services.chat_service import ChatService
+
+        contents = [json.dumps({"linkedin_post": "draft"}), "[1, 2]", '{"a": 1}', "7"]
+        history = ChatService._convert_to_message_history(
+            [ChatMessage(role="tool", content=content) for content in contents]
+        )
+        texts = [message.parts[0].content for message in history]
+        assert texts == ["draft", "[1, 2]", '{"a": 1}', "7"]
@@ -0,0 +1,109 @@
+"""
+Tests for the idea bank service.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from app.models.idea_bank import IdeaBank
+from app.models.posts import Post
+from app.services.idea_bank import IdeaBankService
+
+
+class TestIdeaBankService:
+    """Test cases for IdeaBankService."""
+
+    @pytest.mark.asyncio
+    async def test_json_flag_filters_paginate_in_database(self, db_session):
+        """ai_suggested/evergreen match bool and "true" strings; "1" is not truthy."""
+        user_id = uuid4()
+        rows = [
+            {"value": "a", "ai_suggested": True, "time_sensitive": True},
+            {"value": "b", "ai_suggested": "True"},
+            {"value": "c", "ai_suggested": False, "time_sensitive": "false"},
+            {"value": "d"},
+            {"value": "e", "ai_suggested": "1", "time_sensitive": "1"},
+        ]
+        banks = [IdeaBank(user_id=user_id, data=data) for data in rows]
+        db_session.add_all(banks)
+        db_session.add(IdeaBank(user_id=uuid4(), data={"ai_suggested": True}))
+        await db_session.flush()
+        db_session.add(Post(user_id=user_id, content="c", idea_bank_id=banks[0].id))
+        await db_session.commit()
+
+        service = IdeaBankService(db_session)
+
+        async def values(**kwargs):
+            result = await service.get_idea_banks_list(
+                user_id=user_id, order_by="created_at", **kwargs
+            )
+            return result, sorted(bank.data["value"] for bank in result["items"])
+
+        result, found = await values(ai_suggested=True, size=1)
+        assert result["total"] == 2 and result["has_next"]
+        assert len(found) == 1
+        assert (await values(ai_suggested=True))[1] == ["a", "b"]
+        assert (await values(ai_suggested=False))[1] == ["c", "d", "e"]
+        assert (await values(evergreen=True))[1] == ["b", "c", "d", "e"]
+        assert (await values(evergreen=False))[1] == ["a"]
+        assert (await values(ai_suggested=True, has_post=False))[1] == ["b"]
+
+        latest = await service.get_idea_banks_with_latest_posts(
+            user_id=user_id, ai_suggested=True, size=1
+        )
+        assert latest["total"] == 2 and len(latest["items"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_latest_post_is_unique_and_user_scoped(self, db_session):
+        """One latest post per idea bank; dismissed or foreign posts don't count."""
+        from datetime import datetime, timezone
+
+        user_id = uuid4()
+        same_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        later = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+        def post(owner_id, idea_bank, updated_at, status="suggested"):
+            return Post(
+                user_id=owner_id,
+                idea_bank_id=idea_bank.id,
+                content="c",
+                status=status,
+                updated_at=updated_at,
+            )
+
+        tied, dismissed, empty = (
+            IdeaBank(user_id=user_id, data={"value": value})
+            for value in ("tied", "dismissed", "empty")
+        )
+        db_session.add_all([tied, dismissed, empty])
+        await db_session.flush()
+        db_session.add_all(
+            [
+                # Two posts share the latest timestamp
+                post(user_id, tied, same_time),
+                post(user_id, tied, same_time),
+                post(user_id, dismissed, same_time),
+                post(user_id, dismissed, later, status="dismissed"),
+                # Another user's post never counts as latest
+                post(uuid4(), empty, later),
+            ]
+        )
+        await db_session.commit()
+
+        service = IdeaBankService(db_session)
+        result = await service.get_idea_banks_with_latest_posts(user_id=user_id)
+        latest = {
+            item["idea_bank"].data["value"]: item["latest_post"]
+            for item in result["items"]
+        }
+        assert result["total"] == 3 and len(result["items"]) == 3
+        assert latest["tied"] is not None
+        assert latest["dismissed"] is None
+        assert latest["empty"] is None
+
+        with_post = await service.get_idea_banks_with_latest_posts(
+            user_id=user_id, has_post=True
+        )
+        assert with_post["total"] == 1
+        assert with_post["items"][0]["idea_bank"].id == tied.id
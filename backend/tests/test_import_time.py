@@ -0,0 +1,61 @@
+"""
+Import-time budget for application startup.
+
+Runs ``python -X importtime -c "import app.main"`` in a subprocess and fails
+if deferred SDKs are imported eagerly or startup exceeds the time budget.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from app.core.startup import DEFERRED_MODULES
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Generous to tolerate slow CI machines; override with IMPORT_TIME_BUDGET_MS
+IMPORT_TIME_BUDGET_MS = int(os.environ.get("IMPORT_TIME_BUDGET_MS", "5000"))
+
+
+def _import_times() -> dict:
+    """Return ``{module: cumulative_microseconds}`` for importing app.main."""
+    env = {**os.environ, "ENVIRONMENT": "test", "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split("|"))
+        if cumulative.isdigit():
+            times[name] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """Test application import cost."""
+
+    def test_startup_import_budget(self):
+        """Deferred SDKs stay out of startup and app.main imports within budget."""
+        times = _import_times()
+
+        eagerly_imported = [name for name in DEFERRED_MODULES if name in times]
+        assert not eagerly_imported, (
+            f"Modules deferred for fast startup were imported eagerly: "
+            f"{eagerly_imported}"
+        )
+
+        total_ms = times["app.main"] / 1000
+        assert total_ms < IMPORT_TIME_BUDGET_MS, (
+            f"Importing app.main took {total_ms:.0f}ms "
+            f"(budget {IMPORT_TIME_BUDGET_MS}ms)"
+        )
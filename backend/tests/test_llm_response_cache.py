@@ -0,0 +1,135 @@
+"""
+Tests for the LLM response cache.
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+
+from app.core.llm_response_cache import (
+    DatabaseLLMCacheBackend,
+    LLMResponseCache,
+    MemoryLLMCacheBackend,
+    response_cache_key,
+)
+from app.core.metrics import llm_response_cache_requests_total
+from app.models.llm_response_cache import LLMResponseCacheEntry
+
+
+class TestLLMResponseCache:
+    """Test cases for LLMResponseCache."""
+
+    def test_key_covers_model_settings_and_prompt(self):
+        """Any input that changes the response changes the key."""
+        base = ("model", {"temperature": 0.0}, "instructions", "prompt", "schema")
+        key = response_cache_key(*base)
+
+        assert key == response_cache_key(*base)
+        for index, changed in enumerate(
+            ["other", {"temperature": 0.5}, "other", "other", "other"]
+        ):
+            args = list(base)
+            args[index] = changed
+            assert response_cache_key(*args) != key
+
+    @pytest.mark.asyncio
+    async def test_tiers_share_responses_and_honour_bypass_and_ttl(
+        self, db_session_factory
+    ):
+        """A second instance hits the shared table; bypass and expiry re-run."""
+        calls = []
+
+        async def run():
+            calls.append(1)
+            return f'{{"n": {len(calls)}}}'
+
+        def instance():
+            return LLMResponseCache(
+                [
+                    MemoryLLMCacheBackend(maxsize=8, ttl_seconds=60),
+                    DatabaseLLMCacheBackend(db_session_factory),
+                ],
+                ttl_seconds=60,
+            )
+
+        first, second = instance(), instance()
+        hits_before = llm_response_cache_requests_total.value(
+            operation="generate_post", result="hit"
+        )
+
+        assert await first.get_or_run("generate_post", "k", "m", run) == '{"n": 1}'
+        assert await first.get_or_run("generate_post", "k", "m", run) == '{"n": 1}'
+        assert await second.get_or_run("generate_post", "k", "m", run) == '{"n": 1}'
+        assert len(calls) == 1
+        assert (
+            llm_response_cache_requests_total.value(
+                operation="generate_post", result="hit"
+            )
+            == hits_before + 2
+        )
+
+        # Bypass re-runs the model and refreshes the stored response
+        assert (
+            await second.get_or_run("generate_post", "k", "m", run, bypass=True)
+            == '{"n": 2}'
+        )
+        assert await second.get_or_run("generate_post", "k", "m", run) == '{"n": 2}'
+
+        # Expired rows are ignored
+        async with db_session_factory() as session:
+            await session.execute(
+                update(LLMResponseCacheEntry).values(
+                    expires_at=datetime.now(timezone.utc) - timedelta(seconds=1)
+                )
+            )
+            await session.commit()
+        assert await instance().get_or_run("generate_post", "k", "m", run) == (
+            '{"n": 3}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_generate_post_served_from_cache(self, monkeypatch):
+        """Identical generate_post calls run the model once unless bypassed."""
+        from pydantic_ai.messages import ModelResponse, ToolCallPart
+        from pydantic_ai.models.function import FunctionModel
+
+        from app.services import post_generator
+
+        calls = []
+
+        def respond(messages, info):
+            calls.append(1)
+            post = {"linkedin_post": f"post {len(calls)}", "topics": ["Analysis"]}
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, post)])
+
+        cache = LLMResponseCache(
+            [MemoryLLMCacheBackend(maxsize=8, ttl_seconds=60)], ttl_seconds=60
+        )
+        monkeypatch.setattr(post_generator, "llm_response_cache", cache)
+        service = post_generator.post_generator_service
+
+        async def generate(idea="idea", **kwargs):
+            with service._generation_agent.override(model=FunctionModel(respond)):
+                return await service.generate_post(
+                    idea, "bio", "style", "strategy", **kwargs
+                )
+
+        first = await generate()
+        assert await generate() == first
+        assert len(calls) == 1
+
+        assert (await generate(bypass_cache=True)).linkedin_post == "post 2"
+        assert (await generate("other idea")).linkedin_post == "post 3"
+        assert len(calls) == 3
+
+        # The chat tools honour the regenerate flag carried in their deps
+        deps = post_generator.PostGenerationContext(
+            "idea", "bio", "style", "strategy", bypass_cache=True
+        )
+        with service._generation_agent.override(model=FunctionModel(respond)):
+            post = await post_generator.generate_linkedin_post_tool(
+                SimpleNamespace(deps=deps)
+            )
+        assert post.linkedin_post == "post 4"
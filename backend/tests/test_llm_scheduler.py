@@ -0,0 +1,135 @@
+"""
+Tests for LLM admission control.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.llm_scheduler import LLMAdmissionError, LLMScheduler
+
+WEIGHTS = {"interactive": 8, "standard": 3, "background": 1}
+
+
+def make_scheduler(**kwargs) -> LLMScheduler:
+    options = {"max_concurrency": 1, "weights": WEIGHTS, "queue_timeout": 5}
+    options.update(kwargs)
+    return LLMScheduler(**options)
+
+
+class TestLLMScheduler:
+    """Test cases for LLMScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_waiting_calls_are_served_by_priority_weight(self):
+        """Interactive calls overtake queued background work."""
+        scheduler = make_scheduler()
+        holder = await scheduler.acquire("holder", "interactive")
+        order = []
+
+        async def call(user, priority):
+            async with scheduler.slot(user, priority):
+                order.append(priority)
+
+        tasks = [asyncio.create_task(call(f"bg{i}", "background")) for i in range(2)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("chat", "interactive")))
+        await asyncio.sleep(0)
+        assert scheduler.queue_depths() == {
+            "interactive": 1,
+            "standard": 0,
+            "background": 2,
+        }
+
+        scheduler.release(holder)
+        scheduler.release(holder)  # releasing twice is a no-op
+        await asyncio.gather(*tasks)
+        assert order == ["interactive", "background", "background"]
+        assert scheduler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_reserved_slots_are_kept_for_interactive_calls(self):
+        """Background work cannot take the slots reserved for chat."""
+        scheduler = make_scheduler(max_concurrency=2, reserved_slots=1)
+        await scheduler.acquire("a", "background")
+        background = asyncio.create_task(
+            scheduler.acquire("b", "background", timeout=0.2)
+        )
+        await asyncio.sleep(0)
+        assert not background.done()
+
+        await asyncio.wait_for(scheduler.acquire("c", "interactive"), 1)
+        with pytest.raises(LLMAdmissionError) as exc_info:
+            await background
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.reason == "queue_timeout"
+
+    @pytest.mark.asyncio
+    async def test_per_user_limits_reject_with_429(self):
+        """Too many concurrent calls or admissions per minute get a 429."""
+        now = [0.0]
+        scheduler = make_scheduler(
+            max_concurrency=10,
+            per_user_concurrency=2,
+            rate_per_minute=3,
+            timer=lambda: now[0],
+        )
+        first = await scheduler.acquire("user", "standard")
+        await scheduler.acquire("user", "standard")
+        with pytest.raises(LLMAdmissionError) as exc_info:
+            await scheduler.acquire("user", "standard")
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.reason == "user_concurrency"
+        await scheduler.acquire("other", "standard")
+
+        scheduler.release(first)
+        scheduler.release(await scheduler.acquire("user", "standard"))
+        with pytest.raises(LLMAdmissionError) as exc_info:
+            await scheduler.acquire("user", "standard")
+        assert exc_info.value.reason == "rate_limited"
+        assert exc_info.value.headers["Retry-After"] == "20"
+
+        now[0] += 20
+        await scheduler.acquire("user", "standard")
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_503_and_retry_after(self):
+        """Once the queue is full new calls fail fast instead of waiting."""
+        scheduler = make_scheduler(max_queue=1)
+        await scheduler.acquire("a", "standard")
+        waiting = asyncio.create_task(scheduler.acquire("b", "standard"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(LLMAdmissionError) as exc_info:
+            await scheduler.acquire("c", "interactive")
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.reason == "queue_full"
+        assert int(exc_info.value.headers["Retry-After"]) >= 1
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert scheduler.queue_depths()["standard"] == 0
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_never_queues_or_counts_rejections(self):
+        """Deferrable work gets a free slot or None, leaving metrics alone."""
+        from app.core.metrics import llm_scheduler_rejections_total
+
+        scheduler = make_scheduler(max_concurrency=2, reserved_slots=1)
+        before = llm_scheduler_rejections_total.value(
+            priority="background", reason="queue_timeout"
+        )
+        ticket = scheduler.try_acquire("user", "background")
+        assert ticket is not None
+        assert scheduler.try_acquire("user", "background") is None
+        assert scheduler.queue_depths()["background"] == 0
+
+        scheduler.release(ticket)
+        assert scheduler.try_acquire("user", "background") is not None
+        assert (
+            llm_scheduler_rejections_total.value(
+                priority="background", reason="queue_timeout"
+            )
+            == before
+        )
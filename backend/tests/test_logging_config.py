@@ -0,0 +1,48 @@
+"""
+Tests for the background logging sink.
+"""
+
+import threading
+
+from loguru import logger
+
+from app.core.logging_config import BackgroundSink
+from app.core.metrics import log_records_dropped_total
+
+
+class TestBackgroundSink:
+    """Test cases for BackgroundSink."""
+
+    def test_full_queue_drops_info_but_writes_errors_and_flushes_on_stop(self):
+        """Overflow drops low-level records, keeps errors; stop drains the queue."""
+        lines = []
+        writing, unblock = threading.Event(), threading.Event()
+
+        def slow_writer(line):
+            writing.set()
+            unblock.wait(5)
+            lines.append(line.strip())
+
+        sink = BackgroundSink([slow_writer], max_queue_size=1)
+        handler_id = logger.add(sink, format="{message}", level="INFO")
+        dropped = log_records_dropped_total.value()
+        try:
+            logger.info("first")
+            assert writing.wait(5)  # the worker is busy writing "first"
+            logger.info("queued")
+            logger.info("dropped")
+            assert log_records_dropped_total.value() == dropped + 1
+
+            # Errors fall back to a (blocking) write on the caller's thread
+            error = threading.Thread(target=lambda: logger.error("boom"))
+            error.start()
+            error.join(0.2)
+            assert error.is_alive()  # waiting for the busy writer, not dropped
+            unblock.set()
+            error.join(5)
+        finally:
+            logger.remove(handler_id)
+            sink.stop()
+
+        assert sorted(lines) == ["boom", "first", "queued"]
+        assert log_records_dropped_total.value() == dropped + 1
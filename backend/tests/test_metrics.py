@@ -0,0 +1,143 @@
+"""
+Tests for the Prometheus metrics registry and /metrics endpoint.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.usage import Usage
+
+from app.core.metrics import (
+    MetricsRegistry,
+    http_requests_total,
+    llm_fallback_total,
+    llm_prompt_cache_requests_total,
+    llm_tokens_total,
+)
+
+
+class TestMetricsRegistry:
+    """Test metric rendering."""
+
+    def test_counter_and_histogram_render(self):
+        """Counters render with _total and histogram buckets are cumulative."""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs", "Jobs run.", ("kind",))
+        histogram = registry.histogram(
+            "job_seconds", "Job duration.", ("kind",), buckets=(0.1, 1.0)
+        )
+
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        histogram.observe(0.05, kind="a")
+        histogram.observe(0.5, kind="a")
+        histogram.observe(5, kind="a")
+
+        text = registry.render()
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="a"} 3' in text
+        assert 'job_seconds_bucket{kind="a",le="0.1"} 1' in text
+        assert 'job_seconds_bucket{kind="a",le="1"} 2' in text
+        assert 'job_seconds_bucket{kind="a",le="+Inf"} 3' in text
+        assert 'job_seconds_count{kind="a"} 3' in text
+
+    def test_labels_must_match(self):
+        """Observations with unexpected labels are rejected."""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs", "Jobs run.", ("kind",))
+
+        with pytest.raises(ValueError):
+            counter.inc(other="x")
+
+
+class TestMetricsEndpoint:
+    """Test the /metrics endpoint."""
+
+    def test_metrics_use_route_templates(self, test_client):
+        """Requests are labelled by route template, not by raw path."""
+        test_client.get("/api/v1/posts/123e4567-e89b-12d3-a456-426614174000")
+
+        response = test_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'route="/api/v1/posts/{post_id}"' in response.text
+        assert "123e4567" not in response.text
+        assert (
+            http_requests_total.value(
+                method="GET", route="/api/v1/posts/{post_id}", status="401"
+            )
+            >= 1
+        )
+
+    def test_route_templates_are_memoized_per_method_and_path(self):
+        """The route table is matched once per distinct (method, path)."""
+        from app.core import metrics
+        from app.main import app
+
+        middleware = metrics.MetricsMiddleware(app, router_app=app)
+        scope = {"type": "http", "method": "GET", "path": "/api/v1/posts/1"}
+        with patch.object(
+            metrics, "_route_template", wraps=metrics._route_template
+        ) as route_template:
+            assert middleware._route(dict(scope)) == "/api/v1/posts/{post_id}"
+            assert middleware._route(dict(scope)) == "/api/v1/posts/{post_id}"
+            middleware._route({**scope, "method": "DELETE"})
+        assert route_template.call_count == 2
+
+
+class TestInstrumentedModel:
+    """Test LLM instrumentation on ModelConfig models."""
+
+    @pytest.mark.asyncio
+    async def test_records_tokens_and_fallback(self):
+        """Token usage and fallback-served responses are counted."""
+        from pydantic_ai.models.openai import OpenAIModel
+
+        from app.services.model_config import model_config
+
+        model = model_config.get_chat_model()
+        requested = model.model_name
+        response = ModelResponse(
+            parts=[TextPart(content="hi")],
+            usage=Usage(
+                requests=1,
+                request_tokens=12,
+                response_tokens=5,
+                details={"cached_tokens": 8},
+            ),
+            model_name="fallback/model",
+        )
+        prompt_before = llm_tokens_total.value(model=requested, direction="prompt")
+        cached_before = llm_tokens_total.value(
+            model=requested, direction="prompt_cached"
+        )
+        hits_before = llm_prompt_cache_requests_total.value(
+            model=requested, result="hit"
+        )
+        fallback_before = llm_fallback_total.value(
+            requested_model=requested, served_model="fallback/model"
+        )
+
+        with patch.object(OpenAIModel, "request", new=AsyncMock(return_value=response)):
+            await model.request([], None, None)
+
+        assert (
+            llm_tokens_total.value(model=requested, direction="prompt")
+            == prompt_before + 12
+        )
+        assert (
+            llm_tokens_total.value(model=requested, direction="prompt_cached")
+            == cached_before + 8
+        )
+        assert (
+            llm_prompt_cache_requests_total.value(model=requested, result="hit")
+            == hits_before + 1
+        )
+        assert (
+            llm_fallback_total.value(
+                requested_model=requested, served_model="fallback/model"
+            )
+            == fallback_before + 1
+        )
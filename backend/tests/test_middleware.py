@@ -0,0 +1,50 @@
+"""
+Tests for the request logging / security headers middleware.
+"""
+
+from unittest.mock import patch
+
+from loguru import logger
+from starlette.datastructures import Headers
+
+from app.core.config import settings
+from app.core.middleware import SECURITY_HEADERS, get_client_ip
+
+
+class TestRequestContextMiddleware:
+    """Test RequestContextMiddleware behaviour."""
+
+    def test_security_headers_added(self, test_client):
+        """Every response carries the security headers."""
+        response = test_client.get("/health")
+
+        assert response.status_code == 200
+        for name, value in SECURITY_HEADERS.items():
+            assert response.headers[name] == value
+
+    def test_client_ip_prefers_proxy_headers(self):
+        """X-Forwarded-For wins over X-Real-IP, which wins over the peer."""
+        scope = {"client": ("10.0.0.1", 1234)}
+
+        assert (
+            get_client_ip(scope, Headers({"x-forwarded-for": "1.2.3.4, 10.0.0.2"}))
+            == "1.2.3.4"
+        )
+        assert get_client_ip(scope, Headers({"x-real-ip": "5.6.7.8"})) == "5.6.7.8"
+        assert get_client_ip(scope, Headers({})) == "10.0.0.1"
+        assert get_client_ip({}, Headers({})) == "unknown"
+
+    def test_request_lines_sampled_but_errors_logged(self, test_client):
+        """Sampled-out requests skip request/response lines unless they fail."""
+        messages = []
+        handler_id = logger.add(lambda m: messages.append(m.record["message"]))
+        try:
+            with patch.object(settings, "log_request_sample_rate", 0.0):
+                test_client.get("/health")
+                test_client.get("/api/v1/posts/123e4567-e89b-12d3-a456-426614174000")
+        finally:
+            logger.remove(handler_id)
+
+        assert not any(m.startswith("Request:") for m in messages)
+        assert not any("Response: 200" in m for m in messages)
+        assert any("Response: 401" in m for m in messages)
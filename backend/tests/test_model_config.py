@@ -0,0 +1,157 @@
+"""
+Tests for the shared model configuration.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.services.model_config import ModelConfig
+
+
+class TestModelConfig:
+    """Test cases for ModelConfig."""
+
+    @pytest.mark.asyncio
+    async def test_models_share_one_http_client_across_pool_closes(self, monkeypatch):
+        """Every model uses the same client; aclose drops the pool, not the client."""
+        import httpx
+
+        config = ModelConfig()
+        pools = []
+
+        def open_transport():
+            pools.append(httpx.MockTransport(lambda request: httpx.Response(200)))
+            return pools[-1]
+
+        monkeypatch.setattr(config, "_open_transport", open_transport)
+        chat_model = config.get_chat_model()
+        large_model = config.get_large_model()
+
+        client = config.http_client
+        assert chat_model.client._client is client
+        assert large_model.client._client is client
+        assert client.timeout.connect == settings.openrouter_connect_timeout_seconds
+
+        await client.get("https://openrouter.test/")
+        await config.aclose()
+        assert not client.is_closed and len(pools) == 1
+
+        # Models built before the close reconnect through a new pool
+        await chat_model.client._client.get("https://openrouter.test/")
+        assert len(pools) == 2
+        assert config.get_chat_model().client._client is client
+        await config.aclose()
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_on_failures_or_slowness_and_probes_after_recovery(self):
+        """Consecutive failures open the circuit; one probe closes it again."""
+        from app.utils.model_health import CircuitBreaker
+
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=2,
+            recovery_seconds=10,
+            slow_threshold_seconds=5,
+            timer=lambda: now[0],
+        )
+
+        breaker.record_failure("m")
+        assert breaker.allow("m")
+        assert breaker.record_success("m", seconds=6) == "open"
+        assert not breaker.allow("m")
+
+        now[0] = 10
+        assert breaker.allow("m")
+        assert not breaker.allow("m")  # only one probe at a time
+        assert breaker.record_success("m", seconds=1) == "closed"
+        assert breaker.allow("m")
+
+
+class TestRoutedModel:
+    """Test cases for RoutedModel."""
+
+    @staticmethod
+    def _model(name, delay=0.0, fail=False):
+        from pydantic_ai.models.function import FunctionModel
+
+        async def stream_function(messages, agent_info):
+            await asyncio.sleep(delay)
+            if fail:
+                raise RuntimeError(f"{name} is down")
+            yield f"from {name}"
+
+        return FunctionModel(stream_function=stream_function, model_name=name)
+
+    @staticmethod
+    def _routed(*models, hedge_after_seconds=0):
+        from app.services.routed_model import RoutedModel
+        from app.utils.model_health import CircuitBreaker, LatencyTracker
+
+        return RoutedModel(
+            models,
+            latency=LatencyTracker(min_samples=1),
+            breaker=CircuitBreaker(failure_threshold=1, recovery_seconds=60),
+            hedge_after_seconds=hedge_after_seconds,
+        )
+
+    @staticmethod
+    async def _stream(model):
+        from pydantic_ai import Agent
+
+        agent = Agent(model, output_type=str)
+        async with agent.run_stream("Hi") as result:
+            return await result.get_output()
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_to_fallback(self):
+        """The fallback answers when the primary's first chunk is late."""
+        from app.core.metrics import llm_hedged_requests_total
+
+        routed = self._routed(
+            self._model("slow", delay=5), self._model("fast"), hedge_after_seconds=0.05
+        )
+        before = llm_hedged_requests_total.value(model="slow", served_by="fast")
+
+        started = asyncio.get_running_loop().time()
+        assert await self._stream(routed) == "from fast"
+
+        assert asyncio.get_running_loop().time() - started < 1
+        assert (
+            llm_hedged_requests_total.value(model="slow", served_by="fast")
+            == before + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_hedged_loser_is_sampled_and_opens_when_slow(self):
+        """The cancelled primary records its wait and fails past the threshold."""
+        from app.services.routed_model import RoutedModel
+        from app.utils.model_health import CircuitBreaker, LatencyTracker
+
+        routed = RoutedModel(
+            [self._model("slow", delay=5), self._model("fast", delay=0.1)],
+            latency=LatencyTracker(min_samples=1),
+            breaker=CircuitBreaker(
+                failure_threshold=1, recovery_seconds=60, slow_threshold_seconds=0.15
+            ),
+            hedge_after_seconds=0.1,
+        )
+
+        assert await self._stream(routed) == "from fast"
+        assert routed.latency.p95("slow") > 0.15
+        assert routed.breaker.state("fast") == "closed"
+        assert routed.breaker.state("slow") == "open"
+        assert [model.model_name for model in routed._route()] == ["fast"]
+
+    @pytest.mark.asyncio
+    async def test_failing_primary_fails_over_and_is_skipped_while_open(self):
+        """Errors fail over to the next model and open the primary's circuit."""
+        routed = self._routed(self._model("down", fail=True), self._model("up"))
+
+        assert await self._stream(routed) == "from up"
+        assert routed.breaker.state("down") == "open"
+        assert [model.model_name for model in routed._route()] == ["up"]
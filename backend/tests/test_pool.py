@@ -0,0 +1,82 @@
+"""
+Tests for database connection pool configuration, stats and warm-up.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import database
+from app.core.config import settings
+from app.core.pool import InstrumentedAsyncQueuePool, get_pool_kwargs, get_pool_stats
+
+
+class TestPool:
+    """Test cases for the instrumented pool and warm-up."""
+
+    def test_pool_kwargs_follow_settings(self, monkeypatch):
+        """Server-backed engines get the instrumented pool sized from settings."""
+        monkeypatch.setattr(settings, "db_pool_size", 7)
+        monkeypatch.setattr(settings, "db_pool_use_lifo", True)
+
+        kwargs = get_pool_kwargs()
+        assert kwargs["poolclass"] is InstrumentedAsyncQueuePool
+        assert kwargs["pool_size"] == 7
+        assert kwargs["pool_use_lifo"] is True
+        assert kwargs["pool_pre_ping"] is True
+
+    @pytest.mark.asyncio
+    async def test_stats_report_usage_and_checkout_waits(self, monkeypatch):
+        """Stats cover pool usage and checkout waits, and survive recreate()."""
+        engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=2,
+            max_overflow=0,
+        )
+        monkeypatch.setattr(database, "_async_engine", None)
+        assert database.get_db_pool_stats() == {}
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            stats = get_pool_stats(engine.pool)
+            assert stats["pool_class"] == "InstrumentedAsyncQueuePool"
+            assert stats["size"] == 2 and stats["checked_out"] == 1
+
+        stats = get_pool_stats(engine.pool)
+        assert stats["checked_out"] == 0 and stats["checkouts"] == 1
+        assert stats["wait_seconds_max"] >= stats["wait_seconds_avg"] >= 0
+        assert engine.pool.recreate().wait_stats is engine.pool.wait_stats
+
+        database._async_engine = engine
+        assert database.get_db_pool_stats()["checkouts"] == 1
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_is_capped_at_pool_size_and_tolerates_failures(
+        self, monkeypatch
+    ):
+        """Warm-up opens at most pool_size connections and closes every one."""
+        attempts = []
+        closed = []
+
+        class FakeConnection:
+            async def exec_driver_sql(self, statement):
+                if len(attempts) == 2:
+                    raise ConnectionError("refused")
+
+            async def close(self):
+                closed.append(self)
+
+        async def connect():
+            attempts.append(1)
+            return FakeConnection()
+
+        engine = SimpleNamespace(pool=SimpleNamespace(size=lambda: 3), connect=connect)
+        monkeypatch.setattr(database, "get_async_engine", lambda: engine)
+
+        assert await database.warm_up_pool(10) == 2
+        assert len(attempts) == 3 and len(closed) == 3
+        assert await database.warm_up_pool(0) == 0
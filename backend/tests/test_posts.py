@@ -12,6 +12,7 @@ from app.services.posts import PostsService
 from app.models.posts import Post
 
 from app.schemas.posts import PostFeedback, PostCreate
+from app.utils.pagination import InvalidCursorError
 
 
 class TestPosts:
@@ -474,3 +475,352 @@ class TestPosts:
 
         # Verify database was called
         assert mock_db.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_credentials_bootstrap_runs_off_event_loop(self, monkeypatch):
+        """Credential bootstrap runs in a worker thread and services see the result."""
+        import threading
+
+        from app.core.config import settings
+
+        loop_thread = threading.get_ident()
+        bootstrap_threads = []
+        bucket = MagicMock()
+
+        def fake_initialize(cls):
+            bootstrap_threads.append(threading.get_ident())
+            cls._shared_bucket = bucket
+            cls._credentials_initialized = True
+
+        monkeypatch.setattr(settings, "environment", "staging")
+        monkeypatch.setattr(
+            PostsService,
+            "_ensure_credentials_initialized",
+            classmethod(fake_initialize),
+        )
+        for attr, value in [
+            ("_shared_bucket", None),
+            ("_credentials_initialized", False),
+            ("_credentials_status", "pending"),
+            ("_credentials_task", None),
+        ]:
+            monkeypatch.setattr(PostsService, attr, value)
+
+        # Constructing the service no longer initializes credentials inline
+        service = PostsService(AsyncMock())
+        assert bootstrap_threads == []
+        assert service.bucket is None
+
+        task = PostsService.start_credentials_bootstrap()
+        assert PostsService.start_credentials_bootstrap() is task
+        await service._wait_for_storage()
+
+        assert bootstrap_threads and bootstrap_threads[0] != loop_thread
+        assert PostsService.credentials_status() == "ready"
+        assert service.bucket is bucket
+
+    def test_signed_urls_cached_across_service_instances(self, monkeypatch):
+        """A signed URL is reused by later requests and refreshed ahead of expiry."""
+        from app.core.signed_url_cache import SignedUrlCache
+
+        now = [0.0]
+        cache = SignedUrlCache(
+            maxsize=10, refresh_ahead_seconds=600, timer=lambda: now[0]
+        )
+        monkeypatch.setattr("app.services.posts.signed_url_cache", cache)
+        monkeypatch.setattr(PostsService, "_shared_bucket", MagicMock())
+
+        signed = []
+
+        def fake_sign(self, storage_path, expiration_hours):
+            signed.append(storage_path)
+            return f"https://signed/{storage_path}?v={len(signed)}"
+
+        monkeypatch.setattr(PostsService, "_sign_url", fake_sign)
+
+        first = PostsService(AsyncMock())._generate_signed_url("u/p/a.png")
+        second = PostsService(AsyncMock())._generate_signed_url("u/p/a.png")
+        assert first == second
+        assert signed == ["u/p/a.png"]
+
+        # Inside the refresh-ahead window the cached URL is served while a
+        # fresh one is signed in the background
+        now[0] = 3600 - 300 - 60
+        assert PostsService(AsyncMock())._generate_signed_url("u/p/a.png") == first
+        cache._executor.shutdown(wait=True)
+        assert len(signed) == 2
+        assert (
+            PostsService(AsyncMock())._generate_signed_url("u/p/a.png").endswith("v=2")
+        )
+
+    @pytest.mark.asyncio
+    async def test_posts_list_embeds_batch_signed_media(self, monkeypatch):
+        """Listing with signed media signs each path once without touching the ORM rows."""
+        from datetime import datetime, timezone
+
+        from app.models.posts import PostMedia
+
+        now = datetime.now(timezone.utc)
+        user_id = uuid4()
+
+        def make_post(paths):
+            post_id = uuid4()
+            media = [
+                PostMedia(
+                    id=uuid4(),
+                    post_id=post_id,
+                    user_id=user_id,
+                    media_type="image",
+                    file_name=path,
+                    storage_path=path,
+                    gcs_url=f"https://public/{path}",
+                    created_at=now,
+                    updated_at=now,
+                )
+                for path in paths
+            ]
+            return Post(
+                id=post_id,
+                user_id=user_id,
+                content="content",
+                platform="linkedin",
+                topics=[],
+                status="scheduled",
+                media=media,
+                created_at=now,
+                updated_at=now,
+            )
+
+        posts = [make_post(["a.png", "b.png"]), make_post(["a.png", "broken.png"])]
+
+        mock_db = AsyncMock()
+        count_result = MagicMock()
+        count_result.scalar.return_value = len(posts)
+        posts_result = MagicMock()
+        posts_result.scalars.return_value.all.return_value = posts
+        mock_db.execute = AsyncMock(side_effect=[count_result, posts_result])
+
+        signed = []
+
+        def fake_generate(self, storage_path, expiration_hours=1):
+            signed.append(storage_path)
+            return None if storage_path == "broken.png" else f"signed:{storage_path}"
+
+        monkeypatch.setattr(PostsService, "_generate_signed_url", fake_generate)
+
+        result = await PostsService(mock_db).get_posts_list(
+            user_id=user_id, include_signed_media=True
+        )
+
+        assert sorted(signed) == ["a.png", "b.png", "broken.png"]
+        assert [[m.gcs_url for m in item.media] for item in result["items"]] == [
+            ["signed:a.png", "signed:b.png"],
+            ["signed:a.png"],
+        ]
+        # Signed URLs are never written back to the mapped rows
+        assert posts[0].media[0].gcs_url == "https://public/a.png"
+        assert mock_db.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_upload_media_streams_off_loop_in_one_transaction(self, monkeypatch):
+        """Uploads stream off the loop, commit once and are removed on failure."""
+        import io
+        import threading
+
+        from fastapi import UploadFile
+        from starlette.datastructures import Headers
+
+        loop_thread = threading.get_ident()
+        upload_threads = []
+        blobs = []
+        bucket = MagicMock()
+
+        def make_blob(name, chunk_size=None):
+            blob = MagicMock()
+            blobs.append(blob)
+            blob.name = name
+            blob.public_url = f"https://storage/{name}"
+
+            def upload_from_file(file_obj, content_type=None, rewind=False):
+                upload_threads.append(threading.get_ident())
+                assert chunk_size and rewind
+
+            blob.upload_from_file.side_effect = upload_from_file
+            return blob
+
+        bucket.blob.side_effect = make_blob
+        monkeypatch.setattr(PostsService, "_shared_bucket", bucket)
+
+        mock_db = AsyncMock()
+        mock_db.add_all = MagicMock()
+        mock_db.execute = AsyncMock(return_value=MagicMock())
+        service = PostsService(mock_db)
+        user_id, post_id = uuid4(), uuid4()
+        monkeypatch.setattr(service, "get_post", AsyncMock(return_value=MagicMock()))
+
+        def make_files():
+            return [
+                UploadFile(
+                    io.BytesIO(b"data"),
+                    filename=name,
+                    headers=Headers({"content-type": content_type}),
+                )
+                for name, content_type in [
+                    ("a.png", "image/png"),
+                    ("b.mp4", "video/mp4"),
+                ]
+            ]
+
+        media = await service.upload_media_for_post(user_id, post_id, make_files())
+
+        assert [m.media_type for m in media] == ["image", "video"]
+        assert [m.storage_path for m in media] == [
+            f"{user_id}/{post_id}/a.png",
+            f"{user_id}/{post_id}/b.mp4",
+        ]
+        assert len(upload_threads) == 2 and loop_thread not in upload_threads
+        mock_db.add_all.assert_called_once()
+        mock_db.commit.assert_awaited_once()
+        assert not any(blob.delete.called for blob in blobs)
+
+        # A failed insert leaves no orphaned objects behind
+        blobs.clear()
+        mock_db.commit.side_effect = RuntimeError("db down")
+        with pytest.raises(RuntimeError):
+            await service.upload_media_for_post(user_id, post_id, make_files())
+        mock_db.rollback.assert_awaited_once()
+        assert len(blobs) == 2
+        assert all(blob.delete.call_count == 1 for blob in blobs)
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_walks_all_posts_once(self, db_session):
+        """Keyset pages cover every post once; NULLs sort below every value."""
+        from datetime import datetime, timedelta, timezone
+
+        user_id = uuid4()
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        # Two posts share a timestamp and two are unscheduled
+        offsets = [0, 1, 1, 2, None, 3, None]
+        for i, offset in enumerate(offsets):
+            db_session.add(
+                Post(
+                    user_id=user_id,
+                    content=f"post {i}",
+                    status="suggested",
+                    scheduled_at=(
+                        None if offset is None else base + timedelta(hours=offset)
+                    ),
+                )
+            )
+        await db_session.commit()
+
+        service = PostsService(db_session)
+
+        async def walk(direction, size):
+            seen, cursors, cursor = [], [], None
+            while True:
+                result = await service.get_posts_list(
+                    user_id=user_id,
+                    size=size,
+                    order_by="scheduled_at",
+                    order_direction=direction,
+                    paginate_by_cursor=True,
+                    cursor=cursor,
+                    include_total=True,
+                )
+                seen.extend(result["items"])
+                assert result["total"] == len(offsets)
+                cursor = result["next_cursor"]
+                if cursor is None:
+                    return seen, cursors
+                cursors.append(cursor)
+
+        seen, cursors = await walk("desc", 3)
+        # Ascending pages start with the NULLs, including cursors on them
+        ascending, _ = await walk("asc", 1)
+
+        # Cursors are only valid for the order they were issued for
+        for bad_cursor in (cursors[0], "bogus"):
+            with pytest.raises(InvalidCursorError):
+                await service.get_posts_list(
+                    user_id=user_id,
+                    order_by="created_at",
+                    paginate_by_cursor=True,
+                    cursor=bad_cursor,
+                )
+
+        assert len(cursors) == 2
+        assert len({post.id for post in seen}) == len(offsets)
+        scheduled = [post.scheduled_at for post in seen]
+        assert scheduled[-2:] == [None, None]
+        assert scheduled[:-2] == sorted(scheduled[:-2], reverse=True)
+        assert [post.id for post in ascending] == [post.id for post in reversed(seen)]
+
+    @pytest.mark.asyncio
+    async def test_post_counts_single_query_cached_until_write(
+        self, db_session, count_statements
+    ):
+        """Counts come from one grouped query and are cached until a post changes."""
+        user_id = uuid4()
+        for status_name in ["suggested", "draft", "scheduled", "posted", "posted"]:
+            db_session.add(Post(user_id=user_id, content="c", status=status_name))
+        db_session.add(Post(user_id=uuid4(), content="c", status="posted"))
+        await db_session.commit()
+
+        service = PostsService(db_session)
+        expected = {"drafts": 2, "scheduled": 1, "posted": 2}
+        with count_statements(db_session) as statements:
+            assert await service.get_post_counts(user_id) == expected
+            assert await service.get_post_counts(user_id) == expected
+        assert len(statements) == 1
+
+        await service.create_post(user_id, PostCreate(content="new", status="draft"))
+        with count_statements(db_session) as statements:
+            counts = await service.get_post_counts(user_id)
+        assert counts["drafts"] == 3
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_update_is_set_based_and_owner_scoped(
+        self, db_session, db_session_factory, count_statements
+    ):
+        """Batch updates run one UPDATE per field set and never touch other users' posts."""
+        from datetime import datetime, timezone
+
+        from app.schemas.posts import PostBatchUpdate
+
+        user_id, other_user_id = uuid4(), uuid4()
+        own = [Post(user_id=user_id, content=f"p{i}") for i in range(3)]
+        foreign = Post(user_id=other_user_id, content="theirs")
+        db_session.add_all([*own, foreign])
+        await db_session.commit()
+
+        when = datetime(2025, 1, 1, 9, tzinfo=timezone.utc)
+        batch = PostBatchUpdate.model_validate(
+            {
+                "posts": [
+                    {"id": str(own[0].id), "scheduled_at": when.isoformat()},
+                    {"id": str(own[1].id), "scheduled_at": when.isoformat()},
+                    {
+                        "id": str(own[2].id),
+                        "status": "scheduled",
+                        "scheduled_at": when.isoformat(),
+                    },
+                    {"id": str(foreign.id), "content": "hijacked"},
+                ]
+            }
+        )
+
+        with count_statements(db_session) as statements:
+            result = await PostsService(db_session).batch_update_posts(user_id, batch)
+
+        # One UPDATE per distinct field set + one SELECT for the response
+        assert len(statements) == 4
+        assert {post.id for post in result["items"]} == {p.id for p in own}
+        by_id = {post.id: post for post in result["items"]}
+        assert by_id[own[2].id].status == "scheduled"
+        assert all(post.scheduled_at is not None for post in result["items"])
+
+        async with db_session_factory() as session:
+            untouched = await session.get(Post, foreign.id)
+            assert untouched.content == "theirs"
@@ -179,6 +179,43 @@ class TestProfileService:
         retrieved = await profile_service.get_writing_style_analysis(test_user.id)
         assert retrieved.id == analysis.id
 
+    @pytest.mark.asyncio
+    async def test_user_context_cached_until_profile_changes(
+        self, profile_service, test_db, test_user, count_statements
+    ):
+        """Writing context is one query, then cached until a profile upsert."""
+        from app.services.user_context import UserContextService
+
+        context_service = UserContextService(test_db)
+        assert (
+            await context_service.get_user_context(test_user.id)
+        ).profile_data() == {
+            "bio": "Not provided",
+            "writing_style": "Not provided",
+            "linkedin_post_strategy": "Not provided",
+        }
+
+        await profile_service.upsert_user_preferences(
+            test_user.id,
+            UserPreferencesUpdate(bio="bio", image_generation_style="watercolor"),
+        )
+        await profile_service.upsert_writing_style_analysis(test_user.id, "terse")
+
+        with count_statements(test_db) as statements:
+            context = await context_service.get_user_context(test_user.id)
+            assert await context_service.get_user_context(test_user.id) is context
+        assert len(statements) == 1
+
+        assert context.bio == "bio"
+        assert context.writing_style == "terse"
+        assert context.image_generation_style == "watercolor"
+        # upsert_user_preferences creates the default LinkedIn strategy
+        assert context.linkedin_post_strategy.startswith("CORE MESSAGE")
+
+        await profile_service.upsert_content_strategy(test_user.id, "linkedin", "new")
+        context = await context_service.get_user_context(test_user.id)
+        assert context.linkedin_post_strategy == "new"
+
 
 class TestProfileEndpoints:
     """Test cases for profile API endpoints."""
@@ -0,0 +1,82 @@
+"""
+Tests for applying the RLS user context to pooled connections.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.core.database import (
+    _apply_rls_user_context,
+    _clear_rls_user_context,
+    _forget_rls_user_context,
+    _init_rls_user_context,
+)
+from app.core.rls import RLS_SESSION_OPTION, RLS_USER_ID_KEY
+
+
+def _connection(dialect="postgresql", options=None):
+    """A pooled connection stand-in, freshly opened by the pool."""
+    connection = MagicMock()
+    connection.dialect.name = dialect
+    connection.info = {}
+    connection.get_execution_options.return_value = options or {}
+    _init_rls_user_context(None, SimpleNamespace(info=connection.info))
+    return connection
+
+
+def _applied_users(connection):
+    return [call.args[1]["user_id"] for call in connection.execute.call_args_list]
+
+
+class TestRLSUserContext:
+    """Test cases for the RLS session and connection listeners."""
+
+    def test_context_applied_on_begin_and_skipped_when_unchanged(self):
+        """set_config runs only when the connection serves a different user."""
+        connection = _connection(options={RLS_SESSION_OPTION: True})
+        session = SimpleNamespace(info={RLS_USER_ID_KEY: "user-a"})
+
+        _apply_rls_user_context(session, None, connection)
+        _apply_rls_user_context(session, None, connection)
+        assert _applied_users(connection) == ["user-a"]
+
+        # A session without a user clears the stale context
+        _apply_rls_user_context(SimpleNamespace(info={}), None, connection)
+        _apply_rls_user_context(SimpleNamespace(info={}), None, connection)
+        assert _applied_users(connection) == ["user-a", ""]
+
+    def test_context_reapplied_after_rollback(self):
+        """A rollback may undo set_config, so the next begin sets it again."""
+        connection = _connection(options={RLS_SESSION_OPTION: True})
+        session = SimpleNamespace(info={RLS_USER_ID_KEY: "user-a"})
+
+        _apply_rls_user_context(session, None, connection)
+        _forget_rls_user_context(connection)
+        assert RLS_USER_ID_KEY not in connection.info
+        _apply_rls_user_context(session, None, connection)
+        assert _applied_users(connection) == ["user-a", "user-a"]
+
+    def test_checkout_outside_rls_session_clears_previous_user(self):
+        """Raw engine connections never run as the connection's last user."""
+        connection = _connection()
+        _clear_rls_user_context(connection)
+        assert _applied_users(connection) == []  # fresh connections are clean
+
+        connection.info[RLS_USER_ID_KEY] = "user-a"
+        _clear_rls_user_context(connection)
+        assert _applied_users(connection) == [""]
+        connection.commit.assert_called_once()
+
+        # RLSSession checkouts keep the context for after_begin to reuse
+        session_connection = _connection(options={RLS_SESSION_OPTION: True})
+        session_connection.info[RLS_USER_ID_KEY] = "user-a"
+        _clear_rls_user_context(session_connection)
+        assert _applied_users(session_connection) == []
+
+    def test_non_postgres_dialects_are_ignored(self):
+        """SQLite has no set_config, so nothing is executed."""
+        connection = _connection(dialect="sqlite")
+        _apply_rls_user_context(
+            SimpleNamespace(info={RLS_USER_ID_KEY: "user-a"}), None, connection
+        )
+        assert _applied_users(connection) == []
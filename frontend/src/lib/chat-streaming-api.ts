@@ -11,6 +11,8 @@ export interface ChatMessage {
 export interface StreamChatRequest {
   conversation_id: string;
   messages: ChatMessage[];
+  /** Generate a fresh post instead of reusing a cached one */
+  regenerate?: boolean;
 }
 
 export interface StreamChatChunk {
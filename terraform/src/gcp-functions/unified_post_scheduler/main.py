@@ -37,6 +37,16 @@ logger = logging.getLogger(__name__)
 MAX_RETRY_ATTEMPTS = int(os.getenv("MAX_RETRY_ATTEMPTS", "1"))
 INITIAL_RETRY_DELAY = 1  # seconds
 
+# Due, unpublished posts; served by the partial index idx_posts_due_for_publish.
+# The status is a literal so generic plans can still match the index predicate.
+POSTS_TO_PUBLISH_QUERY = """
+    SELECT * FROM posts
+    WHERE status = 'scheduled'
+    AND posted_at IS NULL
+    AND scheduled_at <= :now
+    ORDER BY scheduled_at ASC
+"""
+
 
 async def retry_with_exponential_backoff(func, *args, **kwargs):
     """Retry function with exponential backoff."""
@@ -254,17 +264,9 @@ async def get_posts_to_publish(client: CloudSQLClient) -> List[Dict[str, Any]]:
         logger.info(f"Querying for posts scheduled before {now}")
 
         # Query for scheduled posts in the time window
-        query = """
-            SELECT * FROM posts 
-            WHERE status = :status 
-            AND posted_at IS NULL 
-            AND scheduled_at <= :now 
-            ORDER BY scheduled_at ASC
-        """
-
         posts = await client.execute_query_async(
-            query,
-            {"status": "scheduled", "now": now},
+            POSTS_TO_PUBLISH_QUERY,
+            {"now": now},
         )
 
         logger.info(f"Found {len(posts)} posts ready for publishing")